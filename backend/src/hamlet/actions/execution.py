@@ -1,6 +1,5 @@
 """Action execution logic."""
 
-import asyncio
 import json
 import logging
 import time
@@ -23,8 +22,13 @@ def format_object_name(obj_id: str) -> str:
 RECEPTIVENESS_THRESHOLD = 0.3
 
 
-def execute_action(action: Action, world: World) -> ActionResult:
-    """Execute an action and return the result."""
+def execute_action(action: Action, world: World, commit: bool = True) -> ActionResult:
+    """Execute an action and return the result.
+
+    Pass ``commit=False`` when the caller commits once for a batch of actions,
+    as the simulation tick does. The caller must commit before handing the
+    session to anything that may roll it back.
+    """
     # Validate action
     validation = validate_action(action, world)
     if not validation.valid:
@@ -88,7 +92,8 @@ def execute_action(action: Action, world: World) -> ActionResult:
         process_witnesses(action, result, actor, world)
 
     # Commit changes
-    world.commit()
+    if commit:
+        world.commit()
 
     return result
 
@@ -665,7 +670,6 @@ def _publish_reaction(
         actors=[witness.id],
         location_id=location_id,
         significance=1,
-        data={},
     )
 
     # Get the world state for tick info if available
@@ -676,17 +680,7 @@ def _publish_reaction(
         pass
 
     # Publish directly to the event bus (synchronous path)
-    # The event bus's publish method uses put_nowait which is sync
-    event_bus = world.event_bus
-    event_bus._history.append(event)
-    if len(event_bus._history) > event_bus._max_history:
-        event_bus._history = event_bus._history[-event_bus._max_history:]
-
-    for queue in event_bus._subscribers:
-        try:
-            queue.put_nowait(event)
-        except asyncio.QueueFull:
-            pass
+    world.event_bus.publish_nowait(event)
 
 
 def update_relationship(
@@ -24,11 +24,11 @@ def event_to_dict(event: SimulationEvent) -> dict:
         "type": event.type.value,
         "summary": event.summary,
         "timestamp": event.timestamp,
-        "actors": event.actors,
+        "actors": event.actors or [],
         "location_id": event.location_id,
         "detail": event.detail,
         "significance": event.significance,
-        "data": event.data,
+        "data": event.data or {},
     }
 
 
@@ -67,7 +67,7 @@ async def event_generator(
                 if location_id and event.location_id != location_id:
                     continue
 
-                if agent_id and agent_id not in event.actors:
+                if agent_id and agent_id not in (event.actors or ()):
                     continue
 
                 # Yield the event (using 'message' event type for browser EventSource.onmessage compatibility)
@@ -19,11 +19,14 @@ class Settings(BaseSettings):
     # LLM
     anthropic_api_key: str = ""
     llm_model: str = "claude-3-haiku-20240307"
+    llm_max_concurrency: int = 8  # Agent decisions in flight at once
 
     # Simulation
     tick_interval_seconds: float = 30.0
     day_start_hour: int = 6
     day_end_hour: int = 22
+    # Agents whose needs and location are unchanged decide once per this many ticks
+    agent_decision_interval: int = 5
 
     # CORS - comma-separated list of allowed origins
     cors_origins: str = ""
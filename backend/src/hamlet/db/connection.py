@@ -24,11 +24,14 @@ engine = create_engine(
 )
 
 
-# Enable foreign keys for SQLite
+# Enable foreign keys for SQLite, and use write-ahead logging so each commit
+# appends to the log instead of fsyncing the rollback journal
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.close()
 
 
@@ -43,6 +43,23 @@ def json_deserializer(data):
     return json.loads(data)
 
 
+def _cached_json(obj, column: str, container: type[dict] | type[list]):
+    """Deserialize a JSON column, reusing the last parse while its raw value is unchanged.
+
+    Returns a shallow copy of type ``container`` (empty when the column is
+    null), so callers may mutate the result as they would a fresh parse.
+    """
+    raw = getattr(obj, column)
+    if not isinstance(raw, str):
+        return json_deserializer(raw) or container()
+    cache_attr = f"_{column}_parsed"
+    cached = getattr(obj, cache_attr, None)
+    if cached is None or cached[0] != raw:
+        cached = (raw, json_deserializer(raw) or container())
+        setattr(obj, cache_attr, cached)
+    return container(cached[1])
+
+
 class Location(Base):
     """A location in the village."""
 
@@ -122,7 +139,7 @@ class Agent(Base):
 
     @property
     def traits_dict(self) -> dict:
-        return json_deserializer(self.traits) or {}
+        return _cached_json(self, "traits", dict)
 
     @traits_dict.setter
     def traits_dict(self, value: dict):
@@ -138,7 +155,7 @@ class Agent(Base):
 
     @property
     def mood_dict(self) -> dict:
-        return json_deserializer(self.mood) or {}
+        return _cached_json(self, "mood", dict)
 
     @mood_dict.setter
     def mood_dict(self, value: dict):
@@ -259,7 +276,7 @@ class Poll(Base):
 
     @property
     def options_list(self) -> list[str]:
-        return json_deserializer(self.options) or []
+        return _cached_json(self, "options", list)
 
     @options_list.setter
     def options_list(self, value: list[str]):
@@ -267,7 +284,7 @@ class Poll(Base):
 
     @property
     def votes_dict(self) -> dict[str, int]:
-        return json_deserializer(self.votes) or {}
+        return _cached_json(self, "votes", dict)
 
     @votes_dict.setter
     def votes_dict(self, value: dict[str, int]):
@@ -3,6 +3,7 @@
 import time
 from typing import Optional
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from hamlet.db.models import Agent, Faction, FactionMembership, FactionRelationship
@@ -226,6 +227,32 @@ class FactionManager:
             query = query.filter(FactionMembership.left_at.is_(None))
         return query.all()
 
+    def get_agents_open_to_factions(self) -> list[Agent]:
+        """Get agents below the membership limit, who may form or join a faction."""
+        full = (
+            select(FactionMembership.agent_id)
+            .where(FactionMembership.left_at.is_(None))
+            .group_by(FactionMembership.agent_id)
+            .having(func.count() >= MAX_MEMBERSHIPS)
+        )
+        return self.db.query(Agent).filter(Agent.id.not_in(full)).all()
+
+    def get_active_memberships_by_agent(
+        self, agent_ids: list[str] | None = None
+    ) -> dict[str, list[FactionMembership]]:
+        """Get active memberships in one query, grouped by agent id.
+
+        Covers every agent unless ``agent_ids`` is given.
+        """
+        query = self.db.query(FactionMembership).filter(FactionMembership.left_at.is_(None))
+        if agent_ids is not None:
+            query = query.filter(FactionMembership.agent_id.in_(agent_ids))
+
+        memberships: dict[str, list[FactionMembership]] = {}
+        for membership in query.all():
+            memberships.setdefault(membership.agent_id, []).append(membership)
+        return memberships
+
     def set_faction_relationship(
         self,
         faction_1_id: int,
@@ -303,10 +330,15 @@ class FactionManager:
     def should_form_faction(
         self,
         agent: Agent,
+        current: list[FactionMembership] | None = None,
     ) -> bool:
-        """Determine if an agent should try to form a new faction."""
+        """Determine if an agent should try to form a new faction.
+
+        ``current`` is the agent's active memberships; it is queried when not supplied.
+        """
         # Check if agent is already in too many factions
-        current = self.get_agent_factions(agent.id)
+        if current is None:
+            current = self.get_agent_factions(agent.id)
         if len(current) >= MAX_MEMBERSHIPS:
             return False
 
@@ -324,10 +356,15 @@ class FactionManager:
         self,
         agent: Agent,
         faction: Faction,
+        current: list[FactionMembership] | None = None,
     ) -> bool:
-        """Determine if an agent should join a faction."""
+        """Determine if an agent should join a faction.
+
+        ``current`` is the agent's active memberships; it is queried when not supplied.
+        """
         # Check if agent can join more factions
-        current = self.get_agent_factions(agent.id)
+        if current is None:
+            current = self.get_agent_factions(agent.id)
         if len(current) >= MAX_MEMBERSHIPS:
             return False
 
@@ -387,18 +424,36 @@ class FactionManager:
 
     def get_faction_context_for_agent(self, agent_id: str) -> str:
         """Get faction context string for LLM prompts."""
-        memberships = self.get_agent_factions(agent_id)
-        if not memberships:
-            return "You are not a member of any faction or alliance."
-
-        context_parts = []
-        for membership in memberships:
-            faction = self.db.query(Faction).filter(Faction.id == membership.faction_id).first()
-            if faction:
-                role = FactionRole(membership.role)
-                context_parts.append(
-                    f"- {faction.name} ({role.value}): {faction.description or 'A local faction'}. "
-                    f"Loyalty: {membership.loyalty}%. Goals: {', '.join(faction.goals_list[:3]) or 'none specified'}."
-                )
+        return self.get_faction_contexts([agent_id])[agent_id]
+
+    def get_faction_contexts(self, agent_ids: list[str]) -> dict[str, str]:
+        """Get faction context strings for several agents, keyed by agent id.
+
+        Memberships and their factions are loaded in two queries for the batch.
+        """
+        memberships = self.get_active_memberships_by_agent(agent_ids)
+        faction_ids = {m.faction_id for ms in memberships.values() for m in ms}
+        factions = (
+            {f.id: f for f in self.db.query(Faction).filter(Faction.id.in_(faction_ids)).all()}
+            if faction_ids
+            else {}
+        )
 
-        return "Your faction memberships:\n" + "\n".join(context_parts)
+        contexts = {}
+        for agent_id in agent_ids:
+            if agent_id not in memberships:
+                contexts[agent_id] = "You are not a member of any faction or alliance."
+                continue
+
+            context_parts = []
+            for membership in memberships[agent_id]:
+                faction = factions.get(membership.faction_id)
+                if faction:
+                    role = FactionRole(membership.role)
+                    context_parts.append(
+                        f"- {faction.name} ({role.value}): {faction.description or 'A local faction'}. "
+                        f"Loyalty: {membership.loyalty}%. Goals: {', '.join(faction.goals_list[:3]) or 'none specified'}."
+                    )
+            contexts[agent_id] = "Your faction memberships:\n" + "\n".join(context_parts)
+
+        return contexts
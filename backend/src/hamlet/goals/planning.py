@@ -4,6 +4,7 @@ import random
 import time
 from typing import Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from hamlet.db.models import Agent, Goal, GoalPlan
@@ -241,32 +242,45 @@ class GoalPlanner:
 
     def get_plan_context(self, agent_id: str) -> str:
         """Get plan context string for LLM prompts."""
-        plan = (
+        return self.get_plan_contexts([agent_id])[agent_id]
+
+    def get_plan_contexts(self, agent_ids: list[str]) -> dict[str, str]:
+        """Get plan context strings for several agents, keyed by agent id.
+
+        Open plans for all the agents are loaded in one query.
+        """
+        plans: dict[str, GoalPlan] = {}
+        for plan in (
             self.db.query(GoalPlan)
             .filter(
-                GoalPlan.agent_id == agent_id,
+                GoalPlan.agent_id.in_(agent_ids),
                 GoalPlan.status.in_([PlanStatus.ACTIVE.value, PlanStatus.PLANNING.value]),
             )
-            .first()
-        )
+            .all()
+        ):
+            plans.setdefault(plan.agent_id, plan)
 
-        if not plan:
-            return ""
+        contexts = {}
+        for agent_id in agent_ids:
+            plan = plans.get(agent_id)
+            if not plan:
+                contexts[agent_id] = ""
+                continue
 
-        milestones = plan.milestones_list
-        current_milestone = None
-        for m in milestones:
-            if m.get("status") == "pending":
-                current_milestone = m
-                break
+            current_milestone = None
+            for m in plan.milestones_list:
+                if m.get("status") == "pending":
+                    current_milestone = m
+                    break
 
-        context = f"Your long-term ambition: {plan.description}\n"
-        context += f"Progress: {plan.progress:.0f}%\n"
+            context = f"Your long-term ambition: {plan.description}\n"
+            context += f"Progress: {plan.progress:.0f}%\n"
 
-        if current_milestone:
-            context += f"Current focus: {current_milestone['description']}"
+            if current_milestone:
+                context += f"Current focus: {current_milestone['description']}"
+            contexts[agent_id] = context
 
-        return context
+        return contexts
 
     def get_all_active_plans(self) -> list[GoalPlan]:
         """Get all active goal plans."""
@@ -276,6 +290,20 @@ class GoalPlanner:
             .all()
         )
 
+    def get_agents_without_plans(self) -> list[Agent]:
+        """Get agents with no planning or active plan, who may develop an ambition."""
+        open_plans = select(GoalPlan.agent_id).where(
+            GoalPlan.status.in_([PlanStatus.PLANNING.value, PlanStatus.ACTIVE.value])
+        )
+        return self.db.query(Agent).filter(Agent.id.not_in(open_plans)).all()
+
+    def get_agents_with_active_plans(self) -> list[Agent]:
+        """Get agents with an active plan, whose progress can be checked."""
+        active_plans = select(GoalPlan.agent_id).where(
+            GoalPlan.status == PlanStatus.ACTIVE.value
+        )
+        return self.db.query(Agent).filter(Agent.id.in_(active_plans)).all()
+
     def stall_plan(self, plan: GoalPlan, reason: str) -> None:
         """Mark a plan as stalled."""
         plan.status = PlanStatus.STALLED.value
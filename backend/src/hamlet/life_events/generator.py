@@ -32,8 +32,15 @@ class LifeEventGenerator:
         """Check all agents for potential life events. Returns list of new events."""
         new_events = []
 
-        # Get all relationships
-        relationships = self.db.query(Relationship).all()
+        # Only relationships past a threshold can trigger an event
+        relationships = (
+            self.db.query(Relationship)
+            .filter(
+                (Relationship.score >= FRIENDSHIP_THRESHOLD)
+                | (Relationship.score <= RIVALRY_THRESHOLD)
+            )
+            .all()
+        )
 
         for relationship in relationships:
             # Check for positive events
@@ -385,33 +392,68 @@ class LifeEventGenerator:
 
     def get_life_event_context(self, agent_id: str) -> str:
         """Get life event context string for LLM prompts."""
-        events = self.get_active_events_for_agent(agent_id)
-        if not events:
-            return ""
+        return self.get_life_event_contexts([agent_id])[agent_id]
+
+    def get_life_event_contexts(self, agent_ids: list[str]) -> dict[str, str]:
+        """Get life event context strings for several agents, keyed by agent id.
+
+        Active events and the names of the other agents involved are loaded in
+        two queries for the batch.
+        """
+        events = (
+            self.db.query(LifeEvent)
+            .filter(
+                LifeEvent.status == LifeEventStatus.ACTIVE.value,
+                LifeEvent.primary_agent_id.in_(agent_ids)
+                | LifeEvent.secondary_agent_id.in_(agent_ids),
+            )
+            .all()
+        )
 
-        context_parts = ["Your significant life situations:"]
+        wanted = set(agent_ids)
+        events_by_agent: dict[str, list[LifeEvent]] = {}
+        involved = set()
         for event in events:
-            other_agent = None
-            if event.primary_agent_id == agent_id and event.secondary_agent_id:
-                other = self.db.query(Agent).filter(Agent.id == event.secondary_agent_id).first()
-                other_agent = other.name if other else event.secondary_agent_id
-            elif event.secondary_agent_id == agent_id:
-                other = self.db.query(Agent).filter(Agent.id == event.primary_agent_id).first()
-                other_agent = other.name if other else event.primary_agent_id
-
-            event_desc = event.description
-            if event.type == LifeEventType.MARRIAGE.value and other_agent:
-                context_parts.append(f"- You are married to {other_agent}")
-            elif event.type == LifeEventType.MENTORSHIP.value:
-                if event.primary_agent_id == agent_id:
-                    context_parts.append(f"- You are mentoring {other_agent}")
+            for participant in {event.primary_agent_id, event.secondary_agent_id} & wanted:
+                events_by_agent.setdefault(participant, []).append(event)
+            involved.add(event.primary_agent_id)
+            if event.secondary_agent_id:
+                involved.add(event.secondary_agent_id)
+        names = (
+            dict(self.db.query(Agent.id, Agent.name).filter(Agent.id.in_(involved)).all())
+            if involved
+            else {}
+        )
+
+        contexts = {}
+        for agent_id in agent_ids:
+            agent_events = events_by_agent.get(agent_id)
+            if not agent_events:
+                contexts[agent_id] = ""
+                continue
+
+            context_parts = ["Your significant life situations:"]
+            for event in agent_events:
+                other_agent = None
+                if event.primary_agent_id == agent_id and event.secondary_agent_id:
+                    other_agent = names.get(event.secondary_agent_id, event.secondary_agent_id)
+                elif event.secondary_agent_id == agent_id:
+                    other_agent = names.get(event.primary_agent_id, event.primary_agent_id)
+
+                event_desc = event.description
+                if event.type == LifeEventType.MARRIAGE.value and other_agent:
+                    context_parts.append(f"- You are married to {other_agent}")
+                elif event.type == LifeEventType.MENTORSHIP.value:
+                    if event.primary_agent_id == agent_id:
+                        context_parts.append(f"- You are mentoring {other_agent}")
+                    else:
+                        context_parts.append(f"- You are being mentored by {other_agent}")
+                elif event.type == LifeEventType.RIVALRY.value and other_agent:
+                    context_parts.append(f"- You have an ongoing rivalry with {other_agent}")
+                elif event.type == LifeEventType.FEUD.value and other_agent:
+                    context_parts.append(f"- You are in a bitter feud with {other_agent}")
                 else:
-                    context_parts.append(f"- You are being mentored by {other_agent}")
-            elif event.type == LifeEventType.RIVALRY.value and other_agent:
-                context_parts.append(f"- You have an ongoing rivalry with {other_agent}")
-            elif event.type == LifeEventType.FEUD.value and other_agent:
-                context_parts.append(f"- You are in a bitter feud with {other_agent}")
-            else:
-                context_parts.append(f"- {event_desc}")
-
-        return "\n".join(context_parts)
+                    context_parts.append(f"- {event_desc}")
+            contexts[agent_id] = "\n".join(context_parts)
+
+        return contexts
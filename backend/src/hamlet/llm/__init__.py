@@ -1,11 +1,19 @@
 """LLM integration module."""
 
-from hamlet.llm.agent import decide_action, generate_dialogue, process_agent_turn
+from hamlet.llm.agent import (
+    DecisionCache,
+    decide_action,
+    decide_action_async,
+    generate_dialogue,
+    process_agent_turn,
+)
 from hamlet.llm.client import (
     LLMClient,
+    LLMError,
     LLMResponse,
     MockLLMClient,
     ResponseCache,
+    TTLCache,
     get_llm_client,
     set_llm_client,
 )
@@ -19,14 +27,18 @@ from hamlet.llm.parser import get_available_actions, parse_action_response
 
 __all__ = [
     # Agent
+    "DecisionCache",
     "decide_action",
+    "decide_action_async",
     "generate_dialogue",
     "process_agent_turn",
     # Client
     "LLMClient",
+    "LLMError",
     "LLMResponse",
     "MockLLMClient",
     "ResponseCache",
+    "TTLCache",
     "get_llm_client",
     "set_llm_client",
     # Context
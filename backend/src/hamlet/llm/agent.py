@@ -4,10 +4,10 @@ import logging
 
 from hamlet.actions import Action, Wait, execute_action
 from hamlet.db import Agent
-from hamlet.llm.client import LLMClient, get_llm_client
+from hamlet.llm.client import LLMClient, LLMError, TTLCache, get_llm_client
 from hamlet.llm.context import build_decision_prompt, build_dialogue_prompt
 from hamlet.llm.parser import get_available_actions, parse_action_response
-from hamlet.simulation.world import World
+from hamlet.simulation.world import AgentPerception, World
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +40,33 @@ HUMOR & LIFE:
 Keep dialogue to 1-2 sentences. Sound like a real person, not a polite NPC."""
 
 
+class DecisionCache(TTLCache[tuple, Action]):
+    """Exact-match cache of LLM decisions keyed on an agent's situation.
+
+    An agent in the same place, with the same company and roughly the same
+    needs at the same time of day tends to make the same choice, so reusing
+    that decision skips an LLM round-trip.
+    """
+
+    def __init__(self, max_size: int = 4096, ttl_seconds: int = 600):
+        super().__init__(max_size, ttl_seconds)
+
+    @staticmethod
+    def make_key(agent: Agent, perception: AgentPerception, hour: float) -> tuple:
+        """Build a cache key from the inputs that drive a decision."""
+        return (
+            agent.id,
+            agent.location_id,
+            agent.state,
+            round(agent.hunger),
+            round(agent.energy),
+            round(agent.social),
+            tuple(sorted(perception.nearby_agents)),
+            tuple(sorted(perception.nearby_objects)),
+            int(hour) // 3,  # Three-hour time-of-day bucket
+        )
+
+
 def decide_action(agent: Agent, world: World, client: LLMClient | None = None) -> Action:
     """Use LLM to decide what action an agent should take.
 
@@ -71,13 +98,53 @@ def decide_action(agent: Agent, world: World, client: LLMClient | None = None) -
         temperature=0.7,
     )
 
-    logger.debug(f"LLM response for {agent.name}: {response.content}")
+    return _parse_decision(agent, response.content)
+
+
+async def decide_action_async(
+    agent: Agent, world: World, client: LLMClient | None = None
+) -> Action:
+    """Async variant of decide_action for processing agents concurrently.
+
+    Prompt construction reads from the world's database session, so it runs on
+    the calling thread; only the blocking API request goes to a worker thread
+    (see ``LLMClient.complete_async``).
+
+    Raises:
+        LLMError: If the request failed. Unlike ``decide_action``, no fallback
+            Wait is returned, so callers can tell a real decision (worth
+            caching) from an outage.
+    """
+    client = client or get_llm_client()
+
+    available_actions = get_available_actions(agent.id, world)
+
+    if not available_actions:
+        logger.warning(f"No available actions for {agent.name}")
+        return Wait(agent.id)
+
+    prompt = build_decision_prompt(agent, world, available_actions)
+
+    response = await client.complete_async(
+        prompt=prompt,
+        system=DECISION_SYSTEM_PROMPT,
+        max_tokens=100,
+        temperature=0.7,
+    )
+    if response.error:
+        raise LLMError(f"LLM request failed deciding for {agent.name}")
+
+    return _parse_decision(agent, response.content)
+
+
+def _parse_decision(agent: Agent, content: str) -> Action:
+    """Parse an LLM decision response, defaulting to waiting."""
+    logger.debug(f"LLM response for {agent.name}: {content}")
 
-    # Parse into action
-    action = parse_action_response(response.content, agent.id)
+    action = parse_action_response(content, agent.id)
 
     if action is None:
-        logger.warning(f"Could not parse action, defaulting to wait: {response.content}")
+        logger.warning(f"Could not parse action, defaulting to wait: {content}")
         return Wait(agent.id)
 
     return action
@@ -1,9 +1,13 @@
 """LLM client wrapper for agent decision making."""
 
+import asyncio
 import hashlib
 import logging
 import time
+from collections.abc import Hashable
 from dataclasses import dataclass
+from itertools import islice
+from typing import Generic, TypeVar
 
 from hamlet.config import settings
 
@@ -20,49 +24,70 @@ class LLMResponse:
     tokens_out: int = 0
     cached: bool = False
     latency_ms: float = 0
+    error: bool = False  # True for the fallback returned when the API call failed
 
 
-class ResponseCache:
-    """Simple in-memory cache for LLM responses."""
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
-    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
-        self.max_size = max_size
-        self.ttl_seconds = ttl_seconds
-        self._cache: dict[str, tuple[LLMResponse, float]] = {}
 
-    def _make_key(self, prompt: str, model: str) -> str:
-        """Create cache key from prompt and model."""
-        content = f"{model}:{prompt}"
-        return hashlib.md5(content.encode()).hexdigest()
+class LLMError(RuntimeError):
+    """Raised when an LLM request failed and only a fallback response is available."""
+
+
+class TTLCache(Generic[K, V]):
+    """In-memory cache whose entries expire a fixed time after being stored.
 
-    def get(self, prompt: str, model: str) -> LLMResponse | None:
-        """Get cached response if available and not expired."""
-        key = self._make_key(prompt, model)
-        if key in self._cache:
-            response, timestamp = self._cache[key]
-            if time.time() - timestamp < self.ttl_seconds:
-                response.cached = True
-                return response
-            else:
-                del self._cache[key]
+    When full, the oldest quarter of the entries is evicted to make room.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # Kept in insertion order, so the oldest entries come first
+        self._cache: dict[K, tuple[V, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, key: K) -> V | None:
+        """Get a cached value if available and not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        value, timestamp = entry
+        if time.time() - timestamp < self.ttl_seconds:
+            return value
+        del self._cache[key]
         return None
 
-    def set(self, prompt: str, model: str, response: LLMResponse) -> None:
-        """Cache a response."""
+    def set(self, key: K, value: V) -> None:
+        """Cache a value, evicting the oldest entries if the cache is full."""
+        self._cache.pop(key, None)
         if len(self._cache) >= self.max_size:
-            # Remove oldest entries
-            sorted_keys = sorted(self._cache.keys(), key=lambda k: self._cache[k][1])
-            for key in sorted_keys[: len(sorted_keys) // 4]:
-                del self._cache[key]
-
-        key = self._make_key(prompt, model)
-        self._cache[key] = (response, time.time())
+            oldest = list(islice(self._cache, max(1, len(self._cache) // 4)))
+            for old_key in oldest:
+                del self._cache[old_key]
+        self._cache[key] = (value, time.time())
 
     def clear(self) -> None:
         """Clear the cache."""
         self._cache.clear()
 
 
+class ResponseCache(TTLCache[str, LLMResponse]):
+    """Simple in-memory cache for LLM responses."""
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
+        super().__init__(max_size, ttl_seconds)
+
+    @staticmethod
+    def make_key(prompt: str, model: str) -> str:
+        """Create cache key from prompt and model."""
+        content = f"{model}:{prompt}"
+        return hashlib.md5(content.encode()).hexdigest()
+
+
 class LLMClient:
     """Client for making LLM API calls."""
 
@@ -99,23 +124,60 @@ class LLMClient:
         use_cache: bool = True,
     ) -> LLMResponse:
         """Make a completion request to the LLM."""
-        # Check cache first
-        if use_cache and self.cache:
-            cached = self.cache.get(prompt, self.model)
-            if cached:
-                logger.debug("Cache hit for LLM request")
-                # Track cached call
-                from hamlet.llm.usage import get_usage_tracker
-                get_usage_tracker().record_call(
-                    model=self.model,
-                    tokens_in=0,
-                    tokens_out=0,
-                    latency_ms=0,
-                    cached=True,
-                )
-                return cached
-
-        # Make API call
+        cache_key, cached = self._lookup(prompt, use_cache)
+        if cached:
+            return cached
+
+        result = self._request(prompt, system, max_tokens, temperature)
+        self._store(cache_key, result)
+        return result
+
+    async def complete_async(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+    ) -> LLMResponse:
+        """Make a completion request without blocking the event loop.
+
+        Only the API request runs in a worker thread. The response cache and
+        usage tracking are used from the calling thread, so concurrent
+        requests from the event loop never touch them at the same time.
+        """
+        cache_key, cached = self._lookup(prompt, use_cache)
+        if cached:
+            return cached
+
+        result = await asyncio.to_thread(self._request, prompt, system, max_tokens, temperature)
+        self._store(cache_key, result)
+        return result
+
+    def _lookup(self, prompt: str, use_cache: bool) -> tuple[str | None, LLMResponse | None]:
+        """Return the cache key for a prompt (None when not caching) and any cached response."""
+        if not use_cache or self.cache is None:
+            return None, None
+        cache_key = self.cache.make_key(prompt, self.model)
+        cached = self.cache.get(cache_key)
+        if cached:
+            cached.cached = True
+            logger.debug("Cache hit for LLM request")
+            # Track cached call
+            from hamlet.llm.usage import get_usage_tracker
+            get_usage_tracker().record_call(
+                model=self.model,
+                tokens_in=0,
+                tokens_out=0,
+                latency_ms=0,
+                cached=True,
+            )
+        return cache_key, cached
+
+    def _request(
+        self, prompt: str, system: str | None, max_tokens: int, temperature: float
+    ) -> LLMResponse:
+        """Call the API, returning a fallback response flagged as an error on failure."""
         start_time = time.time()
 
         try:
@@ -129,37 +191,15 @@ class LLMClient:
                 messages=messages,
             )
 
-            latency_ms = (time.time() - start_time) * 1000
-
-            result = LLMResponse(
+            return LLMResponse(
                 content=response.content[0].text,
                 model=self.model,
                 tokens_in=response.usage.input_tokens,
                 tokens_out=response.usage.output_tokens,
                 cached=False,
-                latency_ms=latency_ms,
-            )
-
-            # Cache the response
-            if use_cache and self.cache:
-                self.cache.set(prompt, self.model, result)
-
-            logger.debug(
-                f"LLM call: {result.tokens_in} in, {result.tokens_out} out, {latency_ms:.0f}ms"
-            )
-
-            # Track usage
-            from hamlet.llm.usage import get_usage_tracker
-            get_usage_tracker().record_call(
-                model=self.model,
-                tokens_in=result.tokens_in,
-                tokens_out=result.tokens_out,
-                latency_ms=latency_ms,
-                cached=False,
+                latency_ms=(time.time() - start_time) * 1000,
             )
 
-            return result
-
         except Exception as e:
             logger.error(f"LLM API error: {e}")
             # Return fallback response
@@ -170,8 +210,32 @@ class LLMClient:
                 tokens_out=0,
                 cached=False,
                 latency_ms=(time.time() - start_time) * 1000,
+                error=True,
             )
 
+    def _store(self, cache_key: str | None, result: LLMResponse) -> None:
+        """Cache a successful response and record its usage."""
+        if result.error:
+            return
+
+        # Cache the response
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+
+        logger.debug(
+            f"LLM call: {result.tokens_in} in, {result.tokens_out} out, {result.latency_ms:.0f}ms"
+        )
+
+        # Track usage
+        from hamlet.llm.usage import get_usage_tracker
+        get_usage_tracker().record_call(
+            model=self.model,
+            tokens_in=result.tokens_in,
+            tokens_out=result.tokens_out,
+            latency_ms=result.latency_ms,
+            cached=False,
+        )
+
 
 class MockLLMClient(LLMClient):
     """Mock LLM client for testing without API calls."""
@@ -204,6 +268,19 @@ class MockLLMClient(LLMClient):
             latency_ms=10,
         )
 
+    async def complete_async(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        use_cache: bool = True,
+    ) -> LLMResponse:
+        """Return mock response."""
+        return self.complete(
+            prompt, system=system, max_tokens=max_tokens, temperature=temperature, use_cache=use_cache
+        )
+
 
 # Global client instance
 _client: LLMClient | None = None
@@ -4,6 +4,7 @@ from hamlet.memory.compression import compress_memories, end_of_day_compression
 from hamlet.memory.context import build_memory_context
 from hamlet.memory.manager import (
     MemoryManager,
+    add_memories,
     add_memory,
     get_all_memories,
     get_longterm_memories,
@@ -11,14 +12,16 @@ from hamlet.memory.manager import (
     get_working_memories,
 )
 from hamlet.memory.significance import calculate_significance
-from hamlet.memory.types import MemoryType
+from hamlet.memory.types import MemoryRecord, MemoryType
 
 __all__ = [
     # Types
+    "MemoryRecord",
     "MemoryType",
     # Manager
     "MemoryManager",
     "add_memory",
+    "add_memories",
     "get_all_memories",
     "get_working_memories",
     "get_recent_memories",
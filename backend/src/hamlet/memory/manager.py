@@ -2,6 +2,7 @@
 
 import time
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from hamlet.db import Agent, Memory
@@ -10,6 +11,7 @@ from hamlet.memory.types import (
     LONGTERM_MEMORY_LIMIT,
     RECENT_MEMORY_LIMIT,
     WORKING_MEMORY_LIMIT,
+    MemoryRecord,
     MemoryType,
 )
 
@@ -58,6 +60,51 @@ def add_memory(
     return memory
 
 
+def add_memories(
+    records: list[MemoryRecord],
+    db: Session,
+    timestamp: int | None = None,
+    commit: bool = True,
+) -> list[Memory]:
+    """Add several memories in one INSERT and one commit.
+
+    Args:
+        records: The memories to add
+        db: Database session
+        timestamp: Optional timestamp for all memories (defaults to now)
+        commit: Whether to commit; pass False to leave it to the caller
+
+    Returns:
+        The created Memory objects, in the order of ``records``
+    """
+    if not records:
+        return []
+
+    if timestamp is None:
+        timestamp = int(time.time())
+
+    rows = [
+        {
+            "agent_id": record.agent_id,
+            "content": record.content,
+            "type": record.memory_type.value,
+            "significance": (
+                record.significance
+                if record.significance is not None
+                else calculate_significance(record.event_type)
+            ),
+            "timestamp": timestamp,
+            "compressed": record.memory_type != MemoryType.WORKING,
+        }
+        for record in records
+    ]
+    memories = list(db.scalars(insert(Memory).returning(Memory, sort_by_parameter_order=True), rows))
+    if commit:
+        db.commit()
+
+    return memories
+
+
 def get_working_memories(
     agent_id: str,
     db: Session,
@@ -1,6 +1,7 @@
 """Memory type definitions."""
 
 from enum import Enum
+from typing import NamedTuple
 
 
 class MemoryType(str, Enum):
@@ -11,6 +12,16 @@ class MemoryType(str, Enum):
     LONGTERM = "longterm"  # Compressed facts and important events
 
 
+class MemoryRecord(NamedTuple):
+    """A memory to add for an agent, with the same options as ``add_memory``."""
+
+    agent_id: str
+    content: str
+    memory_type: MemoryType = MemoryType.WORKING
+    significance: int | None = None
+    event_type: str = "action"
+
+
 # Configuration for memory limits
 WORKING_MEMORY_LIMIT = 10  # Max working memories before compression
 RECENT_MEMORY_LIMIT = 7  # Keep last 7 days of summaries
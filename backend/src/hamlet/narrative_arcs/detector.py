@@ -89,7 +89,12 @@ class NarrativeArcDetector:
         """Detect arcs from relationship patterns."""
         arcs = []
 
-        relationships = self.db.query(Relationship).all()
+        # Neutral relationships can't start an arc, so leave them in the database
+        relationships = (
+            self.db.query(Relationship)
+            .filter((Relationship.score >= 4) | (Relationship.score <= -3))
+            .all()
+        )
 
         for relationship in relationships:
             # Check for love story potential
@@ -372,27 +377,53 @@ class NarrativeArcDetector:
 
     def get_arc_context_for_agent(self, agent_id: str) -> str:
         """Get arc context string for LLM prompts."""
-        arcs = self.get_arcs_for_agent(agent_id)
-        active_arcs = [a for a in arcs if a.status not in [ArcStatus.RESOLUTION.value, ArcStatus.ABANDONED.value]]
+        return self.get_arc_contexts([agent_id])[agent_id]
 
-        if not active_arcs:
-            return ""
+    def get_arc_contexts(self, agent_ids: list[str]) -> dict[str, str]:
+        """Get arc context strings for several agents, keyed by agent id.
 
-        context_parts = ["You are part of ongoing narratives:"]
+        Arcs involving any of the agents are loaded in one query.
+        """
+        arcs = (
+            self.db.query(NarrativeArc)
+            .filter(
+                NarrativeArc.primary_agent_id.in_(agent_ids)
+                | NarrativeArc.secondary_agent_id.in_(agent_ids),
+                NarrativeArc.status.not_in([ArcStatus.RESOLUTION.value, ArcStatus.ABANDONED.value]),
+            )
+            .order_by(NarrativeArc.discovered_at.desc())
+            .all()
+        )
 
-        for arc in active_arcs[:3]:  # Top 3 arcs
-            arc_type = ArcType(arc.type)
-            act_name = ACT_NAMES.get(arc.current_act, "Unknown")
+        wanted = set(agent_ids)
+        arcs_by_agent: dict[str, list[NarrativeArc]] = {}
+        for arc in arcs:
+            for participant in {arc.primary_agent_id, arc.secondary_agent_id} & wanted:
+                arcs_by_agent.setdefault(participant, []).append(arc)
+
+        contexts = {}
+        for agent_id in agent_ids:
+            active_arcs = arcs_by_agent.get(agent_id)
+            if not active_arcs:
+                contexts[agent_id] = ""
+                continue
 
-            # Determine role
-            if arc.primary_agent_id == agent_id:
-                role = "protagonist"
-            else:
-                role = "co-protagonist"
+            context_parts = ["You are part of ongoing narratives:"]
 
-            context_parts.append(
-                f"- {arc.title} ({arc_type.value}): You are the {role}. "
-                f"Currently in {act_name}. {arc.theme}"
-            )
+            for arc in active_arcs[:3]:  # Top 3 arcs
+                arc_type = ArcType(arc.type)
+                act_name = ACT_NAMES.get(arc.current_act, "Unknown")
+
+                # Determine role
+                if arc.primary_agent_id == agent_id:
+                    role = "protagonist"
+                else:
+                    role = "co-protagonist"
+
+                context_parts.append(
+                    f"- {arc.title} ({arc_type.value}): You are the {role}. "
+                    f"Currently in {act_name}. {arc.theme}"
+                )
+            contexts[agent_id] = "\n".join(context_parts)
 
-        return "\n".join(context_parts)
+        return contexts
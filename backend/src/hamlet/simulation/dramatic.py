@@ -8,9 +8,11 @@ Implements:
 """
 
 import random
+import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
 from typing import Optional
 
 from sqlalchemy.orm import Session
@@ -225,10 +227,14 @@ def generate_conflict_escalation_dialogue(
     return random.choice(lines)
 
 
+_SERIOUS_CONFLICTS = frozenset({ConflictStage.FEUD, ConflictStage.VENDETTA})
+
+
 def process_conflict_aftermath(
     event: ConflictEvent,
     db: Session,
     agents: dict[str, Agent],
+    now_ts: int | None = None,
 ) -> list[Memory]:
     """Process the aftermath of a conflict escalation.
 
@@ -236,9 +242,11 @@ def process_conflict_aftermath(
     - The aggressor
     - The target
     - Any witnesses
+
+    ``now_ts`` lets the tick driver share a single timestamp across events.
     """
     memories = []
-    timestamp = int(time.time())
+    timestamp = now_ts if now_ts is not None else int(time.time())
 
     aggressor = agents.get(event.aggressor_id)
     target = agents.get(event.target_id)
@@ -253,7 +261,7 @@ def process_conflict_aftermath(
         type="working",
         content=f"My conflict with {target.name} has escalated. "
                 f"This is now a {event.new_stage.value}.",
-        significance=7 if event.new_stage in [ConflictStage.FEUD, ConflictStage.VENDETTA] else 6,
+        significance=7 if event.new_stage in _SERIOUS_CONFLICTS else 6,
     )
     memories.append(aggressor_memory)
     db.add(aggressor_memory)
@@ -322,6 +330,10 @@ CHARACTER_SECRETS = {
 }
 
 
+_INVESTIGATIVE_INTERACTIONS = frozenset({"investigate", "observe"})
+_SOCIAL_INTERACTIONS = frozenset({"gossip", "talk"})
+
+
 def check_secret_discovery(
     agent: Agent,
     target: Agent,
@@ -344,9 +356,9 @@ def check_secret_discovery(
     discovery_chance = 0.0
 
     # Interaction type affects discovery
-    if interaction_type in ["investigate", "observe"]:
+    if interaction_type in _INVESTIGATIVE_INTERACTIONS:
         discovery_chance += 0.25
-    elif interaction_type in ["gossip", "talk"]:
+    elif interaction_type in _SOCIAL_INTERACTIONS:
         discovery_chance += 0.15
     elif interaction_type == "confront":
         discovery_chance += 0.20
@@ -384,10 +396,11 @@ def spread_secret(
     secret: SecretRevelation,
     audience: list[Agent],
     db: Session,
+    now_ts: int | None = None,
 ) -> list[Memory]:
     """Spread a secret to an audience, creating memories and updating knowledge."""
     memories = []
-    timestamp = int(time.time())
+    timestamp = now_ts if now_ts is not None else int(time.time())
 
     # Revealer's discretion affects how they tell it
     traits = revealer.traits_dict
@@ -498,6 +511,35 @@ def generate_secret_reaction(
 # LIFE-28: Romantic Subplot Progression
 # =============================================================================
 
+# Linear romance progression, indexed by rank
+_STAGE_BY_RANK = (
+    RomanceStage.STRANGERS,
+    RomanceStage.CURIOUS,
+    RomanceStage.ATTRACTION,
+    RomanceStage.COURTSHIP,
+    RomanceStage.CONFESSION,
+    RomanceStage.RELATIONSHIP,
+)
+_STAGE_RANK = {stage: rank for rank, stage in enumerate(_STAGE_BY_RANK)}
+_MAX_STAGE_RANK = len(_STAGE_BY_RANK) - 1
+
+# Per-stage event type and memory significance, indexed by rank
+_EVENT_TYPE_BY_RANK = (
+    "romantic moment",
+    "lingering glance",
+    "nervous conversation",
+    "romantic gesture",
+    "declaration of feelings",
+    "mutual commitment",
+)
+_SIGNIFICANCE_BY_RANK = (5, 4, 5, 6, 8, 9)
+
+# History markers, matched in any case: entries keep the wording they were written with
+_COMPLICATED_PATTERN = re.compile("complicated", re.IGNORECASE)
+_CONFESS_PATTERN = re.compile("confess", re.IGNORECASE)
+_ROMANTIC_PATTERN = re.compile("romantic|love|confess|crush|attracted", re.IGNORECASE)
+
+
 def get_romance_stage(
     suitor: Agent,
     beloved: Agent,
@@ -516,29 +558,55 @@ def get_romance_stage(
         return RomanceStage.RELATIONSHIP
 
     # Check history for romantic indicators
-    romantic_history = [h for h in history if any(
-        word in h.lower() for word in ["romantic", "love", "confess", "crush", "attracted"]
-    )]
-
-    if any("complicated" in h.lower() for h in history):
+    text = "\n".join(history)
+    if _COMPLICATED_PATTERN.search(text):
         return RomanceStage.COMPLICATED
 
-    if any("confess" in h.lower() for h in history) and score >= 5:
-        return RomanceStage.RELATIONSHIP
+    if _CONFESS_PATTERN.search(text):
+        return RomanceStage.RELATIONSHIP if score >= 5 else RomanceStage.CONFESSION
 
-    if any("confess" in h.lower() for h in history):
-        return RomanceStage.CONFESSION
+    if _ROMANTIC_PATTERN.search(text):
+        if score >= 6:
+            return RomanceStage.COURTSHIP
+        if score >= 4:
+            return RomanceStage.ATTRACTION
+        if score >= 2:
+            return RomanceStage.CURIOUS
 
-    if score >= 6 and romantic_history:
-        return RomanceStage.COURTSHIP
+    return RomanceStage.STRANGERS
 
-    if score >= 4 and romantic_history:
-        return RomanceStage.ATTRACTION
 
-    if score >= 2 and len(romantic_history) > 0:
-        return RomanceStage.CURIOUS
+# Interactions that can advance a romance
+_ROMANTIC_INTERACTIONS = frozenset({"talk", "help", "give", "confess"})
+
+# Stages at which the beloved notices the suitor's interest
+_BELOVED_NOTICES = frozenset({
+    RomanceStage.ATTRACTION,
+    RomanceStage.COURTSHIP,
+    RomanceStage.CONFESSION,
+    RomanceStage.RELATIONSHIP,
+})
+
+# Higher stages are harder to progress
+_ROMANCE_STAGE_DIFFICULTY = {
+    RomanceStage.CURIOUS: 0.0,
+    RomanceStage.ATTRACTION: 0.05,
+    RomanceStage.COURTSHIP: 0.10,
+    RomanceStage.CONFESSION: 0.15,
+    RomanceStage.COMPLICATED: 0.20,
+}
 
-    return RomanceStage.STRANGERS
+
+def _romance_progression_chance(
+    charm: int,
+    courage: int,
+    romantic: bool,
+    difficulty: float,
+) -> float:
+    """Compute the raw (uncapped) chance of a romance progressing."""
+    base = 0.15 if romantic else 0.0
+    # Charm helps; courage is needed to make a move
+    return base + (charm - 5) * 0.04 + (courage - 5) * 0.02 - difficulty
 
 
 def check_romantic_progression(
@@ -559,7 +627,7 @@ def check_romantic_progression(
     current_stage = get_romance_stage(suitor, beloved, relationship)
 
     # Can't progress from relationship (that's the end goal) or strangers (need some connection)
-    if current_stage in [RomanceStage.RELATIONSHIP, RomanceStage.STRANGERS]:
+    if current_stage is RomanceStage.RELATIONSHIP or current_stage is RomanceStage.STRANGERS:
         return None
 
     traits = suitor.traits_dict
@@ -569,43 +637,20 @@ def check_romantic_progression(
     beloved_traits = beloved.traits_dict
     beloved_empathy = beloved_traits.get("empathy", 5)
 
-    # Base progression chance
-    progression_chance = 0.0
-
     # Interaction type matters
-    romantic_interactions = ["talk", "help", "give", "confess"]
-    if interaction_type in romantic_interactions:
-        progression_chance += 0.15
-
-    # Personality modifiers
-    progression_chance += (charm - 5) * 0.04
-    progression_chance += (courage - 5) * 0.02  # Courage to make a move
-
-    # Higher stages are harder to progress
-    stage_difficulty = {
-        RomanceStage.CURIOUS: 0.0,
-        RomanceStage.ATTRACTION: 0.05,
-        RomanceStage.COURTSHIP: 0.10,
-        RomanceStage.CONFESSION: 0.15,
-        RomanceStage.COMPLICATED: 0.20,
-    }
-    progression_chance -= stage_difficulty.get(current_stage, 0)
+    progression_chance = _romance_progression_chance(
+        charm,
+        courage,
+        interaction_type in _ROMANTIC_INTERACTIONS,
+        _ROMANCE_STAGE_DIFFICULTY.get(current_stage, 0.0),
+    )
 
     # Roll for progression
     if random.random() < min(progression_chance, 0.25):  # Cap at 25%
-        # Determine next stage
-        stage_order = [
-            RomanceStage.STRANGERS,
-            RomanceStage.CURIOUS,
-            RomanceStage.ATTRACTION,
-            RomanceStage.COURTSHIP,
-            RomanceStage.CONFESSION,
-            RomanceStage.RELATIONSHIP,
-        ]
-
-        current_index = stage_order.index(current_stage)
-        if current_index < len(stage_order) - 1:
-            new_stage = stage_order[current_index + 1]
+        # Determine next stage (complicated romances have no linear successor)
+        rank = _STAGE_RANK.get(current_stage)
+        if rank is not None and rank < _MAX_STAGE_RANK:
+            new_stage = _STAGE_BY_RANK[rank + 1]
 
             # Check if reciprocated (beloved's feelings)
             beloved_feelings = relationship.score + (beloved_empathy - 5)
@@ -616,21 +661,12 @@ def check_romantic_progression(
             history.append(f"romantic interest: {new_stage.value}")
             relationship.history_list = history
 
-            # Determine event type based on stage
-            event_types = {
-                RomanceStage.CURIOUS: "lingering glance",
-                RomanceStage.ATTRACTION: "nervous conversation",
-                RomanceStage.COURTSHIP: "romantic gesture",
-                RomanceStage.CONFESSION: "declaration of feelings",
-                RomanceStage.RELATIONSHIP: "mutual commitment",
-            }
-
             return RomanceEvent(
                 suitor_id=suitor.id,
                 beloved_id=beloved.id,
                 old_stage=current_stage,
                 new_stage=new_stage,
-                event_type=event_types.get(new_stage, "romantic moment"),
+                event_type=_EVENT_TYPE_BY_RANK[rank + 1],
                 reciprocated=reciprocated,
             )
 
@@ -671,10 +707,11 @@ def process_romance_aftermath(
     event: RomanceEvent,
     db: Session,
     agents: dict[str, Agent],
+    now_ts: int | None = None,
 ) -> list[Memory]:
     """Process the aftermath of a romantic progression."""
     memories = []
-    timestamp = int(time.time())
+    timestamp = now_ts if now_ts is not None else int(time.time())
 
     suitor = agents.get(event.suitor_id)
     beloved = agents.get(event.beloved_id)
@@ -683,14 +720,8 @@ def process_romance_aftermath(
         return memories
 
     # Significance increases with stage
-    stage_significance = {
-        RomanceStage.CURIOUS: 4,
-        RomanceStage.ATTRACTION: 5,
-        RomanceStage.COURTSHIP: 6,
-        RomanceStage.CONFESSION: 8,
-        RomanceStage.RELATIONSHIP: 9,
-    }
-    significance = stage_significance.get(event.new_stage, 5)
+    rank = _STAGE_RANK.get(event.new_stage)
+    significance = _SIGNIFICANCE_BY_RANK[rank] if rank is not None else 5
 
     # Suitor memory
     if event.reciprocated:
@@ -706,11 +737,9 @@ def process_romance_aftermath(
         significance=significance,
     )
     memories.append(suitor_memory)
-    db.add(suitor_memory)
 
     # Beloved memory (if they noticed)
-    if event.new_stage in [RomanceStage.ATTRACTION, RomanceStage.COURTSHIP,
-                           RomanceStage.CONFESSION, RomanceStage.RELATIONSHIP]:
+    if event.new_stage in _BELOVED_NOTICES:
         if event.reciprocated:
             beloved_content = f"I think there's something between me and {suitor.name}. My heart races when they're near."
         else:
@@ -724,8 +753,8 @@ def process_romance_aftermath(
             significance=significance - 1,  # Slightly less significant for beloved
         )
         memories.append(beloved_memory)
-        db.add(beloved_memory)
 
+    db.add_all(memories)
     return memories
 
 
@@ -836,6 +865,7 @@ def trigger_village_event(
     db: Session,
     agents: list[Agent],
     custom_description: str = None,
+    now_ts: int | None = None,
 ) -> VillageEvent:
     """Trigger a village-wide event affecting multiple agents.
 
@@ -844,6 +874,7 @@ def trigger_village_event(
         db: Database session
         agents: List of all agents to potentially affect
         custom_description: Optional custom description override
+        now_ts: Optional tick timestamp shared across events (defaults to now)
     """
     # Get event template
     templates = VILLAGE_EVENT_TEMPLATES.get(event_type, [])
@@ -863,45 +894,46 @@ def trigger_village_event(
     mood_effect = template.get("mood_effect", {})
 
     # Determine affected agents
-    affected_ids = []
-
     if location_id:
-        # Only agents at or near the location
-        affected_agents = [a for a in agents if a.location_id == location_id]
+        # Only agents at or near the location, partitioned in a single pass
+        affected_agents = []
+        other_agents = []
+        for a in agents:
+            (affected_agents if a.location_id == location_id else other_agents).append(a)
         # Also include some random agents who "heard about it"
-        other_agents = [a for a in agents if a.location_id != location_id]
-        heard_count = min(len(other_agents), random.randint(1, 3))
-        affected_agents.extend(random.sample(other_agents, heard_count))
+        if other_agents:
+            heard_count = min(len(other_agents), random.randint(1, 3))
+            if heard_count == len(other_agents):
+                affected_agents.extend(other_agents)
+            else:
+                affected_agents.extend(random.sample(other_agents, heard_count))
     else:
         # Village-wide event affects everyone
         affected_agents = agents
 
-    affected_ids = [a.id for a in affected_agents]
-
-    # Apply mood effects
+    # Apply mood effects, collect ids and create memories in a single pass
+    timestamp = now_ts if now_ts is not None else int(time.time())
+    content = f"Village event: {description}"
+    affected_ids = []
+    new_memories = []
     for agent in affected_agents:
+        affected_ids.append(agent.id)
+
         mood = agent.mood_dict
         for key, delta in mood_effect.items():
             if key in mood:
                 mood[key] = max(1, min(10, mood[key] + delta))
         agent.mood_dict = mood
 
-    # Create memories for affected agents
-    timestamp = int(time.time())
-    for agent in affected_agents:
         # Significance varies by perception
-        traits = agent.traits_dict
-        perception = traits.get("perception", 5)
-        agent_significance = significance + (1 if perception >= 7 else 0)
-
-        memory = Memory(
+        new_memories.append(Memory(
             agent_id=agent.id,
             timestamp=timestamp,
             type="working",
-            content=f"Village event: {description}",
-            significance=agent_significance,
-        )
-        db.add(memory)
+            content=content,
+            significance=significance + (1 if agent.traits_dict.get("perception", 5) >= 7 else 0),
+        ))
+    db.add_all(new_memories)
 
     # Record the event
     event_record = Event(
@@ -924,11 +956,24 @@ def trigger_village_event(
     )
 
 
+# Weighted event types for random village events, with cumulative weights
+# precomputed so each roll is a single bisect inside random.choices.
+_RANDOM_EVENT_TYPES = (
+    VillageEventType.MYSTERIOUS_OCCURRENCE,
+    VillageEventType.DISCOVERY,
+    VillageEventType.TOWN_MEETING,
+    VillageEventType.STORM,
+    VillageEventType.STRANGER_ARRIVAL,
+)
+_RANDOM_EVENT_CUM_WEIGHTS = tuple(accumulate((3, 2, 2, 1, 1)))
+
+
 def check_random_village_event(
     db: Session,
     agents: list[Agent],
     current_hour: float,
     current_day: int,
+    now_ts: int | None = None,
 ) -> Optional[VillageEvent]:
     """Check if a random village event should occur.
 
@@ -952,25 +997,8 @@ def check_random_village_event(
 
     if random.random() < event_chance:
         # Weighted random event type
-        event_weights = {
-            VillageEventType.MYSTERIOUS_OCCURRENCE: 3,
-            VillageEventType.DISCOVERY: 2,
-            VillageEventType.TOWN_MEETING: 2,
-            VillageEventType.STORM: 1,
-            VillageEventType.STRANGER_ARRIVAL: 1,
-        }
-
-        total_weight = sum(event_weights.values())
-        roll = random.random() * total_weight
-        cumulative = 0
-
-        for event_type, weight in event_weights.items():
-            cumulative += weight
-            if roll < cumulative:
-                return trigger_village_event(event_type, db, agents)
-
-        # Fallback
-        return trigger_village_event(VillageEventType.MYSTERIOUS_OCCURRENCE, db, agents)
+        event_type = random.choices(_RANDOM_EVENT_TYPES, cum_weights=_RANDOM_EVENT_CUM_WEIGHTS)[0]
+        return trigger_village_event(event_type, db, agents, now_ts=now_ts)
 
     return None
 
@@ -985,6 +1013,7 @@ def cascade_village_event_effects(
     Returns a list of (agent_id, reaction) tuples.
     """
     reactions = []
+    is_mysterious = "mysterious" in event.description.lower()
 
     for agent_id in event.affected_agents:
         agent = agents.get(agent_id)
@@ -996,7 +1025,7 @@ def cascade_village_event_effects(
         courage = traits.get("courage", 5)
 
         # High curiosity agents want to investigate
-        if curiosity >= 7 and "mysterious" in event.description.lower():
+        if curiosity >= 7 and is_mysterious:
             reactions.append((agent_id, "investigate"))
 
         # Low courage agents may hide
@@ -1,15 +1,23 @@
 """Simulation engine - the core tick loop."""
 
 import asyncio
+import json
 import logging
 import random
 import time
-from collections import deque
+import zlib
+from bisect import bisect
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from itertools import accumulate
 from threading import Lock
+from typing import NamedTuple
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
 
 from hamlet.config import settings
-from hamlet.db import Agent, Event
+from hamlet.db import Agent, Event, Location
 from hamlet.simulation.dramatic import (
     check_random_village_event,
     generate_conflict_escalation_dialogue,
@@ -97,11 +105,66 @@ def get_health_metrics() -> HealthMetrics:
         return _health_metrics
 
 
+class RandomAction(NamedTuple):
+    """A candidate action for an agent without LLM decision-making."""
+
+    type: str
+    target: str | None = None
+    topic: str | None = None
+    job: str | None = None
+    mystery: str | None = None
+
+
+# Number of random-mode agent turns between explicit yields to the event loop
+AGENT_YIELD_INTERVAL = 16
+
+# Static templates for random (non-LLM) actions
+_WAIT_ACTION = RandomAction("wait")
+_TALK_TOPICS = ("the weather", "village news", "their day", "old times", "local rumors")
+_WORK_LOCATIONS = {
+    "bakery": "baking",
+    "blacksmith": "smithing",
+    "inn": "innkeeping",
+    "tavern": "serving",
+    "church": "praying",
+    "garden": "gardening",
+}
+_MYSTERIES = ("strange noises", "unusual footprints", "mysterious lights", "missing items")
+_RUMORS = (
+    "acting strangely lately",
+    "seen near the forest at odd hours",
+    "hiding something",
+    "been very secretive",
+    "spending a lot of time alone",
+)
+_HELP_TASKS = ("carry supplies", "with a task", "tidy up", "prepare for the day")
+_INVESTIGATION_OUTCOMES = (
+    "but found nothing unusual",
+    "and noticed something odd",
+    "and grew more curious",
+    "but was interrupted",
+)
+
+
+def _cap_actors(actors: list[str], limit: int = 5) -> list[str]:
+    """Limit an actor list, only copying when it is actually too long."""
+    return actors if len(actors) <= limit else actors[:limit]
+
+
 def format_object_name(obj_id: str) -> str:
     """Convert object ID to readable name: mysterious_portrait -> mysterious portrait."""
     return obj_id.replace("_", " ")
 
 
+def _decision_phase(agent_id: str, interval: int) -> int:
+    """Tick offset at which an agent makes its scheduled decision.
+
+    Uses CRC-32 rather than ``hash()``, which is salted per process, so an
+    agent keeps the same schedule across restarts.
+    """
+    return zlib.crc32(agent_id.encode()) % interval
+
+
 class SimulationEngine:
     """The core simulation engine that runs the tick loop."""
 
@@ -112,6 +175,33 @@ class SimulationEngine:
         self._task: asyncio.Task | None = None
         self.health = get_health_metrics()  # DASH-14: Health metrics tracking
 
+        # Random generator for this engine's agent choices, idle behaviors and greetings
+        self._rng = random.Random()
+
+        # Event rows recorded during a tick, inserted in one batch before commit
+        self._pending_events: list[dict] = []
+
+        # Events published by agents during a tick, flushed to subscribers together
+        self._tick_event_buffer: list[tuple] = []
+
+        # Agents loaded at the start of the current tick (None outside a tick)
+        self._tick_agents: list[Agent] | None = None
+
+        # Unix timestamp shared by everything recorded in the current tick
+        self._tick_timestamp: int | None = None
+
+        # Locations looked up during the current tick, keyed by id
+        self._location_cache: dict[str, Location | None] = {}
+
+        # Parsed connections per location id; the village map doesn't change at runtime
+        self._connections: dict[str, tuple[str, ...]] = {}
+
+        # Agents grouped by location for the current random-mode tick (None otherwise)
+        self._occupants: dict[str, list[Agent]] | None = None
+
+        # Coarse needs/location snapshot per agent id, taken at its last decision
+        self._decision_states: dict[str, tuple] = {}
+
         # Initialize emergent narratives system
         self.narratives = EmergentNarratives(self.world.db)
 
@@ -122,8 +212,18 @@ class SimulationEngine:
             self.use_llm = use_llm
 
         if self.use_llm:
+            # Lazy imports to avoid circular dependency, resolved once per engine
+            from hamlet.actions import execute_action
+            from hamlet.llm.agent import DecisionCache, decide_action_async
+
+            self._decide_action = decide_action_async
+            self._execute_llm_action = execute_action
+            self.decision_cache = DecisionCache()
+            # Bounds concurrent LLM requests when all agents decide at once
+            self._llm_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
             logger.info("LLM decision-making enabled")
         else:
+            self.decision_cache = None
             logger.info("LLM disabled - using random actions")
 
     async def start(self) -> None:
@@ -149,23 +249,79 @@ class SimulationEngine:
         logger.info("Simulation engine stopped")
 
     async def _run_loop(self) -> None:
-        """The main simulation loop."""
-        while self.running:
-            try:
+        """The main simulation loop.
+
+        Transient failures (LLM calls, per-agent turns, the tick commit) are
+        handled where they occur; anything else is a bug, so the loop stops
+        rather than carrying on with inconsistent world state.
+        """
+        try:
+            while self.running:
                 await self.tick()
-                await asyncio.sleep(self.tick_interval)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in simulation loop: {e}")
-                await asyncio.sleep(1)  # Brief pause before retry
+                await self._wait_for_next_tick()
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Simulation loop crashed; stopping engine")
+            self.running = False
+
+    async def _wait_for_next_tick(self) -> None:
+        """Sleep until the next tick, prefetching LLM decisions in the meantime.
+
+        The tick never waits on the prefetch: whatever hasn't landed in the
+        decision cache when the interval ends is cancelled.
+        """
+        if not self.use_llm:
+            await asyncio.sleep(self.tick_interval)
+            return
+
+        prefetch = asyncio.create_task(self._prefetch_decisions())
+        try:
+            await asyncio.sleep(self.tick_interval)
+        finally:
+            prefetch.cancel()
+            await asyncio.wait([prefetch])
+
+    async def _prefetch_decisions(self) -> None:
+        """Speculatively decide next-tick actions for agents due to decide then.
+
+        Decisions are cached under the key each agent is expected to have next
+        tick (same situation, half an hour later), so an agent whose situation
+        doesn't change gets its decision without waiting on the LLM. Each one
+        is cached as soon as it arrives, so a cancelled prefetch keeps the
+        decisions already made.
+        """
+        try:
+            state = self.world.get_world_state()
+            next_hour = (state.current_hour + 0.5) % 24
+            awake = [a for a in self.world.get_agents() if a.state != "sleeping"]
+            due = self._agents_due(awake, state.current_tick + 1, record=False)
+            perceptions = self.world.get_agent_perceptions(due)
+            pending = []
+            for agent in due:
+                key = self.decision_cache.make_key(agent, perceptions[agent.id], next_hour)
+                if self.decision_cache.get(key) is None:
+                    pending.append(self._prefetch_decision(key, agent))
+
+            await asyncio.gather(*pending)
+        except Exception as e:
+            logger.warning(f"Decision prefetch failed: {e}")
+
+    async def _prefetch_decision(self, key: tuple, agent: Agent) -> None:
+        """Decide for one agent and cache the result; failures are left uncached."""
+        try:
+            self.decision_cache.set(key, await self._decide(agent))
+        except Exception as e:
+            logger.debug("Prefetch for %s failed: %s", agent.name, e)
 
     async def tick(self) -> None:
         """Execute a single simulation tick."""
         tick_start = time.time()
+        self._tick_timestamp = int(tick_start)
+        self._location_cache.clear()
 
-        # 1. Advance world time
-        tick, day, hour = self.world.advance_time(minutes=30)
+        # 1. Advance world time (committed with the rest of the tick in step 6)
+        tick, day, hour = self.world.advance_time(minutes=30, commit=False)
         logger.info(f"[Tick {tick}] Day {day}, {hour:.1f}:00")
 
         # 2. Publish tick event
@@ -173,51 +329,69 @@ class SimulationEngine:
             EventType.TICK,
             f"Tick {tick}: Day {day}, {int(hour):02d}:{int((hour % 1) * 60):02d}",
             significance=1,
+            timestamp=self._tick_timestamp,
         )
 
-        # 3. Handle day/night transitions
-        woken = self.world.wake_sleeping_agents()
+        # 3-4. Handle day/night transitions and update needs in one pass over agents
+        woken, sleeping, active_agents, agents = self.world.tick_agents(hour, hours_passed=0.5)
+        self._tick_agents = agents
+
+        # Agents changing state decide afresh rather than waiting for their phase
+        for agent in (*woken, *sleeping):
+            self._decision_states.pop(agent.id, None)
+
         for agent in woken:
-            logger.info(f"  {agent.name} woke up")
-            await self.world.publish_event(
+            logger.info("  %s woke up", agent.name)
+            self._queue_event(
                 EventType.SYSTEM,
                 f"{agent.name} woke up",
                 actors=[agent.id],
                 location_id=agent.location_id,
             )
 
-        sleeping = self.world.put_agents_to_sleep()
         for agent in sleeping:
-            logger.info(f"  {agent.name} went to sleep")
-            await self.world.publish_event(
+            logger.info("  %s went to sleep", agent.name)
+            self._queue_event(
                 EventType.SYSTEM,
                 f"{agent.name} went to sleep",
                 actors=[agent.id],
                 location_id=agent.location_id,
             )
 
-        # 4. Update agent needs
-        agents = self.world.get_agents()
-        for agent in agents:
-            self.world.update_agent_needs(agent, hours_passed=0.5)
+        # 5. Process active agents (not sleeping) whose decision is due
+        deciding = self._agents_due(active_agents, tick)
+        self.health.queue_depth = len(deciding)  # Track queue depth
 
-        # 5. Process active agents (not sleeping)
-        active_agents = [a for a in agents if a.state != "sleeping"]
-        self.health.queue_depth = len(active_agents)  # Track queue depth
+        if not self.use_llm:
+            # Random turns read perception from one grouping of the tick's agents,
+            # kept current as agents move, instead of querying per agent
+            self._occupants = defaultdict(list)
+            for agent in agents:
+                self._occupants[agent.location_id].append(agent)
 
-        for agent in active_agents:
-            await self._process_agent(agent)
-            self.health.queue_depth -= 1  # Decrement as we process
+        await self._process_agents(deciding)
 
-        # 6. Process emergent narratives (life events, arcs, factions)
-        await self.narratives.process_tick(tick, day, hour)
+        self._tick_agents = None
+        self._occupants = None
+        await self._flush_published_events()
+
+        # 6. Flush recorded events and commit all changes, before the narrative
+        # pass, whose error handling rolls back the shared session
+        try:
+            self._flush_events()
+            self.world.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to commit tick {tick}: {e}")
+            self.world.db.rollback()
+            self._pending_events.clear()
+            self.health.record_error()
 
-        # 7. Commit all changes
-        self.world.commit()
+        # 7. Process emergent narratives (life events, arcs, factions)
+        await self.narratives.process_tick(tick, day, hour, self._tick_timestamp)
 
         # 8. Record tick metrics (DASH-14)
         tick_duration_ms = (time.time() - tick_start) * 1000
-        self.health.record_tick(tick_duration_ms, len(active_agents))
+        self.health.record_tick(tick_duration_ms, len(deciding))
 
         # 9. Publish position updates (DASH-12) - within 1 tick of state change
         await self._publish_positions(agents, tick, day, hour)
@@ -226,12 +400,87 @@ class SimulationEngine:
         await self._publish_health(tick)
 
         # 11. Log agent states
+        if logger.isEnabledFor(logging.DEBUG):
+            for agent in agents:
+                logger.debug(
+                    "  %s: hunger=%.1f, energy=%.1f, social=%.1f, state=%s",
+                    agent.name,
+                    agent.hunger,
+                    agent.energy,
+                    agent.social,
+                    agent.state,
+                )
+
+    def _now(self) -> int:
+        """Timestamp for the current tick, or the wall clock outside a tick."""
+        return self._tick_timestamp if self._tick_timestamp is not None else int(time.time())
+
+    def _agents_due(self, agents: list[Agent], tick: int, record: bool = True) -> list[Agent]:
+        """Select the agents that should decide an action this tick.
+
+        An agent decides when its needs (to the whole point), happiness or
+        location have changed since its last decision, and otherwise once every
+        ``agent_decision_interval`` ticks, staggered by agent so the village
+        doesn't act in bursts. With ``record=False`` the selected agents'
+        states aren't remembered, for looking ahead without deciding.
+        """
+        interval = max(1, settings.agent_decision_interval)
+        if interval == 1:
+            return agents
+
+        states = self._decision_states
+        due = []
         for agent in agents:
-            logger.debug(
-                f"  {agent.name}: hunger={agent.hunger:.1f}, "
-                f"energy={agent.energy:.1f}, social={agent.social:.1f}, "
-                f"state={agent.state}"
+            state = (
+                int(agent.hunger),
+                int(agent.energy),
+                int(agent.social),
+                int(agent.mood_dict.get("happiness", 5)),
+                agent.location_id,
             )
+            on_phase = tick % interval == _decision_phase(agent.id, interval)
+            if on_phase or states.get(agent.id) != state:
+                if record:
+                    states[agent.id] = state
+                due.append(agent)
+        return due
+
+    def _get_location(self, location_id: str) -> Location | None:
+        """Get a location, caching lookups for the rest of the tick."""
+        if location_id not in self._location_cache:
+            self._location_cache[location_id] = self.world.get_location(location_id)
+        return self._location_cache[location_id]
+
+    def _get_connections(self, location_id: str) -> tuple[str, ...]:
+        """Get the ids of locations connected to a location, parsed once per engine."""
+        connections = self._connections.get(location_id)
+        if connections is None:
+            location = self._get_location(location_id)
+            connections = tuple(location.connections_list) if location else ()
+            self._connections[location_id] = connections
+        return connections
+
+    def _queue_event(
+        self,
+        event_type: EventType,
+        summary: str,
+        actors: list[str] | None = None,
+        location_id: str | None = None,
+        detail: str | None = None,
+        significance: int = 1,
+    ) -> None:
+        """Buffer a simulation event for publishing at the end of agent processing."""
+        self._tick_event_buffer.append(
+            (event_type, summary, actors, location_id, detail, significance)
+        )
+
+    async def _flush_published_events(self) -> None:
+        """Publish all buffered simulation events in one batch."""
+        if not self._tick_event_buffer:
+            return
+        events = self._tick_event_buffer
+        self._tick_event_buffer = []
+        await self.world.publish_events(events, timestamp=self._now())
 
     async def _publish_positions(
         self, agents: list[Agent], tick: int, day: int, hour: float
@@ -250,7 +499,7 @@ class SimulationEngine:
         event = SimulationEvent(
             type=EventType.POSITIONS,
             summary=f"Agent positions at tick {tick}",
-            timestamp=int(time.time()),
+            timestamp=self._now(),
             data={
                 "tick": tick,
                 "day": day,
@@ -265,42 +514,80 @@ class SimulationEngine:
         event = SimulationEvent(
             type=EventType.HEALTH,
             summary=f"Health metrics at tick {tick}",
-            timestamp=int(time.time()),
+            timestamp=self._now(),
             data=self.health.to_dict(),
         )
         await event_bus.publish(event)
 
-    async def _process_agent(self, agent: Agent) -> None:
-        """Process a single agent's turn."""
+    async def _process_agents(self, agents: list[Agent]) -> None:
+        """Run a turn for each active agent, logging per-agent failures."""
         if self.use_llm:
-            await self._process_agent_llm(agent)
+            # LLM requests are real I/O, so process agents concurrently to overlap them
+            results = await asyncio.gather(
+                *(self._process_agent(agent) for agent in agents),
+                return_exceptions=True,
+            )
         else:
-            await self._process_agent_random(agent)
+            # Random turns never suspend; yield to the event loop every few agents so
+            # streaming isn't starved, without paying for a yield per agent
+            results = []
+            for i, agent in enumerate(agents, 1):
+                try:
+                    await self._process_agent(agent)
+                    results.append(None)
+                except Exception as e:
+                    results.append(e)
+                if i % AGENT_YIELD_INTERVAL == 0:
+                    await asyncio.sleep(0)
+
+        for agent, result in zip(agents, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error("Error processing %s: %s", agent.name, result)
+                self.health.record_error()
+
+    async def _process_agent(self, agent: Agent) -> None:
+        """Process a single agent's turn."""
+        try:
+            if self.use_llm:
+                await self._process_agent_llm(agent)
+            else:
+                await self._process_agent_random(agent)
+        finally:
+            self.health.queue_depth -= 1  # Decrement as we process
+
+    async def _decide(self, agent: Agent):
+        """Ask the LLM for an agent's next action, within the concurrency limit."""
+        async with self._llm_semaphore:
+            return await self._decide_action(agent, self.world)
 
     async def _process_agent_llm(self, agent: Agent) -> None:
         """Process agent turn using LLM decision-making."""
-        # Lazy imports to avoid circular dependency
-        from hamlet.actions import execute_action
-        from hamlet.llm.agent import decide_action
-
         try:
-            # LLM decides action
-            action = decide_action(agent, self.world)
+            # Reuse a decision made in an identical situation, else ask the LLM
+            perception = self.world.get_agent_perception(agent)
+            cache_key = self.decision_cache.make_key(
+                agent, perception, self.world.get_world_state().current_hour
+            )
+            action = self.decision_cache.get(cache_key)
+            if action is None:
+                action = await self._decide(agent)
+                self.decision_cache.set(cache_key, action)
 
-            # Execute the action through the action system
-            result = execute_action(action, self.world)
+            # Execute the action through the action system; the tick commits once,
+            # before the narrative pass
+            result = self._execute_llm_action(action, self.world, commit=False)
 
             if result.success:
-                logger.info(f"  {agent.name}: {result.message}")
+                logger.info("  %s: %s", agent.name, result.message)
                 # Publish to event bus for SSE streaming
-                await self.world.publish_event(
+                self._queue_event(
                     EventType.ACTION,
                     result.message,
                     actors=[agent.id],
                     location_id=agent.location_id,
                 )
             else:
-                logger.debug(f"  {agent.name} action failed: {result.message}")
+                logger.debug("  %s action failed: %s", agent.name, result.message)
 
         except Exception as e:
             logger.error(f"LLM decision failed for {agent.name}: {e}")
@@ -310,7 +597,7 @@ class SimulationEngine:
 
     async def _process_agent_random(self, agent: Agent) -> None:
         """Process agent turn using random actions (fallback)."""
-        perception = self.world.get_agent_perception(agent)
+        perception = self._perceive(agent)
         action = self._choose_random_action(agent, perception)
 
         if action:
@@ -319,130 +606,155 @@ class SimulationEngine:
             # No action chosen - do an idle behavior instead
             await self._do_idle_behavior(agent, perception)
 
-    def _choose_random_action(self, agent: Agent, perception: AgentPerception) -> dict | None:
+    def _perceive(self, agent: Agent) -> AgentPerception:
+        """Build an agent's perception, from the tick's occupancy index when available."""
+        if self._occupants is None:
+            return self.world.get_agent_perception(agent)
+
+        location = self._get_location(agent.location_id) if agent.location_id else None
+        if location is None:
+            return AgentPerception(location_name="Unknown", nearby_agents=[], nearby_objects=[])
+
+        return AgentPerception(
+            location_name=location.name,
+            nearby_agents=[a.name for a in self._occupants[location.id] if a.id != agent.id],
+            nearby_objects=location.objects_list,
+        )
+
+    def _choose_random_action(
+        self, agent: Agent, perception: AgentPerception
+    ) -> RandomAction | None:
         """Choose a random action for the agent based on needs and opportunities."""
+        # Local aliases: this runs for every agent on every tick
+        choice = self._rng.choice
+        rand = self._rng.random
+
+        # 20% chance to do nothing (adds variety) - roll before building candidates
+        if rand() < 0.2:
+            return None
 
         choices = []
         weights = []  # Higher weight = more likely
+        add_choice = choices.append
+        add_weight = weights.append
+        lonely = agent.social < 5
 
         # Movement - can move to connected locations
         if agent.location_id:
-            location = self.world.get_location(agent.location_id)
-            if location:
-                for conn in location.connections_list:
-                    choices.append({"type": "move", "target": conn})
-                    weights.append(1)
+            connections = self._get_connections(agent.location_id)
+            choices.extend(RandomAction("move", target=conn) for conn in connections)
+            weights.extend([1] * len(connections))
 
         # Social interactions with nearby agents
         for other_name in perception.nearby_agents:
             # Greet (light social)
-            choices.append({"type": "greet", "target": other_name})
-            weights.append(2 if agent.social < 5 else 1)
+            add_choice(RandomAction("greet", target=other_name))
+            add_weight(2 if lonely else 1)
 
             # Talk (deeper social, satisfies social need more)
-            topic = random.choice(["the weather", "village news", "their day", "old times", "local rumors"])
-            choices.append({"type": "talk", "target": other_name, "topic": topic})
-            weights.append(3 if agent.social < 5 else 1)
+            topic = choice(_TALK_TOPICS)
+            add_choice(RandomAction("talk", target=other_name, topic=topic))
+            add_weight(3 if lonely else 1)
 
             # Gossip (spreads information, risky)
-            choices.append({"type": "gossip", "target": other_name})
-            weights.append(1)
+            add_choice(RandomAction("gossip", target=other_name))
+            add_weight(1)
 
             # Help (builds relationships)
-            choices.append({"type": "help", "target": other_name})
-            weights.append(1)
+            add_choice(RandomAction("help", target=other_name))
+            add_weight(1)
 
         # Solo actions - examine objects
-        for obj in perception.nearby_objects:
-            choices.append({"type": "examine", "target": obj})
-            weights.append(1)
+        objects = perception.nearby_objects
+        choices.extend(RandomAction("examine", target=obj) for obj in objects)
+        weights.extend([1] * len(objects))
 
         # Work action (if at appropriate location)
-        work_locations = {"bakery": "baking", "blacksmith": "smithing", "inn": "innkeeping",
-                         "tavern": "serving", "church": "praying", "garden": "gardening"}
-        if agent.location_id in work_locations:
-            choices.append({"type": "work", "job": work_locations[agent.location_id]})
-            weights.append(2)
+        if agent.location_id in _WORK_LOCATIONS:
+            add_choice(RandomAction("work", job=_WORK_LOCATIONS[agent.location_id]))
+            add_weight(2)
 
         # Investigate (for curious agents or when something is amiss)
         if agent.location_id:
-            mysteries = ["strange noises", "unusual footprints", "mysterious lights", "missing items"]
-            choices.append({"type": "investigate", "mystery": random.choice(mysteries)})
-            weights.append(1)
+            add_choice(RandomAction("investigate", mystery=choice(_MYSTERIES)))
+            add_weight(1)
 
         # Wait/rest
-        choices.append({"type": "wait"})
-        weights.append(1 if agent.energy > 5 else 3)
-
-        # 20% chance to do nothing (adds variety)
-        if random.random() < 0.2:
-            return None
+        add_choice(_WAIT_ACTION)
+        add_weight(1 if agent.energy > 5 else 3)
 
         if not choices:
             return None
 
-        # Weighted random selection
-        return random.choices(choices, weights=weights, k=1)[0]
-
-    async def _execute_action(self, agent: Agent, action: dict) -> None:
+        # Weighted random selection over cumulative weights
+        cum_weights = list(accumulate(weights))
+        return choices[bisect(cum_weights, rand() * cum_weights[-1])]
+
+    # Random action type -> handler taking (engine, agent, action)
+    _ACTION_DISPATCH = {
+        "move": lambda self, agent, action: self._do_move(agent, action.target),
+        "greet": lambda self, agent, action: self._do_greet(agent, action.target),
+        "talk": lambda self, agent, action: self._do_talk(
+            agent, action.target, action.topic or "various things"
+        ),
+        "gossip": lambda self, agent, action: self._do_gossip(agent, action.target),
+        "help": lambda self, agent, action: self._do_help(agent, action.target),
+        "examine": lambda self, agent, action: self._do_examine(agent, action.target),
+        "work": lambda self, agent, action: self._do_work(agent, action.job or "working"),
+        "investigate": lambda self, agent, action: self._do_investigate(
+            agent, action.mystery or "something"
+        ),
+        "wait": lambda self, agent, action: self._do_wait(agent),
+    }
+
+    async def _execute_action(self, agent: Agent, action: RandomAction) -> None:
         """Execute an action for an agent."""
-        action_type = action.get("type")
-        target = action.get("target")
-
-        if action_type == "move":
-            await self._do_move(agent, target)
-        elif action_type == "greet":
-            await self._do_greet(agent, target)
-        elif action_type == "talk":
-            await self._do_talk(agent, target, action.get("topic", "various things"))
-        elif action_type == "gossip":
-            await self._do_gossip(agent, target)
-        elif action_type == "help":
-            await self._do_help(agent, target)
-        elif action_type == "examine":
-            await self._do_examine(agent, target)
-        elif action_type == "work":
-            await self._do_work(agent, action.get("job", "working"))
-        elif action_type == "investigate":
-            await self._do_investigate(agent, action.get("mystery", "something"))
-        elif action_type == "wait":
-            logger.debug(f"  {agent.name} rests")
+        handler = self._ACTION_DISPATCH.get(action.type)
+        if handler:
+            await handler(self, agent, action)
+
+    async def _do_wait(self, agent: Agent) -> None:
+        """Agent rests."""
+        logger.debug("  %s rests", agent.name)
 
     async def _do_move(self, agent: Agent, destination_id: str) -> None:
         """Move an agent to a new location."""
-        new_location = self.world.get_location(destination_id)
+        new_location = self._get_location(destination_id)
 
         if new_location:
+            if self._occupants is not None:
+                self._occupants[agent.location_id].remove(agent)
+                self._occupants[destination_id].append(agent)
             agent.location_id = destination_id
-            logger.info(f"  {agent.name} moved to {new_location.name}")
+            logger.info("  %s moved to %s", agent.name, new_location.name)
 
-            await self.world.publish_event(
+            self._emit(
                 EventType.MOVEMENT,
                 f"{agent.name} moved to {new_location.name}",
-                actors=[agent.id],
-                location_id=destination_id,
-            )
-
-            # Store event in database
-            self._record_event(
-                "movement",
-                f"{agent.name} arrived at {new_location.name}",
                 [agent.id],
                 destination_id,
             )
 
             # Check for other agents and potentially generate a greeting
-            others = self.world.get_agents_at_location(destination_id)
-            others = [a for a in others if a.id != agent.id]
+            if self._occupants is not None:
+                here = self._occupants[destination_id]
+            else:
+                here = self.world.get_agents_at_location(destination_id)
+            others = [a for a in here if a.id != agent.id]
 
             if others:
-                perception = self.world.get_agent_perception(agent)
-                comment = generate_arrival_comment(agent, others, perception)
+                # Build perception from what we already have instead of re-querying
+                perception = AgentPerception(
+                    location_name=new_location.name,
+                    nearby_agents=[a.name for a in others],
+                    nearby_objects=new_location.objects_list,
+                )
+                comment = generate_arrival_comment(agent, others, perception, self._rng)
 
                 if comment:
-                    logger.info(f"  {agent.name} greets: {comment}")
+                    logger.info("  %s greets: %s", agent.name, comment)
 
-                    await self.world.publish_event(
+                    self._queue_event(
                         EventType.DIALOGUE,
                         comment,
                         actors=[agent.id],
@@ -451,120 +763,75 @@ class SimulationEngine:
 
     async def _do_greet(self, agent: Agent, target_name: str) -> None:
         """Agent greets another agent."""
-        logger.info(f"  {agent.name} greeted {target_name}")
+        logger.info("  %s greeted %s", agent.name, target_name)
 
-        await self.world.publish_event(
+        self._emit(
             EventType.DIALOGUE,
             f"{agent.name} greeted {target_name}",
-            actors=[agent.id],
-            location_id=agent.location_id,
-            detail=f'{agent.name}: "Hello, {target_name}!"',
-        )
-
-        self._record_event(
-            "dialogue",
-            f"{agent.name} greeted {target_name}",
             [agent.id],
             agent.location_id,
-            f'{agent.name}: "Hello, {target_name}!"',
+            detail=f'{agent.name}: "Hello, {target_name}!"',
         )
 
     async def _do_examine(self, agent: Agent, object_id: str) -> None:
         """Agent examines an object."""
         object_name = format_object_name(object_id)
-        logger.info(f"  {agent.name} examined {object_name}")
+        logger.info("  %s examined %s", agent.name, object_name)
 
-        await self.world.publish_event(
+        self._emit(
             EventType.ACTION,
             f"{agent.name} examined the {object_name}",
-            actors=[agent.id],
-            location_id=agent.location_id,
-        )
-
-        self._record_event(
-            "action",
-            f"{agent.name} examined the {object_name}",
             [agent.id],
             agent.location_id,
         )
 
     async def _do_talk(self, agent: Agent, target_name: str, topic: str) -> None:
         """Agent talks with another agent."""
-        logger.info(f"  {agent.name} talked with {target_name} about {topic}")
+        logger.info("  %s talked with %s about %s", agent.name, target_name, topic)
 
         # Increase social satisfaction
         agent.social = min(10, agent.social + 1)
 
-        await self.world.publish_event(
+        self._emit(
             EventType.DIALOGUE,
             f"{agent.name} chatted with {target_name} about {topic}",
-            actors=[agent.id],
-            location_id=agent.location_id,
-            detail=f'{agent.name} and {target_name} discussed {topic}',
-        )
-
-        self._record_event(
-            "dialogue",
-            f"{agent.name} chatted with {target_name} about {topic}",
             [agent.id],
             agent.location_id,
-            f'{agent.name} and {target_name} discussed {topic}',
+            detail=f'{agent.name} and {target_name} discussed {topic}',
             significance=2,
         )
 
     async def _do_gossip(self, agent: Agent, target_name: str) -> None:
         """Agent gossips with another agent."""
         # Pick a random third party to gossip about
-        all_agents = self.world.get_agents()
+        all_agents = self._tick_agents if self._tick_agents is not None else self.world.get_agents()
         others = [a for a in all_agents if a.name != agent.name and a.name != target_name]
         if not others:
             return
 
-        subject = random.choice(others)
-        rumors = [
-            f"acting strangely lately",
-            f"seen near the forest at odd hours",
-            f"hiding something",
-            f"been very secretive",
-            f"spending a lot of time alone",
-        ]
-        rumor = random.choice(rumors)
+        subject = self._rng.choice(others)
+        rumor = self._rng.choice(_RUMORS)
 
-        logger.info(f"  {agent.name} gossiped with {target_name} about {subject.name}")
+        logger.info("  %s gossiped with %s about %s", agent.name, target_name, subject.name)
 
-        await self.world.publish_event(
+        self._emit(
             EventType.DIALOGUE,
-            f"{agent.name} shared gossip with {target_name}",
-            actors=[agent.id],
-            location_id=agent.location_id,
-            detail=f'{agent.name} whispered to {target_name}: "Have you heard? {subject.name} has been {rumor}..."',
-        )
-
-        self._record_event(
-            "dialogue",
             f"{agent.name} shared gossip about {subject.name} with {target_name}",
             [agent.id],
             agent.location_id,
+            detail=f'{agent.name} whispered to {target_name}: "Have you heard? {subject.name} has been {rumor}..."',
             significance=2,
         )
 
     async def _do_help(self, agent: Agent, target_name: str) -> None:
         """Agent helps another agent."""
-        tasks = ["carry supplies", "with a task", "tidy up", "prepare for the day"]
-        task = random.choice(tasks)
+        task = self._rng.choice(_HELP_TASKS)
 
-        logger.info(f"  {agent.name} helped {target_name} {task}")
+        logger.info("  %s helped %s %s", agent.name, target_name, task)
 
-        await self.world.publish_event(
+        self._emit(
             EventType.ACTION,
             f"{agent.name} helped {target_name} {task}",
-            actors=[agent.id],
-            location_id=agent.location_id,
-        )
-
-        self._record_event(
-            "action",
-            f"{agent.name} helped {target_name} {task}",
             [agent.id],
             agent.location_id,
             significance=2,
@@ -574,44 +841,24 @@ class SimulationEngine:
         """Agent performs work."""
         agent.energy = max(0, agent.energy - 0.5)
 
-        logger.info(f"  {agent.name} is {job_type}")
+        logger.info("  %s is %s", agent.name, job_type)
 
-        await self.world.publish_event(
+        self._emit(
             EventType.ACTION,
             f"{agent.name} is busy {job_type}",
-            actors=[agent.id],
-            location_id=agent.location_id,
-        )
-
-        self._record_event(
-            "action",
-            f"{agent.name} worked on {job_type}",
             [agent.id],
             agent.location_id,
         )
 
     async def _do_investigate(self, agent: Agent, mystery: str) -> None:
         """Agent investigates something mysterious."""
-        logger.info(f"  {agent.name} investigated {mystery}")
+        logger.info("  %s investigated %s", agent.name, mystery)
 
-        outcomes = [
-            f"but found nothing unusual",
-            f"and noticed something odd",
-            f"and grew more curious",
-            f"but was interrupted",
-        ]
-        outcome = random.choice(outcomes)
+        outcome = self._rng.choice(_INVESTIGATION_OUTCOMES)
 
-        await self.world.publish_event(
+        self._emit(
             EventType.ACTION,
             f"{agent.name} investigated {mystery} {outcome}",
-            actors=[agent.id],
-            location_id=agent.location_id,
-        )
-
-        self._record_event(
-            "action",
-            f"{agent.name} investigated {mystery}",
             [agent.id],
             agent.location_id,
             significance=2,
@@ -619,14 +866,14 @@ class SimulationEngine:
 
     async def _do_idle_behavior(self, agent: Agent, perception: AgentPerception) -> None:
         """Agent does an idle behavior - thoughts, observations, small actions."""
-        behavior = get_idle_behavior(agent, perception)
+        behavior = get_idle_behavior(agent, perception, self._rng)
 
         if behavior is None:
             # Truly do nothing (rare)
-            logger.debug(f"  {agent.name} does nothing")
+            logger.debug("  %s does nothing", agent.name)
             return
 
-        logger.debug(f"  {agent.name} idle: {behavior.content}")
+        logger.debug("  %s idle: %s", agent.name, behavior.content)
 
         # Map behavior type to event type
         event_type = EventType.ACTION
@@ -635,7 +882,7 @@ class SimulationEngine:
         elif behavior.type == "observation":
             event_type = EventType.DISCOVERY
 
-        await self.world.publish_event(
+        self._queue_event(
             event_type,
             behavior.content,
             actors=[agent.id],
@@ -644,11 +891,15 @@ class SimulationEngine:
         )
 
     async def _check_village_events(
-        self, agents: list[Agent], current_hour: float, current_day: int
+        self,
+        agents: list[Agent],
+        current_hour: float,
+        current_day: int,
+        now_ts: int | None = None,
     ) -> None:
         """Check for and process village-wide dramatic events (LIFE-29)."""
         village_event = check_random_village_event(
-            self.world.db, agents, current_hour, current_day
+            self.world.db, agents, current_hour, current_day, now_ts=now_ts or self._now()
         )
 
         if village_event:
@@ -657,38 +908,55 @@ class SimulationEngine:
             await self.world.publish_event(
                 EventType.SYSTEM,
                 village_event.description,
-                actors=village_event.affected_agents[:5],  # Limit actor list
+                actors=_cap_actors(village_event.affected_agents),  # Limit actor list
                 location_id=village_event.location_id,
                 significance=village_event.significance,
+                timestamp=self._now(),
             )
 
-    def _record_event(
+    def _emit(
         self,
-        event_type: str,
+        event_type: EventType,
         summary: str,
         actors: list[str],
         location_id: str | None,
         detail: str | None = None,
         significance: int = 1,
     ) -> None:
-        """Record an event to the database."""
-        import json
-
-        event = Event(
-            timestamp=int(time.time()),
-            type=event_type,
-            actors=json.dumps(actors),
-            location_id=location_id,
-            summary=summary,
-            detail=detail,
-            significance=significance,
+        """Publish an event with the tick's batch and record it in the event log.
+
+        The row is inserted at the end of the tick by ``_flush_events``.
+        """
+        self._tick_event_buffer.append(
+            (event_type, summary, actors, location_id, detail, significance)
+        )
+        self._pending_events.append(
+            {
+                "timestamp": self._now(),
+                "type": event_type.value,
+                "actors": json.dumps(actors),
+                "location_id": location_id,
+                "summary": summary,
+                "detail": detail,
+                "significance": significance,
+            }
         )
-        self.world.db.add(event)
+
+    def _flush_events(self) -> None:
+        """Insert all queued events with a single executemany."""
+        if not self._pending_events:
+            return
+        self.world.db.execute(insert(Event), self._pending_events)
+        self._pending_events.clear()
 
     def get_narrative_context(self, agent_id: str) -> str:
         """Get narrative context for an agent (for LLM prompts)."""
         return self.narratives.get_agent_narrative_context(agent_id)
 
+    def get_narrative_contexts(self, agent_ids: list[str]) -> dict[str, str]:
+        """Get narrative context for several agents at once, keyed by agent id."""
+        return self.narratives.get_agent_narrative_contexts(agent_ids)
+
     def get_story_digest(self) -> dict:
         """Get a story digest of current narrative activity."""
         return self.narratives.generate_story_digest()
@@ -724,7 +992,15 @@ def main():
     parser.add_argument("--use-llm", action="store_true", help="Use LLM for decisions (Phase 4)")
     args = parser.parse_args()
 
-    asyncio.run(run_simulation(num_ticks=args.ticks, tick_interval=args.interval))
+    simulation = run_simulation(num_ticks=args.ticks, tick_interval=args.interval)
+
+    # Prefer uvloop's faster event loop when available (installed with uvicorn[standard])
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(simulation)
+    else:
+        uvloop.run(simulation)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 """Event bus for broadcasting simulation events."""
 
 import asyncio
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 
@@ -22,18 +24,26 @@ class EventType(Enum):
     HEALTH = "health"  # DASH-14: Simulation health updates
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationEvent:
-    """An event in the simulation."""
+    """An event in the simulation.
+
+    ``actors`` and ``data`` are None rather than empty when unused; serializers
+    treat None as empty.
+    """
 
     type: EventType
     summary: str
     timestamp: int
-    actors: list[str] = field(default_factory=list)
+    actors: list[str] | None = None
     location_id: str | None = None
     detail: str | None = None
     significance: int = 1
-    data: dict[str, Any] = field(default_factory=dict)
+    data: dict[str, Any] | None = None
+
+
+# Events buffered per subscriber; slow consumers lose the oldest events first
+SUBSCRIBER_QUEUE_SIZE = 256
 
 
 class EventBus:
@@ -41,12 +51,12 @@ class EventBus:
 
     def __init__(self):
         self._subscribers: list[asyncio.Queue] = []
-        self._history: list[SimulationEvent] = []
         self._max_history = 1000
+        self._history: deque[SimulationEvent] = deque(maxlen=self._max_history)
 
     def subscribe(self) -> asyncio.Queue:
         """Subscribe to events. Returns a queue that will receive events."""
-        queue: asyncio.Queue = asyncio.Queue()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
         self._subscribers.append(queue)
         return queue
 
@@ -57,20 +67,61 @@ class EventBus:
 
     async def publish(self, event: SimulationEvent) -> None:
         """Publish an event to all subscribers."""
+        self.publish_nowait(event)
+
+    def publish_nowait(self, event: SimulationEvent) -> None:
+        """Publish an event from synchronous code."""
         self._history.append(event)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history :]
 
+        dead = None
         for queue in self._subscribers:
             try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                # Drop event if queue is full
-                pass
+                _put_dropping_oldest(queue, event)
+            except Exception:
+                # Queue is unusable, e.g. its event loop has closed
+                if dead is None:
+                    dead = []
+                dead.append(queue)
+
+        if dead:
+            self._drop_subscribers(dead)
+
+    async def publish_many(self, events: list[SimulationEvent]) -> None:
+        """Publish several events to all subscribers in one call."""
+        self._history.extend(events)
+
+        dead = None
+        for queue in self._subscribers:
+            for event in events:
+                try:
+                    _put_dropping_oldest(queue, event)
+                except Exception:
+                    # Queue is unusable, e.g. its event loop has closed
+                    if dead is None:
+                        dead = []
+                    dead.append(queue)
+                    break
+
+        if dead:
+            self._drop_subscribers(dead)
+
+    def _drop_subscribers(self, dead: list[asyncio.Queue]) -> None:
+        """Remove unusable subscriber queues, replacing the list rather than mutating it."""
+        self._subscribers = [q for q in self._subscribers if q not in dead]
 
     def get_history(self, limit: int = 100) -> list[SimulationEvent]:
         """Get recent event history."""
-        return self._history[-limit:]
+        history = self._history
+        return list(islice(history, max(0, len(history) - limit), None))
+
+
+def _put_dropping_oldest(queue: asyncio.Queue, event: SimulationEvent) -> None:
+    """Enqueue an event, discarding the oldest queued event if the queue is full."""
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(event)
 
 
 # Global event bus instance
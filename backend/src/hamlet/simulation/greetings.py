@@ -5,13 +5,118 @@ they may make a relationship-aware comment based on their personality.
 """
 
 import random
+import re
 
 from hamlet.db import Agent
 from hamlet.simulation.world import AgentPerception
 
+# Greeting templates, formatted with the arriving agent's {name} and the {other} agent's name
+
+# Friends: high charm is warm and effusive, average is friendly but measured,
+# low is awkward but genuine
+_FRIENDLY_HIGH_CHARM = (
+    '{name} beams at {other}: "Ah, just the person I was hoping to see!"',
+    '{name} greets {other} warmly: "What a pleasant surprise!"',
+    '{name} waves enthusiastically at {other}: "There you are!"',
+    '{name} smiles broadly at {other}: "Always a pleasure, my friend!"',
+)
+_FRIENDLY_MID_CHARM = (
+    '{name} nods at {other}: "Good to see you."',
+    '{name} greets {other}: "Hello there, friend."',
+    '{name} waves at {other}: "Fancy meeting you here."',
+)
+_FRIENDLY_LOW_CHARM = (
+    "{name} gives {other} an awkward but sincere wave",
+    '{name} mumbles at {other}: "Oh, um, hello..."',
+    "{name} nods stiffly but with warmth at {other}",
+)
+
+# Rivals: high charm is icy politeness, average is barely civil,
+# low is openly awkward hostility
+_RIVAL_HIGH_CHARM = (
+    '{name} regards {other} coolly: "Ah. You\'re here."',
+    "{name} offers {other} a thin, polite smile",
+    '{name} nods curtly at {other}: "Good day."',
+)
+_RIVAL_MID_CHARM = (
+    "{name} barely acknowledges {other} with a glance",
+    '{name} mutters at {other}: "Oh. It\'s you."',
+    "{name} gives {other} a pointed look",
+)
+_RIVAL_LOW_CHARM = (
+    "{name} stiffens upon seeing {other}",
+    "{name} avoids eye contact with {other}",
+    "{name} grimaces slightly at the sight of {other}",
+)
+
+_ACQUAINTANCE_HIGH_CHARM = (
+    '{name} greets {other} pleasantly: "Hello!"',
+    '{name} smiles at {other}: "Nice to see you."',
+    '{name} tips their head at {other}: "Good day to you."',
+)
+_ACQUAINTANCE_MID_CHARM = (
+    "{name} nods at {other}",
+    '{name} acknowledges {other}: "Hello."',
+    "{name} offers {other} a brief wave",
+)
+_ACQUAINTANCE_LOW_CHARM = (
+    "{name} gives {other} an uncertain nod",
+    "{name} mutters a greeting to {other}",
+    "{name} glances awkwardly at {other}",
+)
+
+# Strangers: high charm greetings depend on the location
+_STRANGER_TAVERN = (
+    '{name} calls out to the room: "Good evening, everyone!"',
+    '{name} surveys the tavern and nods: "A fine gathering tonight."',
+)
+_STRANGER_CHURCH = (
+    "{name} enters quietly and nods respectfully to those present",
+    '{name} whispers a soft: "Blessings upon you all."',
+)
+_STRANGER_SQUARE = (
+    '{name} waves to the assembled crowd: "Lovely day, isn\'t it?"',
+    "{name} greets the gathered villagers with a warm smile",
+)
+_STRANGER_HIGH_CHARM = (
+    '{name} announces their arrival: "Hello there!"',
+    '{name} greets {other} with a friendly: "Good day!"',
+)
+_STRANGER_MID_CHARM = (
+    "{name} nods at {other} upon entering",
+    '{name} offers a polite: "Hello."',
+    "{name} acknowledges the others present",
+)
+_STRANGER_LOW_CHARM = (
+    "{name} shuffles in without making eye contact",
+    "{name} enters hesitantly, avoiding attention",
+    '{name} mumbles something that might be: "Hello..."',
+)
+
+# High-charm stranger greetings for locations whose name contains a keyword; when a
+# name holds several, the keyword listed first wins
+_STRANGER_LOCATION_GREETINGS = {
+    "tavern": _STRANGER_TAVERN,
+    "church": _STRANGER_CHURCH,
+    "square": _STRANGER_SQUARE,
+    "market": _STRANGER_SQUARE,
+}
+_STRANGER_LOCATION_PATTERN = re.compile(
+    "(?=(" + "|".join(_STRANGER_LOCATION_GREETINGS) + "))", re.IGNORECASE
+)
+_STRANGER_LOCATION_PRIORITY = {
+    keyword: rank for rank, keyword in enumerate(_STRANGER_LOCATION_GREETINGS)
+}
+
+# Greeting priority by relationship, lowest greeted first
+_FRIEND, _RIVAL, _ACQUAINTANCE, _STRANGER = range(4)
+
 
 def generate_arrival_comment(
-    agent: Agent, others: list[Agent], perception: AgentPerception
+    agent: Agent,
+    others: list[Agent],
+    perception: AgentPerception,
+    rng: random.Random | None = None,
 ) -> str | None:
     """Generate a relationship-aware greeting when arriving at a location.
 
@@ -19,12 +124,15 @@ def generate_arrival_comment(
         agent: The agent who just arrived
         others: List of other agents already at the location
         perception: The arriving agent's perception of the location
+        rng: Random generator to draw from (defaults to the ``random`` module)
 
     Returns:
         A greeting/comment string, or None if the agent stays silent
     """
+    rng = rng or random
+
     # 30% chance to say nothing
-    if random.random() < 0.3:
+    if rng.random() < 0.3:
         return None
 
     if not others:
@@ -33,168 +141,103 @@ def generate_arrival_comment(
     traits = agent.traits_dict
     charm = traits.get("charm", 5)
 
-    # Build relationship map for the arriving agent
-    relationships = {}
-    for rel in agent.relationships_as_source:
-        relationships[rel.target_id] = {
-            "type": rel.type,
-            "score": rel.score,
-        }
-
-    # Find the most significant person to greet
-    # Priority: friends > acquaintances > strangers > rivals
-    friends = []
-    acquaintances = []
-    strangers = []
-    rivals = []
+    # Relationships from the arriving agent, by the other agent's id
+    relationships = {rel.target_id: rel for rel in agent.relationships_as_source}
 
+    # Find the most significant person to greet in one pass, picking uniformly
+    # among equally significant people
+    best_priority = _STRANGER + 1
+    target = None
+    ties = 0
     for other in others:
         rel = relationships.get(other.id)
-        if rel:
-            rel_type = rel["type"]
-            if rel_type == "friend" or rel["score"] >= 5:
-                friends.append(other)
-            elif rel_type == "rival" or rel["score"] <= -5:
-                rivals.append(other)
-            elif rel_type == "acquaintance":
-                acquaintances.append(other)
-            else:
-                strangers.append(other)
-        else:
-            strangers.append(other)
-
-    # Select who to greet and how
-    if friends:
-        target = random.choice(friends)
-        return _friendly_greeting(agent, target, charm)
-    elif rivals:
-        target = random.choice(rivals)
-        return _rival_acknowledgment(agent, target, charm)
-    elif acquaintances:
-        target = random.choice(acquaintances)
-        return _acquaintance_greeting(agent, target, charm)
-    elif strangers:
-        target = random.choice(strangers)
-        return _stranger_greeting(agent, target, charm, perception)
-    else:
-        return None
-
-
-def _friendly_greeting(agent: Agent, friend: Agent, charm: int) -> str:
+        priority = _relationship_priority(rel.type, rel.score) if rel else _STRANGER
+        if priority < best_priority:
+            best_priority = priority
+            target = other
+            ties = 1
+        elif priority == best_priority:
+            ties += 1
+            if rng.randrange(ties) == 0:
+                target = other
+
+    if best_priority == _FRIEND:
+        return _friendly_greeting(agent, target, charm, rng)
+    if best_priority == _RIVAL:
+        return _rival_acknowledgment(agent, target, charm, rng)
+    if best_priority == _ACQUAINTANCE:
+        return _acquaintance_greeting(agent, target, charm, rng)
+    return _stranger_greeting(agent, target, charm, perception, rng)
+
+
+def _relationship_priority(rel_type: str, score: int) -> int:
+    """Rank a relationship for greeting: friends > rivals > acquaintances > strangers."""
+    if rel_type == "friend" or score >= 5:
+        return _FRIEND
+    if rel_type == "rival" or score <= -5:
+        return _RIVAL
+    if rel_type == "acquaintance":
+        return _ACQUAINTANCE
+    return _STRANGER
+
+
+def _friendly_greeting(agent: Agent, friend: Agent, charm: int, rng: random.Random) -> str:
     """Generate a warm greeting for a friend."""
     if charm >= 7:
-        # High charm - warm and effusive
-        greetings = [
-            f'{agent.name} beams at {friend.name}: "Ah, just the person I was hoping to see!"',
-            f'{agent.name} greets {friend.name} warmly: "What a pleasant surprise!"',
-            f'{agent.name} waves enthusiastically at {friend.name}: "There you are!"',
-            f'{agent.name} smiles broadly at {friend.name}: "Always a pleasure, my friend!"',
-        ]
+        templates = _FRIENDLY_HIGH_CHARM
     elif charm >= 4:
-        # Average charm - friendly but measured
-        greetings = [
-            f'{agent.name} nods at {friend.name}: "Good to see you."',
-            f'{agent.name} greets {friend.name}: "Hello there, friend."',
-            f'{agent.name} waves at {friend.name}: "Fancy meeting you here."',
-        ]
+        templates = _FRIENDLY_MID_CHARM
     else:
-        # Low charm - awkward but genuine
-        greetings = [
-            f"{agent.name} gives {friend.name} an awkward but sincere wave",
-            f'{agent.name} mumbles at {friend.name}: "Oh, um, hello..."',
-            f"{agent.name} nods stiffly but with warmth at {friend.name}",
-        ]
-    return random.choice(greetings)
+        templates = _FRIENDLY_LOW_CHARM
+    return rng.choice(templates).format(name=agent.name, other=friend.name)
 
 
-def _rival_acknowledgment(agent: Agent, rival: Agent, charm: int) -> str:
+def _rival_acknowledgment(agent: Agent, rival: Agent, charm: int, rng: random.Random) -> str:
     """Generate a cold acknowledgment for a rival."""
     if charm >= 7:
-        # High charm - icy politeness
-        acknowledgments = [
-            f'{agent.name} regards {rival.name} coolly: "Ah. You\'re here."',
-            f"{agent.name} offers {rival.name} a thin, polite smile",
-            f'{agent.name} nods curtly at {rival.name}: "Good day."',
-        ]
+        templates = _RIVAL_HIGH_CHARM
     elif charm >= 4:
-        # Average charm - barely civil
-        acknowledgments = [
-            f"{agent.name} barely acknowledges {rival.name} with a glance",
-            f'{agent.name} mutters at {rival.name}: "Oh. It\'s you."',
-            f"{agent.name} gives {rival.name} a pointed look",
-        ]
+        templates = _RIVAL_MID_CHARM
     else:
-        # Low charm - openly awkward hostility
-        acknowledgments = [
-            f"{agent.name} stiffens upon seeing {rival.name}",
-            f"{agent.name} avoids eye contact with {rival.name}",
-            f"{agent.name} grimaces slightly at the sight of {rival.name}",
-        ]
-    return random.choice(acknowledgments)
+        templates = _RIVAL_LOW_CHARM
+    return rng.choice(templates).format(name=agent.name, other=rival.name)
 
 
-def _acquaintance_greeting(agent: Agent, acquaintance: Agent, charm: int) -> str:
+def _acquaintance_greeting(
+    agent: Agent, acquaintance: Agent, charm: int, rng: random.Random
+) -> str:
     """Generate a casual greeting for an acquaintance."""
     if charm >= 7:
-        greetings = [
-            f'{agent.name} greets {acquaintance.name} pleasantly: "Hello!"',
-            f'{agent.name} smiles at {acquaintance.name}: "Nice to see you."',
-            f'{agent.name} tips their head at {acquaintance.name}: "Good day to you."',
-        ]
+        templates = _ACQUAINTANCE_HIGH_CHARM
     elif charm >= 4:
-        greetings = [
-            f"{agent.name} nods at {acquaintance.name}",
-            f'{agent.name} acknowledges {acquaintance.name}: "Hello."',
-            f"{agent.name} offers {acquaintance.name} a brief wave",
-        ]
+        templates = _ACQUAINTANCE_MID_CHARM
     else:
-        greetings = [
-            f"{agent.name} gives {acquaintance.name} an uncertain nod",
-            f'{agent.name} mutters a greeting to {acquaintance.name}',
-            f"{agent.name} glances awkwardly at {acquaintance.name}",
-        ]
-    return random.choice(greetings)
+        templates = _ACQUAINTANCE_LOW_CHARM
+    return rng.choice(templates).format(name=agent.name, other=acquaintance.name)
 
 
 def _stranger_greeting(
-    agent: Agent, stranger: Agent, charm: int, perception: AgentPerception
+    agent: Agent,
+    stranger: Agent,
+    charm: int,
+    perception: AgentPerception,
+    rng: random.Random,
 ) -> str:
     """Generate a greeting for a stranger, possibly location-aware."""
-    location = perception.location_name.lower()
-
     # Location-specific greetings for high charm
     if charm >= 7:
-        if "tavern" in location:
-            greetings = [
-                f'{agent.name} calls out to the room: "Good evening, everyone!"',
-                f'{agent.name} surveys the tavern and nods: "A fine gathering tonight."',
-            ]
-        elif "church" in location:
-            greetings = [
-                f"{agent.name} enters quietly and nods respectfully to those present",
-                f'{agent.name} whispers a soft: "Blessings upon you all."',
-            ]
-        elif "square" in location or "market" in location:
-            greetings = [
-                f'{agent.name} waves to the assembled crowd: "Lovely day, isn\'t it?"',
-                f"{agent.name} greets the gathered villagers with a warm smile",
-            ]
+        keywords = {
+            match.group(1).lower()
+            for match in _STRANGER_LOCATION_PATTERN.finditer(perception.location_name)
+        }
+        if keywords:
+            keyword = min(keywords, key=_STRANGER_LOCATION_PRIORITY.__getitem__)
+            templates = _STRANGER_LOCATION_GREETINGS[keyword]
         else:
-            greetings = [
-                f'{agent.name} announces their arrival: "Hello there!"',
-                f'{agent.name} greets {stranger.name} with a friendly: "Good day!"',
-            ]
+            templates = _STRANGER_HIGH_CHARM
     elif charm >= 4:
-        greetings = [
-            f"{agent.name} nods at {stranger.name} upon entering",
-            f'{agent.name} offers a polite: "Hello."',
-            f"{agent.name} acknowledges the others present",
-        ]
+        templates = _STRANGER_MID_CHARM
     else:
         # Low charm - awkward entrance
-        greetings = [
-            f"{agent.name} shuffles in without making eye contact",
-            f"{agent.name} enters hesitantly, avoiding attention",
-            f'{agent.name} mumbles something that might be: "Hello..."',
-        ]
-    return random.choice(greetings)
+        templates = _STRANGER_LOW_CHARM
+    return rng.choice(templates).format(name=agent.name, other=stranger.name)
@@ -9,11 +9,157 @@ Instead of agents doing "nothing", they can:
 """
 
 import random
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 
 from hamlet.db import Agent
 from hamlet.simulation.world import AgentPerception
 
+# Idle phrase templates, formatted with the agent's {name} (and an {obj} or
+# {other} agent where noted)
+_HUNGER_THOUGHTS = (
+    "{name} thinks about food",
+    "{name}'s stomach growls audibly",
+    "{name} wonders what's for supper",
+    "{name} dreams of fresh bread",
+    "{name} contemplates the bakery's hours",
+)
+
+_TIREDNESS_THOUGHTS = (
+    "{name} suppresses a yawn",
+    "{name} rubs tired eyes",
+    "{name} longs for a soft bed",
+    "{name} considers a quick nap",
+    "{name}'s eyelids grow heavy",
+)
+
+_LONELINESS_THOUGHTS = (
+    "{name} feels a bit isolated",
+    "{name} wishes for some company",
+    "{name} thinks about old friends",
+    "{name} considers seeking someone out",
+    "{name} sighs quietly to themselves",
+)
+
+_HAPPY_ACTIONS = (
+    "{name} hums a cheerful tune",
+    "{name} smiles to themselves",
+    "{name} walks with a spring in their step",
+    "{name} whistles softly",
+    "{name} chuckles at a private thought",
+)
+
+_UNHAPPY_ACTIONS = (
+    "{name} sighs heavily",
+    "{name} frowns at nothing in particular",
+    "{name} stares at the ground",
+    "{name} fidgets restlessly",
+    "{name} mutters under their breath",
+)
+
+# Curious thoughts about a nearby {obj}, or general musings when there is none
+_CURIOUS_OBJECT_THOUGHTS = (
+    "{name} wonders about the history of the {obj}",
+    "{name} considers examining the {obj} more closely",
+    "{name} notices something odd about the {obj}",
+)
+_CURIOUS_THOUGHTS = (
+    "{name} wonders what secrets this place holds",
+    "{name} mentally catalogs today's observations",
+    "{name} ponders the village's mysteries",
+)
+
+_INDISCREET_MUTTERS = (
+    "{name} mutters about village gossip",
+    "{name} talks to themselves about recent events",
+    "{name} accidentally speaks their thoughts aloud",
+    "{name} mumbles something probably best kept private",
+    "{name} narrates their own actions under their breath",
+)
+
+# Perceptive observations about a nearby {other} agent, or the surroundings
+_PERCEPTIVE_AGENT_OBSERVATIONS = (
+    "{name} notices {other} seems distracted",
+    "{name} observes {other}'s unusual demeanor",
+    "{name} catches {other} glancing around nervously",
+)
+_PERCEPTIVE_OBSERVATIONS = (
+    "{name} notices the subtle shift in the air",
+    "{name} spots something others might miss",
+    "{name} takes mental note of their surroundings",
+    "{name} listens to the ambient sounds",
+)
+
+_CHARMING_ACTIONS = (
+    "{name} adjusts their appearance",
+    "{name} practices a winning smile",
+    "{name} smooths down their clothes",
+    "{name} strikes a casual but flattering pose",
+)
+
+# Location kinds, checked in order against the lowercased location name
+_LOCATION_KEYWORDS = (
+    ("bakery", ("bakery",)),
+    ("tavern", ("tavern",)),
+    ("church", ("church",)),
+    ("square", ("square",)),
+    ("forge", ("blacksmith", "forge")),
+    ("farm", ("garden", "farm")),
+    ("inn", ("inn",)),
+    ("cemetery", ("cemetery",)),
+    ("forest", ("forest",)),
+)
+
+# One case-insensitive pattern over all keywords, as a lookahead so every occurrence
+# is found; the named group that matched is the kind. When a name holds keywords of
+# several kinds, the kind listed first above wins.
+_LOCATION_PATTERN = re.compile(
+    "(?="
+    + "|".join(f"(?P<{kind}>{'|'.join(keywords)})" for kind, keywords in _LOCATION_KEYWORDS)
+    + ")",
+    re.IGNORECASE,
+)
+_LOCATION_PRIORITY = {kind: rank for rank, (kind, _) in enumerate(_LOCATION_KEYWORDS)}
+
+# Location-specific idle behaviors as (type, template) pairs, by location kind
+_LOCATION_IDLE_TABLE: dict[str | None, tuple[tuple[str, str], ...]] = {
+    "bakery": (
+        ("observation", "{name} inhales the aroma of fresh bread"),
+    ),
+    "tavern": (
+        ("action", "{name} drums fingers on the bar"),
+        ("observation", "{name} watches the fireplace crackle"),
+    ),
+    "church": (
+        ("action", "{name} bows their head in quiet reflection"),
+        ("observation", "{name} admires the stained glass"),
+    ),
+    "square": (
+        ("action", "{name} watches villagers pass by"),
+        ("observation", "{name} listens to the fountain"),
+    ),
+    "forge": (
+        ("observation", "{name} watches the sparks fly"),
+    ),
+    "farm": (
+        ("action", "{name} brushes dirt from their hands"),
+        ("observation", "{name} checks the state of the crops"),
+    ),
+    "inn": (
+        ("action", "{name} leafs through the guest book"),
+    ),
+    "cemetery": (
+        ("action", "{name} pays silent respects"),
+        ("thought", "{name} reflects on mortality"),
+    ),
+    "forest": (
+        ("observation", "{name} listens to the rustling leaves"),
+        ("thought", "{name} feels the forest watching back"),
+    ),
+}
+
 
 @dataclass
 class IdleBehavior:
@@ -24,273 +170,165 @@ class IdleBehavior:
     significance: int = 1  # 1-3, for event importance
 
 
-def get_idle_behavior(agent: Agent, perception: AgentPerception) -> IdleBehavior | None:
+def get_idle_behavior(
+    agent: Agent, perception: AgentPerception, rng: random.Random | None = None
+) -> IdleBehavior | None:
     """Generate a personality-driven idle behavior for an agent.
 
+    Random draws come from ``rng`` when given, else the ``random`` module.
     Returns None if the agent should truly do nothing (rare).
     """
+    rng = rng or random
+
+    # 10% chance to truly do nothing (silence is golden)
+    if rng.random() < 0.1:
+        return None
+
     traits = agent.traits_dict
     mood = agent.mood_dict
+    name = agent.name
 
-    # Gather possible behaviors with weights
-    behaviors: list[tuple[IdleBehavior, int]] = []
+    # Gather possible behaviors as ((type, content factory), weight); only the
+    # chosen behavior's content is ever generated
+    behaviors: list[tuple[tuple[str, Callable[[], str]], int]] = []
+    add = behaviors.append
 
     # === NEED-BASED THOUGHTS ===
     if agent.hunger >= 6:
-        behaviors.append((
-            IdleBehavior("thought", _hunger_thought(agent), 1),
-            3
-        ))
+        add((("thought", lambda: _hunger_thought(agent, rng)), 3))
     if agent.energy <= 4:
-        behaviors.append((
-            IdleBehavior("thought", _tiredness_thought(agent), 1),
-            3
-        ))
+        add((("thought", lambda: _tiredness_thought(agent, rng)), 3))
     if agent.social <= 3:
-        behaviors.append((
-            IdleBehavior("thought", _loneliness_thought(agent), 1),
-            3
-        ))
+        add((("thought", lambda: _loneliness_thought(agent, rng)), 3))
 
     # === MOOD-BASED BEHAVIORS ===
     happiness = mood.get("happiness", 5)
     if happiness >= 8:
-        behaviors.append((
-            IdleBehavior("action", _happy_action(agent), 1),
-            2
-        ))
+        add((("action", lambda: _happy_action(agent, rng)), 2))
     elif happiness <= 3:
-        behaviors.append((
-            IdleBehavior("action", _unhappy_action(agent), 1),
-            2
-        ))
+        add((("action", lambda: _unhappy_action(agent, rng)), 2))
 
     # === TRAIT-BASED BEHAVIORS ===
 
     # High curiosity - observe and wonder
     if traits.get("curiosity", 5) >= 7:
         if perception.nearby_objects:
-            obj = random.choice(perception.nearby_objects)
-            behaviors.append((
-                IdleBehavior("observation", f"{agent.name} eyes the {obj} with interest", 1),
-                2
+            add((
+                (
+                    "observation",
+                    lambda: f"{name} eyes the {rng.choice(perception.nearby_objects)} "
+                    "with interest",
+                ),
+                2,
             ))
-        behaviors.append((
-            IdleBehavior("thought", _curious_thought(agent, perception), 1),
-            2
-        ))
+        add((("thought", lambda: _curious_thought(agent, perception, rng)), 2))
 
     # Low discretion - mutter to self
     if traits.get("discretion", 5) <= 3:
-        behaviors.append((
-            IdleBehavior("mutter", _indiscreet_mutter(agent), 1),
-            3
-        ))
+        add((("mutter", lambda: _indiscreet_mutter(agent, rng)), 3))
 
     # High perception - notice details
     if traits.get("perception", 5) >= 7:
-        behaviors.append((
-            IdleBehavior("observation", _perceptive_observation(agent, perception), 1),
-            2
-        ))
+        add((("observation", lambda: _perceptive_observation(agent, perception, rng)), 2))
 
     # High empathy + nearby people - concern for others
     if traits.get("empathy", 5) >= 7 and perception.nearby_agents:
-        other = random.choice(perception.nearby_agents)
-        behaviors.append((
-            IdleBehavior("thought", f"{agent.name} wonders how {other} is really doing", 1),
-            2
+        add((
+            (
+                "thought",
+                lambda: f"{name} wonders how {rng.choice(perception.nearby_agents)} "
+                "is really doing",
+            ),
+            2,
         ))
 
     # Low energy - physical fidgeting
     if traits.get("energy", 5) <= 3:
-        behaviors.append((
-            IdleBehavior("action", f"{agent.name} stifles a yawn", 1),
-            2
-        ))
+        add((("action", lambda: f"{name} stifles a yawn"), 2))
 
     # High charm - preening
     if traits.get("charm", 5) >= 7:
-        behaviors.append((
-            IdleBehavior("action", _charming_action(agent), 1),
-            1
-        ))
+        add((("action", lambda: _charming_action(agent, rng)), 1))
 
     # === LOCATION-BASED BEHAVIORS ===
-    location_behaviors = _location_idle(agent, perception)
-    for b in location_behaviors:
-        behaviors.append((b, 1))
+    for behavior_type, template in _location_idle(perception):
+        add(((behavior_type, lambda template=template: template.format(name=name)), 1))
 
     # === UNIVERSAL IDLE BEHAVIORS ===
-    behaviors.append((
-        IdleBehavior("action", f"{agent.name} gazes into the distance", 1),
-        1
-    ))
-    behaviors.append((
-        IdleBehavior("action", f"{agent.name} stretches", 1),
-        1
-    ))
+    add((("action", lambda: f"{name} gazes into the distance"), 1))
+    add((("action", lambda: f"{name} stretches"), 1))
 
-    # 10% chance to truly do nothing (silence is golden)
-    if random.random() < 0.1:
-        return None
-
-    if not behaviors:
-        return None
-
-    # Weighted random selection
+    # Weighted random selection, then generate the winner's content
     options, weights = zip(*behaviors)
-    return random.choices(options, weights=weights, k=1)[0]
+    behavior_type, content = rng.choices(options, weights=weights, k=1)[0]
+    return IdleBehavior(behavior_type, content(), 1)
 
 
-def _hunger_thought(agent: Agent) -> str:
+def _hunger_thought(agent: Agent, rng: random.Random) -> str:
     """Generate a hunger-related thought."""
-    thoughts = [
-        f"{agent.name} thinks about food",
-        f"{agent.name}'s stomach growls audibly",
-        f"{agent.name} wonders what's for supper",
-        f"{agent.name} dreams of fresh bread",
-        f"{agent.name} contemplates the bakery's hours",
-    ]
-    return random.choice(thoughts)
+    return rng.choice(_HUNGER_THOUGHTS).format(name=agent.name)
 
 
-def _tiredness_thought(agent: Agent) -> str:
+def _tiredness_thought(agent: Agent, rng: random.Random) -> str:
     """Generate a tiredness-related thought."""
-    thoughts = [
-        f"{agent.name} suppresses a yawn",
-        f"{agent.name} rubs tired eyes",
-        f"{agent.name} longs for a soft bed",
-        f"{agent.name} considers a quick nap",
-        f"{agent.name}'s eyelids grow heavy",
-    ]
-    return random.choice(thoughts)
+    return rng.choice(_TIREDNESS_THOUGHTS).format(name=agent.name)
 
 
-def _loneliness_thought(agent: Agent) -> str:
+def _loneliness_thought(agent: Agent, rng: random.Random) -> str:
     """Generate a loneliness-related thought."""
-    thoughts = [
-        f"{agent.name} feels a bit isolated",
-        f"{agent.name} wishes for some company",
-        f"{agent.name} thinks about old friends",
-        f"{agent.name} considers seeking someone out",
-        f"{agent.name} sighs quietly to themselves",
-    ]
-    return random.choice(thoughts)
+    return rng.choice(_LONELINESS_THOUGHTS).format(name=agent.name)
 
 
-def _happy_action(agent: Agent) -> str:
+def _happy_action(agent: Agent, rng: random.Random) -> str:
     """Generate a happy behavior."""
-    actions = [
-        f"{agent.name} hums a cheerful tune",
-        f"{agent.name} smiles to themselves",
-        f"{agent.name} walks with a spring in their step",
-        f"{agent.name} whistles softly",
-        f"{agent.name} chuckles at a private thought",
-    ]
-    return random.choice(actions)
+    return rng.choice(_HAPPY_ACTIONS).format(name=agent.name)
 
 
-def _unhappy_action(agent: Agent) -> str:
+def _unhappy_action(agent: Agent, rng: random.Random) -> str:
     """Generate an unhappy behavior."""
-    actions = [
-        f"{agent.name} sighs heavily",
-        f"{agent.name} frowns at nothing in particular",
-        f"{agent.name} stares at the ground",
-        f"{agent.name} fidgets restlessly",
-        f"{agent.name} mutters under their breath",
-    ]
-    return random.choice(actions)
+    return rng.choice(_UNHAPPY_ACTIONS).format(name=agent.name)
 
 
-def _curious_thought(agent: Agent, perception: AgentPerception) -> str:
+def _curious_thought(
+    agent: Agent, perception: AgentPerception, rng: random.Random
+) -> str:
     """Generate a curiosity-driven thought."""
     if perception.nearby_objects:
-        obj = random.choice(perception.nearby_objects)
-        thoughts = [
-            f"{agent.name} wonders about the history of the {obj}",
-            f"{agent.name} considers examining the {obj} more closely",
-            f"{agent.name} notices something odd about the {obj}",
-        ]
-    else:
-        thoughts = [
-            f"{agent.name} wonders what secrets this place holds",
-            f"{agent.name} mentally catalogs today's observations",
-            f"{agent.name} ponders the village's mysteries",
-        ]
-    return random.choice(thoughts)
-
-
-def _indiscreet_mutter(agent: Agent) -> str:
+        obj = rng.choice(perception.nearby_objects)
+        return rng.choice(_CURIOUS_OBJECT_THOUGHTS).format(name=agent.name, obj=obj)
+    return rng.choice(_CURIOUS_THOUGHTS).format(name=agent.name)
+
+
+def _indiscreet_mutter(agent: Agent, rng: random.Random) -> str:
     """Generate something an indiscreet person might mutter."""
-    mutters = [
-        f"{agent.name} mutters about village gossip",
-        f"{agent.name} talks to themselves about recent events",
-        f"{agent.name} accidentally speaks their thoughts aloud",
-        f"{agent.name} mumbles something probably best kept private",
-        f"{agent.name} narrates their own actions under their breath",
-    ]
-    return random.choice(mutters)
+    return rng.choice(_INDISCREET_MUTTERS).format(name=agent.name)
 
 
-def _perceptive_observation(agent: Agent, perception: AgentPerception) -> str:
+def _perceptive_observation(
+    agent: Agent, perception: AgentPerception, rng: random.Random
+) -> str:
     """Generate a perceptive observation."""
     if perception.nearby_agents:
-        other = random.choice(perception.nearby_agents)
-        observations = [
-            f"{agent.name} notices {other} seems distracted",
-            f"{agent.name} observes {other}'s unusual demeanor",
-            f"{agent.name} catches {other} glancing around nervously",
-        ]
-    else:
-        observations = [
-            f"{agent.name} notices the subtle shift in the air",
-            f"{agent.name} spots something others might miss",
-            f"{agent.name} takes mental note of their surroundings",
-            f"{agent.name} listens to the ambient sounds",
-        ]
-    return random.choice(observations)
-
-
-def _charming_action(agent: Agent) -> str:
+        other = rng.choice(perception.nearby_agents)
+        return rng.choice(_PERCEPTIVE_AGENT_OBSERVATIONS).format(name=agent.name, other=other)
+    return rng.choice(_PERCEPTIVE_OBSERVATIONS).format(name=agent.name)
+
+
+def _charming_action(agent: Agent, rng: random.Random) -> str:
     """Generate a charming person's idle action."""
-    actions = [
-        f"{agent.name} adjusts their appearance",
-        f"{agent.name} practices a winning smile",
-        f"{agent.name} smooths down their clothes",
-        f"{agent.name} strikes a casual but flattering pose",
-    ]
-    return random.choice(actions)
-
-
-def _location_idle(agent: Agent, perception: AgentPerception) -> list[IdleBehavior]:
-    """Generate location-specific idle behaviors."""
-    behaviors = []
-    loc = perception.location_name.lower()
-
-    if "bakery" in loc:
-        behaviors.append(IdleBehavior("observation", f"{agent.name} inhales the aroma of fresh bread", 1))
-    elif "tavern" in loc:
-        behaviors.append(IdleBehavior("action", f"{agent.name} drums fingers on the bar", 1))
-        behaviors.append(IdleBehavior("observation", f"{agent.name} watches the fireplace crackle", 1))
-    elif "church" in loc:
-        behaviors.append(IdleBehavior("action", f"{agent.name} bows their head in quiet reflection", 1))
-        behaviors.append(IdleBehavior("observation", f"{agent.name} admires the stained glass", 1))
-    elif "square" in loc:
-        behaviors.append(IdleBehavior("action", f"{agent.name} watches villagers pass by", 1))
-        behaviors.append(IdleBehavior("observation", f"{agent.name} listens to the fountain", 1))
-    elif "blacksmith" in loc or "forge" in loc:
-        behaviors.append(IdleBehavior("observation", f"{agent.name} watches the sparks fly", 1))
-    elif "garden" in loc or "farm" in loc:
-        behaviors.append(IdleBehavior("action", f"{agent.name} brushes dirt from their hands", 1))
-        behaviors.append(IdleBehavior("observation", f"{agent.name} checks the state of the crops", 1))
-    elif "inn" in loc:
-        behaviors.append(IdleBehavior("action", f"{agent.name} leafs through the guest book", 1))
-    elif "cemetery" in loc:
-        behaviors.append(IdleBehavior("action", f"{agent.name} pays silent respects", 1))
-        behaviors.append(IdleBehavior("thought", f"{agent.name} reflects on mortality", 1))
-    elif "forest" in loc:
-        behaviors.append(IdleBehavior("observation", f"{agent.name} listens to the rustling leaves", 1))
-        behaviors.append(IdleBehavior("thought", f"{agent.name} feels the forest watching back", 1))
-
-    return behaviors
+    return rng.choice(_CHARMING_ACTIONS).format(name=agent.name)
+
+
+@lru_cache(maxsize=256)
+def _location_kind(location_name: str) -> str | None:
+    """Classify a location by name for location-specific idle behaviors.
+
+    Cached, since agents perceive the same handful of location names every tick.
+    """
+    kinds = {match.lastgroup for match in _LOCATION_PATTERN.finditer(location_name)}
+    return min(kinds, key=_LOCATION_PRIORITY.__getitem__, default=None)
+
+
+def _location_idle(perception: AgentPerception) -> tuple[tuple[str, str], ...]:
+    """Get (type, template) pairs for location-specific idle behaviors."""
+    return _LOCATION_IDLE_TABLE.get(_location_kind(perception.location_name), ())
@@ -3,9 +3,9 @@
 import logging
 import time
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
-from hamlet.db.models import Agent
 from hamlet.factions import FactionManager
 from hamlet.goals import GoalPlanner
 from hamlet.life_events import LifeEventConsequences, LifeEventGenerator
@@ -15,8 +15,18 @@ from hamlet.simulation.events import EventType, SimulationEvent, event_bus
 logger = logging.getLogger(__name__)
 
 
+def _actors(primary_agent_id: str, secondary_agent_id: str | None) -> list[str]:
+    """Actors list for an event involving one or two agents."""
+    if secondary_agent_id:
+        return [primary_agent_id, secondary_agent_id]
+    return [primary_agent_id]
+
+
 class EmergentNarratives:
-    """Manages emergent narrative systems during simulation."""
+    """Manages emergent narrative systems during simulation.
+
+    Each periodic check publishes its events in one batch after committing.
+    """
 
     def __init__(self, db: Session):
         self.db = db
@@ -27,53 +37,96 @@ class EmergentNarratives:
         self.arc_analyzer = NarrativeAnalyzer(db)
         self.goal_planner = GoalPlanner(db)
 
-        # Track last check times to avoid running every tick
-        # Initialize to current time so we don't trigger everything on the first tick
-        now = time.time()
-        self._last_life_event_check = now
-        self._last_arc_check = now
-        self._last_faction_check = now
-        self._last_plan_check = now
-
-        # Check intervals (in seconds)
-        self.life_event_interval = 300  # Every 5 minutes
-        self.arc_interval = 600  # Every 10 minutes
-        self.faction_interval = 900  # Every 15 minutes
-        self.plan_interval = 600  # Every 10 minutes
-
-    async def process_tick(self, tick: int, day: int, hour: float) -> None:
+        # Track the tick of each last check to avoid running every tick; set on the
+        # first tick processed so we don't trigger everything straight away
+        self._last_life_event_check: int | None = None
+        self._last_arc_check: int | None = None
+        self._last_faction_check: int | None = None
+        self._last_plan_check: int | None = None
+        self._last_resolution_check: int | None = None
+
+        # Earliest tick at which any check is due
+        self._next_check_tick: int | None = None
+
+        # Narrative context, reused until the next tick, and story digest, reused
+        # until the session next commits
+        self._context_cache: dict[str, str] = {}
+        self._digest_cache: dict | None = None
+        event.listen(db, "after_commit", self._clear_digest_cache)
+
+        # Check intervals (in ticks; a tick is 30 game minutes)
+        self.life_event_interval = 10  # Every 5 game hours
+        self.arc_interval = 20  # Every 10 game hours
+        self.faction_interval = 30  # Every 15 game hours
+        self.plan_interval = 20  # Every 10 game hours
+        self.resolution_interval = 2  # Every game hour
+
+        # Delays before the first run, so checks whose intervals line up (arcs and
+        # plans share one, and every interval divides 60) fall on different ticks
+        self.arc_offset = 5
+        self.plan_offset = 15
+        self.faction_offset = 3
+
+    async def process_tick(
+        self, tick: int, day: int, hour: float, timestamp: int | None = None
+    ) -> None:
         """Process emergent narrative systems each tick.
 
-        This is called from the main simulation engine tick loop.
+        This is called from the main simulation engine tick loop. Events
+        published during the tick carry ``timestamp`` (defaults to now).
         """
-        now = time.time()
+        self._context_cache.clear()
+        self._digest_cache = None
+
+        if self._next_check_tick is None:
+            self._last_life_event_check = self._last_resolution_check = tick
+            self._last_arc_check = tick + self.arc_offset
+            self._last_faction_check = tick + self.faction_offset
+            self._last_plan_check = tick + self.plan_offset
+        elif tick < self._next_check_tick:
+            # Nothing is due this tick
+            return
+
+        if timestamp is None:
+            timestamp = int(time.time())
 
         # Check for life events periodically
-        if now - self._last_life_event_check >= self.life_event_interval:
-            await self._check_life_events()
-            self._last_life_event_check = now
+        if tick - self._last_life_event_check >= self.life_event_interval:
+            await self._check_life_events(timestamp)
+            self._last_life_event_check = tick
 
         # Check for narrative arcs periodically
-        if now - self._last_arc_check >= self.arc_interval:
-            await self._detect_narrative_arcs()
-            self._last_arc_check = now
+        if tick - self._last_arc_check >= self.arc_interval:
+            await self._detect_narrative_arcs(timestamp)
+            self._last_arc_check = tick
 
         # Check faction dynamics periodically
-        if now - self._last_faction_check >= self.faction_interval:
-            await self._process_faction_dynamics()
-            self._last_faction_check = now
+        if tick - self._last_faction_check >= self.faction_interval:
+            await self._process_faction_dynamics(timestamp)
+            self._last_faction_check = tick
 
         # Check long-term plan progress periodically
-        if now - self._last_plan_check >= self.plan_interval:
-            await self._check_plan_progress()
-            self._last_plan_check = now
-
-        # Check for event resolutions
-        await self._check_event_resolutions()
-
-    async def _check_life_events(self) -> None:
+        if tick - self._last_plan_check >= self.plan_interval:
+            await self._check_plan_progress(timestamp)
+            self._last_plan_check = tick
+
+        # Check for event resolutions periodically
+        if tick - self._last_resolution_check >= self.resolution_interval:
+            await self._check_event_resolutions(timestamp)
+            self._last_resolution_check = tick
+
+        self._next_check_tick = min(
+            self._last_life_event_check + self.life_event_interval,
+            self._last_arc_check + self.arc_interval,
+            self._last_faction_check + self.faction_interval,
+            self._last_plan_check + self.plan_interval,
+            self._last_resolution_check + self.resolution_interval,
+        )
+
+    async def _check_life_events(self, timestamp: int) -> None:
         """Check for and process new life events."""
         try:
+            events: list[SimulationEvent] = []
             new_events = self.life_event_generator.check_for_life_events()
 
             for event in new_events:
@@ -82,14 +135,12 @@ class EmergentNarratives:
                 # Apply consequences
                 changes = self.life_event_consequences.apply_event_consequences(event)
 
-                # Publish to event bus
-                await event_bus.publish(
+                events.append(
                     SimulationEvent(
                         type=EventType.RELATIONSHIP,
                         summary=event.description,
-                        timestamp=int(time.time()),
-                        actors=[event.primary_agent_id]
-                        + ([event.secondary_agent_id] if event.secondary_agent_id else []),
+                        timestamp=timestamp,
+                        actors=_actors(event.primary_agent_id, event.secondary_agent_id),
                         significance=event.significance,
                         data={"life_event_type": event.type},
                     )
@@ -98,46 +149,58 @@ class EmergentNarratives:
                 logger.debug(f"Life event consequences: {changes}")
 
             self.db.commit()
+            if events:
+                await event_bus.publish_many(events)
 
         except Exception as e:
             logger.error(f"Error checking life events: {e}")
             self.db.rollback()
 
-    async def _detect_narrative_arcs(self) -> None:
+    async def _detect_narrative_arcs(self, timestamp: int) -> None:
         """Detect new narrative arcs from events and relationships."""
         try:
+            events: list[SimulationEvent] = []
             new_arcs = self.arc_detector.detect_arcs()
 
             for arc in new_arcs:
                 logger.info(f"Narrative arc detected: {arc.title} ({arc.type})")
 
-                # Publish arc detection as a discovery event
-                await event_bus.publish(
+                # Announce arc detection as a discovery event
+                events.append(
                     SimulationEvent(
                         type=EventType.DISCOVERY,
                         summary=f"A new story unfolds: {arc.title}",
-                        timestamp=int(time.time()),
-                        actors=[arc.primary_agent_id]
-                        + ([arc.secondary_agent_id] if arc.secondary_agent_id else []),
+                        timestamp=timestamp,
+                        actors=_actors(arc.primary_agent_id, arc.secondary_agent_id),
                         significance=arc.significance,
                         data={"arc_type": arc.type, "arc_id": arc.id},
                     )
                 )
 
             self.db.commit()
+            if events:
+                await event_bus.publish_many(events)
 
         except Exception as e:
             logger.error(f"Error detecting narrative arcs: {e}")
             self.db.rollback()
 
-    async def _process_faction_dynamics(self) -> None:
+    async def _process_faction_dynamics(self, timestamp: int) -> None:
         """Process faction formation and dynamics."""
         try:
-            agents = self.db.query(Agent).all()
+            events: list[SimulationEvent] = []
+            # Agents already at the membership limit can neither form nor join
+            agents = self.faction_manager.get_agents_open_to_factions()
+            # Active memberships for every agent up front, rather than a query per check
+            memberships = self.faction_manager.get_active_memberships_by_agent()
+            # Factions open to joining, extended as agents found new ones
+            factions = self.faction_manager.get_all_factions()
 
             for agent in agents:
+                current = memberships.get(agent.id, [])
+
                 # Check if agent should form a new faction
-                if self.faction_manager.should_form_faction(agent):
+                if self.faction_manager.should_form_faction(agent, current):
                     faction_type = self.faction_manager.get_compatible_faction_type(agent)
                     faction = self.faction_manager.create_faction(
                         name=f"{agent.name}'s {faction_type.value.title()}",
@@ -148,12 +211,16 @@ class EmergentNarratives:
 
                     if faction:
                         logger.info(f"Faction formed: {faction.name} by {agent.name}")
+                        # Pick up the founder membership; the session doesn't autoflush
+                        self.db.flush()
+                        current = self.faction_manager.get_agent_factions(agent.id)
+                        factions.append(faction)
 
-                        await event_bus.publish(
+                        events.append(
                             SimulationEvent(
                                 type=EventType.SYSTEM,
                                 summary=f"{agent.name} has founded {faction.name}",
-                                timestamp=int(time.time()),
+                                timestamp=timestamp,
                                 actors=[agent.id],
                                 location_id=agent.location_id,
                                 significance=3,
@@ -162,18 +229,18 @@ class EmergentNarratives:
                         )
 
                 # Check if agent should join existing factions
-                factions = self.faction_manager.get_all_factions()
                 for faction in factions:
-                    if self.faction_manager.should_join_faction(agent, faction):
+                    if self.faction_manager.should_join_faction(agent, faction, current):
                         membership = self.faction_manager.add_member(faction.id, agent.id)
                         if membership:
+                            current.append(membership)
                             logger.info(f"{agent.name} joined {faction.name}")
 
-                            await event_bus.publish(
+                            events.append(
                                 SimulationEvent(
                                     type=EventType.RELATIONSHIP,
                                     summary=f"{agent.name} has joined {faction.name}",
-                                    timestamp=int(time.time()),
+                                    timestamp=timestamp,
                                     actors=[agent.id],
                                     significance=2,
                                     data={"faction_id": faction.id},
@@ -182,111 +249,128 @@ class EmergentNarratives:
                             break  # Only join one faction per check
 
             self.db.commit()
+            if events:
+                await event_bus.publish_many(events)
 
         except Exception as e:
             logger.error(f"Error processing faction dynamics: {e}")
             self.db.rollback()
 
-    async def _check_plan_progress(self) -> None:
+    async def _check_plan_progress(self, timestamp: int) -> None:
         """Check and update long-term goal plan progress."""
         try:
-            agents = self.db.query(Agent).all()
-
-            for agent in agents:
-                # Generate ambitions for agents without plans
+            events: list[SimulationEvent] = []
+            # Generate ambitions for agents without plans
+            for agent in self.goal_planner.get_agents_without_plans():
                 plan = self.goal_planner.generate_ambition(agent)
                 if plan:
                     logger.info(f"Ambition generated for {agent.name}: {plan.description}")
 
-                    await event_bus.publish(
+                    events.append(
                         SimulationEvent(
                             type=EventType.SYSTEM,
                             summary=f"{agent.name} has developed a new ambition: {plan.type}",
-                            timestamp=int(time.time()),
+                            timestamp=timestamp,
                             actors=[agent.id],
                             significance=2,
                             data={"plan_type": plan.type},
                         )
                     )
 
-                # Check progress on existing plans
+            # Check progress on existing plans; new plans have no completed goals yet
+            for agent in self.goal_planner.get_agents_with_active_plans():
                 milestone_msg = self.goal_planner.check_plan_progress(agent)
                 if milestone_msg:
                     logger.info(f"Plan progress for {agent.name}: {milestone_msg}")
 
-                    await event_bus.publish(
+                    events.append(
                         SimulationEvent(
                             type=EventType.ACTION,
                             summary=f"{agent.name}: {milestone_msg}",
-                            timestamp=int(time.time()),
+                            timestamp=timestamp,
                             actors=[agent.id],
                             significance=3,
                         )
                     )
 
             self.db.commit()
+            if events:
+                await event_bus.publish_many(events)
 
         except Exception as e:
             logger.error(f"Error checking plan progress: {e}")
             self.db.rollback()
 
-    async def _check_event_resolutions(self) -> None:
+    async def _check_event_resolutions(self, timestamp: int) -> None:
         """Check for life events that should be auto-resolved."""
         try:
+            events: list[SimulationEvent] = []
             resolved = self.life_event_consequences.check_event_resolutions()
 
             for event in resolved:
                 logger.info(f"Life event resolved: {event.type} - {event.description}")
 
-                await event_bus.publish(
+                events.append(
                     SimulationEvent(
                         type=EventType.RELATIONSHIP,
                         summary=event.description,
-                        timestamp=int(time.time()),
-                        actors=[event.primary_agent_id]
-                        + ([event.secondary_agent_id] if event.secondary_agent_id else []),
+                        timestamp=timestamp,
+                        actors=_actors(event.primary_agent_id, event.secondary_agent_id),
                         significance=event.significance,
                         data={"life_event_type": event.type, "resolved": True},
                     )
                 )
 
             self.db.commit()
+            if events:
+                await event_bus.publish_many(events)
 
         except Exception as e:
             logger.error(f"Error checking event resolutions: {e}")
             self.db.rollback()
 
     def get_agent_narrative_context(self, agent_id: str) -> str:
-        """Get full narrative context for an agent (for LLM prompts)."""
-        context_parts = []
+        """Get full narrative context for an agent (for LLM prompts).
 
-        # Faction context
-        faction_ctx = self.faction_manager.get_faction_context_for_agent(agent_id)
-        if faction_ctx:
-            context_parts.append(faction_ctx)
+        The result is cached until the next tick is processed.
+        """
+        return self.get_agent_narrative_contexts([agent_id])[agent_id]
 
-        # Life event context
-        life_ctx = self.life_event_generator.get_life_event_context(agent_id)
-        if life_ctx:
-            context_parts.append(life_ctx)
+    def get_agent_narrative_contexts(self, agent_ids: list[str]) -> dict[str, str]:
+        """Get narrative context for several agents, keyed by agent id.
 
-        # Narrative arc context
-        arc_ctx = self.arc_detector.get_arc_context_for_agent(agent_id)
-        if arc_ctx:
-            context_parts.append(arc_ctx)
+        Agents not already cached this tick are loaded together, with one
+        batch per subsystem rather than one per agent.
+        """
+        missing = [agent_id for agent_id in agent_ids if agent_id not in self._context_cache]
+        if missing:
+            per_subsystem = (
+                self.faction_manager.get_faction_contexts(missing),
+                self.life_event_generator.get_life_event_contexts(missing),
+                self.arc_detector.get_arc_contexts(missing),
+                self.goal_planner.get_plan_contexts(missing),
+            )
+            for agent_id in missing:
+                context_parts = [ctx[agent_id] for ctx in per_subsystem if ctx[agent_id]]
+                self._context_cache[agent_id] = "\n\n".join(context_parts)
+
+        return {agent_id: self._context_cache[agent_id] for agent_id in agent_ids}
+
+    def _clear_digest_cache(self, session: Session) -> None:
+        """Drop the cached story digest once narrative changes are committed."""
+        self._digest_cache = None
 
-        # Long-term plan context
-        plan_ctx = self.goal_planner.get_plan_context(agent_id)
-        if plan_ctx:
-            context_parts.append(plan_ctx)
+    def generate_story_digest(self) -> dict:
+        """Generate a story digest for the current state of narratives.
 
-        return "\n\n".join(context_parts) if context_parts else ""
+        The digest is cached until the next tick is processed or the session
+        commits; callers get their own copy of it.
+        """
+        if self._digest_cache is not None:
+            return dict(self._digest_cache)
 
-    def generate_story_digest(self) -> dict:
-        """Generate a story digest for the current state of narratives."""
         digest = self.arc_analyzer.generate_daily_digest()
-
-        return {
+        self._digest_cache = {
             "title": digest.title,
             "summary": digest.summary,
             "active_arcs": digest.active_arcs,
@@ -295,3 +379,4 @@ class EmergentNarratives:
             "suggested_focus": digest.suggested_focus,
             "village_state": self.arc_analyzer.get_village_story_state(),
         }
+        return dict(self._digest_cache)
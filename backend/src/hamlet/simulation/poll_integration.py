@@ -11,21 +11,37 @@ This module integrates the polling system with the agent simulation:
 """
 
 import logging
+import math
 import time
+from bisect import bisect
 from dataclasses import dataclass
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from hamlet.db import Agent, Goal, Poll
 from hamlet.goals.generation import generate_reactive_goal
 from hamlet.goals.types import CATEGORY_BASE_PRIORITY, GoalCategory, GoalType
-from hamlet.memory.manager import add_memory
-from hamlet.memory.types import MemoryType
+from hamlet.memory.manager import add_memories, add_memory
+from hamlet.memory.types import MemoryRecord, MemoryType
 from hamlet.simulation.events import EventType, SimulationEvent, event_bus
 from hamlet.simulation.polls import VoteDecision, get_voting_summary
 
 logger = logging.getLogger(__name__)
 
+# Confidence bands as (lower bounds, value per band); a confidence at a bound
+# falls in the band above it
+_VOTE_MEMORY_SIGNIFICANCE = ((0.4, 0.7), (4, 5, 6))  # Stronger opinions are more memorable
+_VOTE_MEMORY_DESC = ((0.3, 0.5, 0.8), ("hesitantly", "", "confidently", "strongly"))
+# Voters at exactly 0.3 still vote hesitantly
+_VOTE_EVENT_DESC = ((math.nextafter(0.3, 1.0), 0.7), ("hesitantly ", "", "confidently "))
+
+
+def _by_confidence(bands: tuple[tuple[float, ...], tuple], confidence: float):
+    """Look up the value for the confidence band ``confidence`` falls in."""
+    bounds, values = bands
+    return values[bisect(bounds, confidence)]
+
 
 @dataclass
 class PollResult:
@@ -52,71 +68,43 @@ def get_poll_result(poll: Poll) -> PollResult:
     options = poll.options_list
     votes = poll.votes_dict
 
-    # Find the winning option (most votes)
-    max_votes = 0
-    winning_index = 0
-    for idx_str, count in votes.items():
-        if count > max_votes:
-            max_votes = count
-            winning_index = int(idx_str)
+    # Find the winning option (most votes; the first one wins a tie)
+    winning_key, max_votes = max(votes.items(), key=lambda item: item[1], default=("0", 0))
+    winning_index = int(winning_key) if max_votes > 0 else 0
 
     # Build vote counts by option text
-    vote_counts = {}
-    for idx_str, count in votes.items():
-        idx = int(idx_str)
-        if idx < len(options):
-            vote_counts[options[idx]] = count
-
-    total_votes = sum(votes.values())
+    option_count = len(options)
+    vote_counts = {
+        options[idx]: count
+        for idx, count in ((int(key), count) for key, count in votes.items())
+        if idx < option_count
+    }
 
     return PollResult(
         poll_id=poll.id,
         question=poll.question,
         winning_option=options[winning_index] if options else "",
         winning_index=winning_index,
-        total_votes=total_votes,
+        total_votes=sum(votes.values()),
         vote_counts=vote_counts,
         category=poll.category,
     )
 
 
-def create_vote_memory(
-    agent: Agent,
-    decision: VoteDecision,
-    poll: Poll,
-    db: Session,
-) -> None:
-    """Create a memory for an agent's vote (POLL-10).
-
-    The memory captures what the agent voted for and how confident
-    they felt about their choice. This allows agents to discuss
-    and reference their voting decisions later.
+def vote_memory_record(agent: Agent, decision: VoteDecision, poll: Poll) -> MemoryRecord:
+    """Build the memory an agent keeps of their vote (POLL-10).
 
     Args:
         agent: The agent who voted
         decision: The vote decision with option and confidence
         poll: The poll that was voted on
-        db: Database session
+
+    Returns:
+        The memory to add, worded and weighted by the agent's confidence
     """
-    # Determine memory significance based on confidence
-    # High confidence = stronger opinion = more significant memory
-    if decision.confidence >= 0.7:
-        significance = 6  # Strong opinion, memorable
-    elif decision.confidence >= 0.4:
-        significance = 5  # Moderate opinion
-    else:
-        significance = 4  # Mild preference
-
-    # Create descriptive memory content
-    confidence_desc = ""
-    if decision.confidence >= 0.8:
-        confidence_desc = "strongly"
-    elif decision.confidence >= 0.5:
-        confidence_desc = "confidently"
-    elif decision.confidence >= 0.3:
-        confidence_desc = ""
-    else:
-        confidence_desc = "hesitantly"
+    # Memory significance and wording follow the agent's confidence
+    significance = _by_confidence(_VOTE_MEMORY_SIGNIFICANCE, decision.confidence)
+    confidence_desc = _by_confidence(_VOTE_MEMORY_DESC, decision.confidence)
 
     if confidence_desc:
         content = (
@@ -129,16 +117,44 @@ def create_vote_memory(
             f"on the poll: \"{poll.question}\""
         )
 
-    add_memory(
+    return MemoryRecord(
         agent_id=agent.id,
         content=content,
-        db=db,
         memory_type=MemoryType.WORKING,
         significance=significance,
         event_type="action",
     )
 
-    logger.info(f"Created vote memory for {agent.name}: {content}")
+
+def create_vote_memory(
+    agent: Agent,
+    decision: VoteDecision,
+    poll: Poll,
+    db: Session,
+) -> None:
+    """Create a memory for an agent's vote (POLL-10).
+
+    The memory captures what the agent voted for and how confident
+    they felt about their choice. This allows agents to discuss
+    and reference their voting decisions later.
+
+    Args:
+        agent: The agent who voted
+        decision: The vote decision with option and confidence
+        poll: The poll that was voted on
+        db: Database session
+    """
+    record = vote_memory_record(agent, decision, poll)
+    add_memory(
+        agent_id=record.agent_id,
+        content=record.content,
+        db=db,
+        memory_type=record.memory_type,
+        significance=record.significance,
+        event_type=record.event_type,
+    )
+
+    logger.info(f"Created vote memory for {agent.name}: {record.content}")
 
 
 def create_poll_result_memories(
@@ -146,6 +162,7 @@ def create_poll_result_memories(
     result: PollResult,
     agent_votes: dict[str, int],
     db: Session,
+    commit: bool = True,
 ) -> None:
     """Create memories for all agents about the poll result (POLL-10).
 
@@ -156,7 +173,21 @@ def create_poll_result_memories(
         result: The poll result
         agent_votes: Map of agent_id -> option_index they voted for
         db: Database session
+        commit: Whether to commit; pass False to leave it to the caller
     """
+    # Everything but the loser's own choice is shared, so build the texts once
+    concluded = f"The poll \"{result.question}\" concluded. "
+    winner_content = (
+        f"{concluded}My choice '{result.winning_option}' won with "
+        f"{result.vote_counts.get(result.winning_option, 0)} votes!"
+    )
+    bystander_content = (
+        f"{concluded}'{result.winning_option}' won with {result.total_votes} total votes."
+    )
+    options = list(result.vote_counts.keys())
+    loser_contents: dict[int, str] = {}
+
+    records = []
     for agent in agents:
         # Check if this agent voted and if they won
         voted_option = agent_votes.get(agent.id)
@@ -164,39 +195,36 @@ def create_poll_result_memories(
         if voted_option is not None:
             # Agent participated in the poll
             if voted_option == result.winning_index:
-                content = (
-                    f"The poll \"{result.question}\" concluded. "
-                    f"My choice '{result.winning_option}' won with "
-                    f"{result.vote_counts.get(result.winning_option, 0)} votes!"
-                )
+                content = winner_content
                 significance = 7  # Winning feels significant
             else:
                 # Find what they voted for
-                options = list(result.vote_counts.keys())
-                their_choice = options[voted_option] if voted_option < len(options) else "unknown"
-                content = (
-                    f"The poll \"{result.question}\" concluded. "
-                    f"'{result.winning_option}' won. "
-                    f"I had voted for '{their_choice}'."
-                )
+                content = loser_contents.get(voted_option)
+                if content is None:
+                    their_choice = (
+                        options[voted_option] if voted_option < len(options) else "unknown"
+                    )
+                    content = loser_contents[voted_option] = (
+                        f"{concluded}'{result.winning_option}' won. "
+                        f"I had voted for '{their_choice}'."
+                    )
                 significance = 6  # Losing is still notable
         else:
             # Agent didn't vote - still aware of the result
-            content = (
-                f"The poll \"{result.question}\" concluded. "
-                f"'{result.winning_option}' won with {result.total_votes} total votes."
-            )
+            content = bystander_content
             significance = 5  # Less personally relevant
 
-        add_memory(
-            agent_id=agent.id,
-            content=content,
-            db=db,
-            memory_type=MemoryType.WORKING,
-            significance=significance,
-            event_type="discovery",
+        records.append(
+            MemoryRecord(
+                agent_id=agent.id,
+                content=content,
+                memory_type=MemoryType.WORKING,
+                significance=significance,
+                event_type="discovery",
+            )
         )
 
+    add_memories(records, db, commit=commit)
     logger.info(f"Created poll result memories for {len(agents)} agents")
 
 
@@ -205,6 +233,7 @@ def create_poll_reactive_goals(
     result: PollResult,
     agent_votes: dict[str, int],
     db: Session,
+    commit: bool = True,
 ) -> list[Goal]:
     """Create reactive goals for agents based on poll results (POLL-8).
 
@@ -218,19 +247,43 @@ def create_poll_reactive_goals(
         result: The poll result
         agent_votes: Map of agent_id -> option_index they voted for
         db: Database session
+        commit: Whether to commit; pass False to leave it to the caller
 
     Returns:
         List of created goals
     """
-    created_goals = []
+    goal_rows: list[dict] = []
     now = int(time.time())
 
+    def add_goal(agent: Agent, goal_type: GoalType, description: str, priority: int) -> None:
+        goal_rows.append(
+            {
+                "agent_id": agent.id,
+                "type": goal_type.value,
+                "description": description,
+                "priority": priority,
+                "status": "active",
+                "created_at": now,
+            }
+        )
+
+    # Base priority for poll-related goals
+    base_priority = CATEGORY_BASE_PRIORITY[GoalCategory.REACTIVE]
+
+    # Goal descriptions depend only on the result, so format them once
+    winner = result.winning_option
+    celebrate = f"Celebrate that '{winner}' won the poll about \"{result.question}\""
+    discuss = f"Discuss the poll result - why did '{winner}' win?"
+    accept = f"Accept that '{winner}' won the poll, even though I voted differently"
+    implement = f"Help implement the decision: '{winner}'"
+    share = f"Share news about the poll result - '{winner}' won!"
+    calls_for_action = result.category in ("governance", "conflict", "exploration")
+
     for agent in agents:
         voted_option = agent_votes.get(agent.id)
         traits = agent.traits_dict
-
-        # Base priority for poll-related goals
-        base_priority = CATEGORY_BASE_PRIORITY[GoalCategory.REACTIVE]
+        ambitious = traits.get("ambition", 5) >= 7
+        empathetic = traits.get("empathy", 5) >= 5
 
         if voted_option is not None:
             agent_won = voted_option == result.winning_index
@@ -238,87 +291,34 @@ def create_poll_reactive_goals(
             if agent_won:
                 # Create celebration goal for winners with high energy/charm
                 if traits.get("energy", 5) >= 6 or traits.get("charm", 5) >= 6:
-                    goal = Goal(
-                        agent_id=agent.id,
-                        type=GoalType.CELEBRATE_POLL_WIN.value,
-                        description=(
-                            f"Celebrate that '{result.winning_option}' "
-                            f"won the poll about \"{result.question}\""
-                        ),
-                        priority=base_priority + 1,
-                        status="active",
-                        created_at=now,
-                    )
-                    db.add(goal)
-                    created_goals.append(goal)
+                    add_goal(agent, GoalType.CELEBRATE_POLL_WIN, celebrate, base_priority + 1)
             else:
                 # Create acceptance goal for losers with high empathy
                 # Or confrontation if they have high ambition and low empathy
-                if traits.get("ambition", 5) >= 7 and traits.get("empathy", 5) < 5:
-                    # Ambitious agents might want to discuss/debate the result
-                    goal = Goal(
-                        agent_id=agent.id,
-                        type=GoalType.DISCUSS_POLL_RESULT.value,
-                        description=(
-                            f"Discuss the poll result - why did "
-                            f"'{result.winning_option}' win?"
-                        ),
-                        priority=base_priority + 2,  # Higher priority for debate
-                        status="active",
-                        created_at=now,
-                    )
-                    db.add(goal)
-                    created_goals.append(goal)
-                elif traits.get("empathy", 5) >= 5:
+                if ambitious and not empathetic:
+                    # Ambitious agents might want to discuss/debate the result, urgently
+                    add_goal(agent, GoalType.DISCUSS_POLL_RESULT, discuss, base_priority + 2)
+                elif empathetic:
                     # Empathetic agents accept the result gracefully
-                    goal = Goal(
-                        agent_id=agent.id,
-                        type=GoalType.ACCEPT_POLL_LOSS.value,
-                        description=(
-                            f"Accept that '{result.winning_option}' won "
-                            f"the poll, even though I voted differently"
-                        ),
-                        priority=base_priority,
-                        status="active",
-                        created_at=now,
-                    )
-                    db.add(goal)
-                    created_goals.append(goal)
+                    add_goal(agent, GoalType.ACCEPT_POLL_LOSS, accept, base_priority)
 
         # Create implementation goals for governance/action-oriented polls
         # Only for a subset of agents (leaders, ambitious ones)
-        if result.category in ("governance", "conflict", "exploration"):
-            if traits.get("ambition", 5) >= 7 or traits.get("courage", 5) >= 7:
-                goal = Goal(
-                    agent_id=agent.id,
-                    type=GoalType.IMPLEMENT_POLL_DECISION.value,
-                    description=(
-                        f"Help implement the decision: '{result.winning_option}'"
-                    ),
-                    priority=base_priority + 2,
-                    status="active",
-                    created_at=now,
-                )
-                db.add(goal)
-                created_goals.append(goal)
+        if calls_for_action and (ambitious or traits.get("courage", 5) >= 7):
+            add_goal(agent, GoalType.IMPLEMENT_POLL_DECISION, implement, base_priority + 2)
 
         # Create gossip goals for agents with low discretion
         if traits.get("discretion", 5) <= 4:
-            goal = Goal(
-                agent_id=agent.id,
-                type=GoalType.SHARE_GOSSIP.value,
-                description=(
-                    f"Share news about the poll result - "
-                    f"'{result.winning_option}' won!"
-                ),
-                priority=base_priority,
-                status="active",
-                created_at=now,
-            )
-            db.add(goal)
-            created_goals.append(goal)
+            add_goal(agent, GoalType.SHARE_GOSSIP, share, base_priority)
 
-    db.commit()
+    # Insert all goals in one batched statement, getting the rows back as Goals
+    created_goals = []
+    if goal_rows:
+        created_goals = list(
+            db.scalars(insert(Goal).returning(Goal, sort_by_parameter_order=True), goal_rows)
+        )
+    if commit:
+        db.commit()
     logger.info(f"Created {len(created_goals)} reactive goals from poll result")
     return created_goals
 
@@ -369,11 +369,7 @@ async def publish_agent_voted_event(
         decision: Their voting decision
         poll: The poll they voted on
     """
-    confidence_desc = ""
-    if decision.confidence >= 0.7:
-        confidence_desc = "confidently "
-    elif decision.confidence <= 0.3:
-        confidence_desc = "hesitantly "
+    confidence_desc = _by_confidence(_VOTE_EVENT_DESC, decision.confidence)
 
     event = SimulationEvent(
         type=EventType.POLL,
@@ -430,13 +426,20 @@ async def on_poll_closed(
             "personalized memories will be limited"
         )
 
-    # POLL-10: Create memories for all agents about the result
-    create_poll_result_memories(agents, result, agent_votes, db)
+    # Memories and goals are committed together, so neither is kept without the other
+    try:
+        # POLL-10: Create memories for all agents about the result
+        create_poll_result_memories(agents, result, agent_votes, db, commit=False)
+
+        # POLL-8: Create reactive goals based on the result
+        create_poll_reactive_goals(agents, result, agent_votes, db, commit=False)
 
-    # POLL-8: Create reactive goals based on the result
-    create_poll_reactive_goals(agents, result, agent_votes, db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
-    # Publish simulation event
+    # Publish simulation event once the result is stored
     await publish_poll_closed_event(result, agent_votes)
 
     return result
@@ -11,16 +11,17 @@ each agent's unique personality.
 
 import logging
 import random
+import re
+from bisect import bisect
+from collections import Counter
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from itertools import accumulate
 
 from sqlalchemy.orm import Session
 
 from hamlet.db import Agent, Poll
 
-if TYPE_CHECKING:
-    from hamlet.simulation.poll_integration import on_agent_vote_sync
-
 logger = logging.getLogger(__name__)
 
 
@@ -141,8 +142,16 @@ OPTION_KEYWORDS: dict[str, tuple[str, bool]] = {
     "analyze": ("perception", True),
 }
 
+# Finds every keyword in one scan; the lookahead lets matches overlap, as
+# separate substring checks would. No keyword is a prefix of another, so one
+# match per position is enough.
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in OPTION_KEYWORDS) + "))"
+)
+_KEYWORD_ORDER = {keyword: i for i, keyword in enumerate(OPTION_KEYWORDS)}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VoteDecision:
     """Result of an agent's voting decision."""
 
@@ -176,14 +185,17 @@ def analyze_option_text(option_text: str) -> list[tuple[str, bool]]:
     Returns:
         List of (trait, positive_influence) tuples found in the text
     """
-    text_lower = option_text.lower()
-    influences = []
+    return list(_option_influences(option_text.lower()))
 
-    for keyword, (trait, positive) in OPTION_KEYWORDS.items():
-        if keyword in text_lower:
-            influences.append((trait, positive))
 
-    return influences
+@lru_cache(maxsize=1024)
+def _option_influences(text_lower: str) -> tuple[tuple[str, bool], ...]:
+    """Keyword influences in lowercased option text, in ``OPTION_KEYWORDS`` order.
+
+    Cached, as every agent voting on a poll analyzes the same options.
+    """
+    found = {match.group(1) for match in _KEYWORD_PATTERN.finditer(text_lower)}
+    return tuple(OPTION_KEYWORDS[keyword] for keyword in sorted(found, key=_KEYWORD_ORDER.get))
 
 
 def calculate_option_score(
@@ -206,19 +218,27 @@ def calculate_option_score(
         Score from 0-1 indicating affinity for this option
     """
     traits = agent.traits_dict
+    return _combine_scores(
+        _base_score(traits, trait_weights),
+        _keyword_adjustment(traits, _option_influences(option_text.lower())),
+    )
 
-    # Base score from category trait weights
+
+def _base_score(traits: dict, trait_weights: dict[str, float]) -> float:
+    """Category-based part of an option score; the same for every option."""
     # Normalized trait values (1-10) to 0-1 range
     base_score = 0.0
     for trait, weight in trait_weights.items():
         trait_value = traits.get(trait, 5) / 10.0  # Normalize to 0-1
         base_score += trait_value * weight
+    return base_score
+
 
-    # Adjust based on keywords in the option
-    keyword_influences = analyze_option_text(option_text)
+def _keyword_adjustment(traits: dict, influences: tuple[tuple[str, bool], ...]) -> float:
+    """Keyword-based part of an option score, from the option's keyword influences."""
     keyword_adjustment = 0.0
 
-    for trait, positive in keyword_influences:
+    for trait, positive in influences:
         trait_value = traits.get(trait, 5) / 10.0
         if positive:
             # High trait = bonus for this option
@@ -227,10 +247,12 @@ def calculate_option_score(
             # High trait = penalty for this option
             keyword_adjustment -= (trait_value - 0.5) * 0.15
 
-    # Combine scores (base has more weight)
-    final_score = base_score * 0.7 + (0.5 + keyword_adjustment) * 0.3
+    return keyword_adjustment
 
-    # Clamp to valid range
+
+def _combine_scores(base_score: float, keyword_adjustment: float) -> float:
+    """Blend the two score parts (base has more weight), clamped to 0-1."""
+    final_score = base_score * 0.7 + (0.5 + keyword_adjustment) * 0.3
     return max(0.0, min(1.0, final_score))
 
 
@@ -247,15 +269,48 @@ def calculate_vote_probabilities(
     Returns:
         List of probabilities for each option (sums to 1.0)
     """
-    options = poll.options_list
-    if not options:
+    ballot = _Ballot.of(poll)
+    if not ballot.options:
         return []
 
-    trait_weights = get_trait_weights(poll.category)
+    return _vote_probabilities(agent.traits_dict, ballot)
+
+
+@dataclass(frozen=True)
+class _Ballot:
+    """The parts of a poll every voter shares, worked out once per poll.
+
+    Holds the options, each option's keyword influences and the category
+    trait weights.
+    """
+
+    poll_id: int
+    options: list[str]
+    option_influences: list[tuple[tuple[str, bool], ...]]
+    trait_weights: dict[str, float]
+
+    @classmethod
+    def of(cls, poll: Poll) -> "_Ballot":
+        """Prepare the ballot for a poll."""
+        options = poll.options_list
+        return cls(
+            poll_id=poll.id,
+            options=options,
+            option_influences=[_option_influences(option.lower()) for option in options],
+            trait_weights=get_trait_weights(poll.category),
+        )
+
+
+def _vote_probabilities(traits: dict, ballot: _Ballot) -> list[float]:
+    """Probability distribution over the ballot's options for an agent with ``traits``."""
+    options = ballot.options
+    # The category part of the score is shared by every option
+    base_score = _base_score(traits, ballot.trait_weights)
 
     # Calculate raw scores for each option
     scores = [
-        calculate_option_score(agent, option, trait_weights) for option in options
+        _combine_scores(base_score, _keyword_adjustment(traits, influences))
+        for influences in ballot.option_influences
     ]
 
     # Add small random noise for variety (agents aren't perfectly predictable)
@@ -286,15 +341,21 @@ def decide_vote(agent: Agent, poll: Poll) -> VoteDecision:
     Returns:
         VoteDecision with the chosen option and confidence level
     """
-    options = poll.options_list
+    return _decide_vote(agent, _Ballot.of(poll))
+
+
+def _decide_vote(agent: Agent, ballot: _Ballot) -> VoteDecision:
+    """Decide an agent's vote on a ballot prepared once per poll."""
+    options = ballot.options
     if not options:
-        raise ValueError(f"Poll {poll.id} has no options")
+        raise ValueError(f"Poll {ballot.poll_id} has no options")
 
     # Calculate probabilities
-    probabilities = calculate_vote_probabilities(agent, poll)
+    probabilities = _vote_probabilities(agent.traits_dict, ballot)
 
-    # Make weighted random choice
-    chosen_index = random.choices(range(len(options)), weights=probabilities, k=1)[0]
+    # Weighted random choice: one draw located in the cumulative probabilities
+    cum_probs = list(accumulate(probabilities))
+    chosen_index = bisect(cum_probs, random.random() * cum_probs[-1], 0, len(cum_probs) - 1)
     chosen_prob = probabilities[chosen_index]
 
     # Confidence is how strongly they preferred this option
@@ -305,7 +366,7 @@ def decide_vote(agent: Agent, poll: Poll) -> VoteDecision:
 
     return VoteDecision(
         agent_id=agent.id,
-        poll_id=poll.id,
+        poll_id=ballot.poll_id,
         option_index=chosen_index,
         option_text=options[chosen_index],
         confidence=confidence,
@@ -344,24 +405,24 @@ def process_agent_votes(
     decisions: list[VoteDecision] = []
     agent_votes: dict[str, int] = {}  # Track what each agent voted for
     votes = poll.votes_dict
+    # Options, their keywords and the category weights are the same for every voter
+    ballot = _Ballot.of(poll)
 
     # Import here to avoid circular imports
     if create_memories:
-        from hamlet.simulation.poll_integration import on_agent_vote_sync
+        from hamlet.memory.manager import add_memories
+        from hamlet.simulation.poll_integration import vote_memory_record
 
+    memories = []
     for agent in agents:
         try:
-            decision = decide_vote(agent, poll)
+            decision = _decide_vote(agent, ballot)
             decisions.append(decision)
             agent_votes[agent.id] = decision.option_index
 
-            # Update vote count
-            option_key = str(decision.option_index)
-            votes[option_key] = votes.get(option_key, 0) + 1
-
-            # POLL-10: Create memory for this vote
+            # POLL-10: Remember this vote; the memories are added together below
             if create_memories:
-                on_agent_vote_sync(agent, decision, poll, db)
+                memories.append(vote_memory_record(agent, decision, poll))
 
             logger.info(
                 f"Agent {agent.name} voted for option {decision.option_index} "
@@ -370,8 +431,13 @@ def process_agent_votes(
         except Exception as e:
             logger.error(f"Failed to process vote for agent {agent.id}: {e}")
 
-    # Save updated votes
+    # Tally the votes once, then save them with the memories in one commit
+    for option_key, count in Counter(str(d.option_index) for d in decisions).items():
+        votes[option_key] = votes.get(option_key, 0) + count
     poll.votes_dict = votes
+    if memories:
+        add_memories(memories, db, commit=False)
+        logger.info(f"Created {len(memories)} vote memories for poll {poll.id}")
     db.commit()
 
     return decisions, agent_votes
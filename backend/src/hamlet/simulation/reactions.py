@@ -6,9 +6,116 @@ the witness's traits.
 """
 
 import random
+from bisect import bisect
+from functools import lru_cache
+from itertools import accumulate, chain
 
 from hamlet.db import Agent
 
+# Reaction tables: event type -> (template, weight) options, with "*" covering
+# every other event type. Templates are formatted with the witness's name.
+_ReactionTable = dict[str, tuple[tuple[str, int], ...]]
+
+_CONFLICT_CONCERN = (
+    ("{name} looks concerned at the tension", 3),
+    ("{name} winces sympathetically", 3),
+    ("{name} shifts uncomfortably at the conflict", 2),
+    ("{name} frowns with worry", 2),
+)
+
+# Concerned reactions to conflict
+_HIGH_EMPATHY: _ReactionTable = {
+    "confront": _CONFLICT_CONCERN,
+    "avoid": _CONFLICT_CONCERN,
+    "help": (
+        ("{name} smiles warmly at the kindness", 3),
+        ("{name} nods approvingly", 2),
+    ),
+    "*": (("{name} watches with a thoughtful expression", 2),),
+}
+
+# Interested reactions to secrets and gossip
+_HIGH_CURIOSITY: _ReactionTable = {
+    "gossip": (
+        ("{name} leans in with obvious interest", 3),
+        ("{name} perks up at the gossip", 3),
+        ("{name} edges closer to hear better", 2),
+    ),
+    "tell": (
+        ("{name} tilts their head with curiosity", 2),
+        ("{name} listens intently", 2),
+    ),
+    "investigate": (("{name}'s eyes widen with interest", 2),),
+    "*": (("{name} watches with keen interest", 2),),
+}
+
+# Audible gasps and comments
+_LOW_DISCRETION: _ReactionTable = {
+    "confront": (
+        ("{name} gasps audibly", 4),
+        ('"{name} mutters "Oh my..." under their breath', 3),
+        ("{name} whispers excitedly to no one in particular", 2),
+    ),
+    "gossip": (
+        ("{name} barely suppresses a giggle", 3),
+        ("{name} lets out an audible 'ooh'", 3),
+    ),
+    "give": (("{name} comments 'How generous!' just loud enough to hear", 2),),
+    "help": (("{name} exclaims softly at the kindness", 2),),
+    "*": (("{name} reacts visibly", 2),),
+}
+
+# Subtle glances, whatever the event
+_HIGH_DISCRETION: _ReactionTable = {
+    "*": (
+        ("{name} glances over briefly", 2),
+        ("{name} raises an eyebrow almost imperceptibly", 2),
+        ("{name} continues what they were doing but clearly noticed", 1),
+    ),
+}
+
+# For witnesses with moderate traits
+_NEUTRAL: _ReactionTable = {
+    "confront": (
+        ("{name} looks up at the commotion", 2),
+        ("{name} pauses to watch", 2),
+    ),
+    "gossip": (
+        ("{name} pretends not to listen", 2),
+        ("{name} glances over curiously", 2),
+    ),
+    "help": (("{name} notices the helpful gesture", 2),),
+    "give": (("{name} observes the exchange", 2),),
+    "*": (
+        ("{name} glances in their direction", 2),
+        ("{name} raises an eyebrow", 2),
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _reaction_options(
+    event_type: str,
+    high_empathy: bool,
+    high_curiosity: bool,
+    low_discretion: bool,
+    high_discretion: bool,
+) -> tuple[tuple[str, ...], tuple[int, ...]]:
+    """Templates and cumulative weights for a witness's trait bands and an event type."""
+    tables = [
+        table
+        for table, applies in (
+            (_HIGH_EMPATHY, high_empathy),
+            (_HIGH_CURIOSITY, high_curiosity),
+            (_LOW_DISCRETION, low_discretion),
+            (_HIGH_DISCRETION, high_discretion),
+        )
+        if applies
+    ] or [_NEUTRAL]
+    options = tuple(chain.from_iterable(table.get(event_type, table["*"]) for table in tables))
+    templates = tuple(template for template, _ in options)
+    return templates, tuple(accumulate(weight for _, weight in options))
+
 
 def generate_witness_reaction(
     witness_agent: Agent,
@@ -32,126 +139,16 @@ def generate_witness_reaction(
         return None
 
     traits = witness_agent.traits_dict
-    name = witness_agent.name
 
     # Get relevant traits with defaults
     empathy = traits.get("empathy", 5)
     curiosity = traits.get("curiosity", 5)
     discretion = traits.get("discretion", 5)
 
-    # Build weighted reaction options based on personality and event type
-    reactions: list[tuple[str, int]] = []
-
-    # === HIGH EMPATHY REACTIONS ===
-    # Concerned reactions to conflict
-    if empathy >= 7:
-        if event_type in ("confront", "avoid"):
-            reactions.extend([
-                (f"{name} looks concerned at the tension", 3),
-                (f"{name} winces sympathetically", 3),
-                (f"{name} shifts uncomfortably at the conflict", 2),
-                (f"{name} frowns with worry", 2),
-            ])
-        elif event_type == "help":
-            reactions.extend([
-                (f"{name} smiles warmly at the kindness", 3),
-                (f"{name} nods approvingly", 2),
-            ])
-        else:
-            reactions.extend([
-                (f"{name} watches with a thoughtful expression", 2),
-            ])
-
-    # === HIGH CURIOSITY REACTIONS ===
-    # Interested reactions to secrets and gossip
-    if curiosity >= 7:
-        if event_type == "gossip":
-            reactions.extend([
-                (f"{name} leans in with obvious interest", 3),
-                (f"{name} perks up at the gossip", 3),
-                (f"{name} edges closer to hear better", 2),
-            ])
-        elif event_type == "tell":
-            reactions.extend([
-                (f"{name} tilts their head with curiosity", 2),
-                (f"{name} listens intently", 2),
-            ])
-        elif event_type == "investigate":
-            reactions.extend([
-                (f"{name}'s eyes widen with interest", 2),
-            ])
-        else:
-            reactions.extend([
-                (f"{name} watches with keen interest", 2),
-            ])
-
-    # === LOW DISCRETION REACTIONS ===
-    # Audible gasps and comments
-    if discretion <= 3:
-        if event_type == "confront":
-            reactions.extend([
-                (f"{name} gasps audibly", 4),
-                (f'"{name} mutters "Oh my..." under their breath', 3),
-                (f"{name} whispers excitedly to no one in particular", 2),
-            ])
-        elif event_type == "gossip":
-            reactions.extend([
-                (f"{name} barely suppresses a giggle", 3),
-                (f"{name} lets out an audible 'ooh'", 3),
-            ])
-        elif event_type == "give":
-            reactions.extend([
-                (f"{name} comments 'How generous!' just loud enough to hear", 2),
-            ])
-        elif event_type == "help":
-            reactions.extend([
-                (f"{name} exclaims softly at the kindness", 2),
-            ])
-        else:
-            reactions.extend([
-                (f"{name} reacts visibly", 2),
-            ])
-
-    # === HIGH DISCRETION REACTIONS ===
-    # Subtle glances
-    if discretion >= 7:
-        reactions.extend([
-            (f"{name} glances over briefly", 2),
-            (f"{name} raises an eyebrow almost imperceptibly", 2),
-            (f"{name} continues what they were doing but clearly noticed", 1),
-        ])
-
-    # === NEUTRAL/DEFAULT REACTIONS ===
-    # For witnesses with moderate traits
-    if not reactions:
-        # Add some generic reactions
-        if event_type == "confront":
-            reactions.extend([
-                (f"{name} looks up at the commotion", 2),
-                (f"{name} pauses to watch", 2),
-            ])
-        elif event_type == "gossip":
-            reactions.extend([
-                (f"{name} pretends not to listen", 2),
-                (f"{name} glances over curiously", 2),
-            ])
-        elif event_type == "help":
-            reactions.extend([
-                (f"{name} notices the helpful gesture", 2),
-            ])
-        elif event_type == "give":
-            reactions.extend([
-                (f"{name} observes the exchange", 2),
-            ])
-        else:
-            reactions.extend([
-                (f"{name} glances in their direction", 2),
-                (f"{name} raises an eyebrow", 2),
-            ])
-
-    # Weighted random selection
-    if reactions:
-        options, weights = zip(*reactions)
-        return random.choices(options, weights=weights, k=1)[0]
-
-    return None
+    templates, cum_weights = _reaction_options(
+        event_type, empathy >= 7, curiosity >= 7, discretion <= 3, discretion >= 7
+    )
+
+    # Weighted random selection over cumulative weights
+    index = bisect(cum_weights, random.random() * cum_weights[-1], 0, len(templates) - 1)
+    return templates[index].format(name=witness_agent.name)
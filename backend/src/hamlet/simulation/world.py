@@ -1,6 +1,7 @@
 """World state management."""
 
 import time
+from collections import Counter
 from dataclasses import dataclass
 
 from sqlalchemy.orm import Session
@@ -10,7 +11,7 @@ from hamlet.simulation.events import EventBus, EventType, SimulationEvent
 from hamlet.simulation.events import event_bus as default_event_bus
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentPerception:
     """What an agent perceives in their current location."""
 
@@ -19,7 +20,7 @@ class AgentPerception:
     nearby_objects: list[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorldSnapshot:
     """A snapshot of the current world state."""
 
@@ -38,6 +39,7 @@ class World:
     def __init__(self, event_bus: EventBus | None = None):
         self.event_bus = event_bus or default_event_bus
         self._db: Session | None = None
+        self._state: WorldState | None = None
 
     @property
     def db(self) -> Session:
@@ -51,14 +53,24 @@ class World:
         if self._db is not None:
             self._db.close()
             self._db = None
+        self._state = None
 
     def get_world_state(self) -> WorldState:
-        """Get the current world state from database."""
+        """Get the current world state from database.
+
+        The loaded row is kept while it belongs to the current session, so
+        repeated calls within a tick don't re-query it; commits still expire
+        it, and its values are refreshed on the next read after one.
+        """
+        state = self._state
+        if state is not None and state in self.db:
+            return state
         state = self.db.query(WorldState).first()
         if state is None:
             state = WorldState(id=1, current_tick=0, current_day=1, current_hour=6.0)
             self.db.add(state)
             self.db.commit()
+        self._state = state
         return state
 
     def get_agents(self) -> list[Agent]:
@@ -83,23 +95,45 @@ class World:
 
     def get_agent_perception(self, agent: Agent) -> AgentPerception:
         """Get what an agent can perceive."""
-        location = self.get_location(agent.location_id) if agent.location_id else None
-        nearby_agents = []
-        nearby_objects = []
-
-        if location:
-            agents_here = self.get_agents_at_location(location.id)
-            nearby_agents = [a.name for a in agents_here if a.id != agent.id]
-            nearby_objects = location.objects_list
-
-        return AgentPerception(
-            location_name=location.name if location else "Unknown",
-            nearby_agents=nearby_agents,
-            nearby_objects=nearby_objects,
-        )
-
-    def advance_time(self, minutes: int = 30) -> tuple[int, int, float]:
-        """Advance world time by specified minutes. Returns (tick, day, hour)."""
+        return self.get_agent_perceptions([agent])[agent.id]
+
+    def get_agent_perceptions(self, agents: list[Agent]) -> dict[str, AgentPerception]:
+        """Get what each of several agents can perceive, keyed by agent id.
+
+        Uses one query for the locations and one for everyone at them,
+        however many agents are asked about.
+        """
+        location_ids = {agent.location_id for agent in agents if agent.location_id}
+        locations: dict[str, Location] = {}
+        occupants: dict[str, list[Agent]] = {}
+        if location_ids:
+            locations = {
+                loc.id: loc
+                for loc in self.db.query(Location).filter(Location.id.in_(location_ids)).all()
+            }
+            for other in self.db.query(Agent).filter(Agent.location_id.in_(location_ids)).all():
+                occupants.setdefault(other.location_id, []).append(other)
+
+        perceptions = {}
+        for agent in agents:
+            location = locations.get(agent.location_id) if agent.location_id else None
+            if location is None:
+                perceptions[agent.id] = AgentPerception(
+                    location_name="Unknown", nearby_agents=[], nearby_objects=[]
+                )
+                continue
+            perceptions[agent.id] = AgentPerception(
+                location_name=location.name,
+                nearby_agents=[a.name for a in occupants.get(location.id, []) if a.id != agent.id],
+                nearby_objects=location.objects_list,
+            )
+        return perceptions
+
+    def advance_time(self, minutes: int = 30, commit: bool = True) -> tuple[int, int, float]:
+        """Advance world time by specified minutes. Returns (tick, day, hour).
+
+        With ``commit=False`` the change is left for the caller to commit.
+        """
         state = self.get_world_state()
 
         state.current_tick += 1
@@ -115,11 +149,18 @@ class World:
             season_index = (state.current_day // 30) % 4
             state.season = seasons[season_index]
 
-        self.db.commit()
+        if commit:
+            self.db.commit()
         return state.current_tick, state.current_day, state.current_hour
 
-    def update_agent_needs(self, agent: Agent, hours_passed: float = 0.5) -> None:
-        """Update an agent's needs based on time passed."""
+    def update_agent_needs(
+        self, agent: Agent, hours_passed: float = 0.5, occupancy: int | None = None
+    ) -> None:
+        """Update an agent's needs based on time passed.
+
+        ``occupancy`` is the number of agents at the agent's location; it is
+        queried when not supplied.
+        """
         # Hunger increases over time
         agent.hunger = min(10.0, agent.hunger + hours_passed * 0.5)
 
@@ -131,50 +172,88 @@ class World:
 
         # Social need increases when alone, decreases when with others
         if agent.location_id:
-            others = self.get_agents_at_location(agent.location_id)
-            if len(others) > 1:  # Someone else is here
+            if occupancy is None:
+                occupancy = len(self.get_agents_at_location(agent.location_id))
+            if occupancy > 1:  # Someone else is here
                 agent.social = min(10.0, agent.social + hours_passed * 0.5)
             else:
                 agent.social = max(0.0, agent.social - hours_passed * 0.2)
 
-    def is_daytime(self) -> bool:
-        """Check if it's currently daytime."""
-        state = self.get_world_state()
-        return 6.0 <= state.current_hour < 22.0
+    def tick_agents(
+        self, current_hour: float, hours_passed: float = 0.5
+    ) -> tuple[list[Agent], list[Agent], list[Agent], list[Agent]]:
+        """Advance every agent for one tick in a single pass.
 
-    def wake_sleeping_agents(self) -> list[Agent]:
-        """Wake up sleeping agents if it's morning."""
-        woken = []
-        state = self.get_world_state()
+        Wakes agents in the morning, puts them to sleep at night and updates
+        their needs. Returns ``(woken, slept, active, agents)``, where
+        ``active`` holds the agents still awake.
+        """
+        agents = self.get_agents()
+        woken, slept, active = self._advance_agents(
+            agents,
+            hours_passed,
+            wake=6.0 <= current_hour < 6.5,
+            sleep=current_hour >= 22.0 or current_hour < 6.0,
+        )
+        return woken, slept, active, agents
 
-        # Wake agents at 6am
-        if 6.0 <= state.current_hour < 6.5:
-            sleeping_agents = self.db.query(Agent).filter(Agent.state == "sleeping").all()
-            for agent in sleeping_agents:
-                agent.state = "idle"
-                woken.append(agent)
+    def _advance_agents(
+        self,
+        agents: list[Agent],
+        hours_passed: float,
+        wake: bool = False,
+        sleep: bool = False,
+    ) -> tuple[list[Agent], list[Agent], list[Agent]]:
+        """Apply sleep transitions and needs to agents; returns (woken, slept, active)."""
+        occupancy = Counter(a.location_id for a in agents if a.location_id)
+        hunger_gain = hours_passed * 0.5
+        energy_gain = hours_passed * 2.0
+        energy_loss = hours_passed * 0.3
+        social_gain = hours_passed * 0.5
+        social_loss = hours_passed * 0.2
+        woken: list[Agent] = []
+        slept: list[Agent] = []
+        active: list[Agent] = []
+
+        for agent in agents:
+            # Day/night transitions
+            if agent.state == "sleeping":
+                if wake:
+                    agent.state = "idle"
+                    woken.append(agent)
+            elif sleep:
+                agent.state = "sleeping"
+                slept.append(agent)
 
-        return woken
+            # Needs: hunger grows, energy drains while awake and restores asleep
+            agent.hunger = min(10.0, agent.hunger + hunger_gain)
+            if agent.state == "sleeping":
+                agent.energy = min(10.0, agent.energy + energy_gain)
+            else:
+                agent.energy = max(0.0, agent.energy - energy_loss)
+                active.append(agent)
 
-    def put_agents_to_sleep(self) -> list[Agent]:
-        """Put agents to sleep if it's late night."""
-        sleeping = []
-        state = self.get_world_state()
+            # Social need eases with company and grows when alone
+            location_id = agent.location_id
+            if location_id:
+                if occupancy[location_id] > 1:
+                    agent.social = min(10.0, agent.social + social_gain)
+                else:
+                    agent.social = max(0.0, agent.social - social_loss)
 
-        # Agents sleep at 10pm
-        if state.current_hour >= 22.0 or state.current_hour < 6.0:
-            awake_agents = self.db.query(Agent).filter(Agent.state != "sleeping").all()
-            for agent in awake_agents:
-                agent.state = "sleeping"
-                sleeping.append(agent)
+        return woken, slept, active
 
-        return sleeping
+    def is_daytime(self) -> bool:
+        """Check if it's currently daytime."""
+        state = self.get_world_state()
+        return 6.0 <= state.current_hour < 22.0
 
     def get_snapshot(self) -> WorldSnapshot:
         """Get a complete snapshot of the world state."""
         state = self.get_world_state()
         agents = self.get_agents()
         locations = self.get_locations()
+        occupancy = Counter(a.location_id for a in agents)
 
         return WorldSnapshot(
             tick=state.current_tick,
@@ -186,7 +265,7 @@ class World:
                 a.id: {"name": a.name, "location": a.location_id, "state": a.state} for a in agents
             },
             locations={
-                loc.id: {"name": loc.name, "agent_count": len(self.get_agents_at_location(loc.id))}
+                loc.id: {"name": loc.name, "agent_count": occupancy[loc.id]}
                 for loc in locations
             },
         )
@@ -203,17 +282,45 @@ class World:
         location_id: str | None = None,
         detail: str | None = None,
         significance: int = 1,
+        timestamp: int | None = None,
     ) -> None:
         """Publish a simulation event."""
         state = self.get_world_state()
         event = SimulationEvent(
             type=event_type,
             summary=summary,
-            timestamp=int(time.time()),
-            actors=actors or [],
+            timestamp=timestamp if timestamp is not None else int(time.time()),
+            actors=actors,
             location_id=location_id,
             detail=detail,
             significance=significance,
             data={"tick": state.current_tick, "day": state.current_day, "hour": state.current_hour},
         )
         await self.event_bus.publish(event)
+
+    async def publish_events(self, events: list[tuple], timestamp: int | None = None) -> None:
+        """Publish a batch of simulation events.
+
+        Each entry is ``(event_type, summary, actors, location_id, detail,
+        significance)``, matching the arguments of ``publish_event``. The world
+        state is read once for the whole batch.
+        """
+        state = self.get_world_state()
+        if timestamp is None:
+            timestamp = int(time.time())
+        data = {"tick": state.current_tick, "day": state.current_day, "hour": state.current_hour}
+        await self.event_bus.publish_many(
+            [
+                SimulationEvent(
+                    type=event_type,
+                    summary=summary,
+                    timestamp=timestamp,
+                    actors=actors,
+                    location_id=location_id,
+                    detail=detail,
+                    significance=significance,
+                    data=dict(data),
+                )
+                for event_type, summary, actors, location_id, detail, significance in events
+            ]
+        )
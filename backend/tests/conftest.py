@@ -192,6 +192,21 @@ def isolated_db_session(
             connection.close()
 
 
+@pytest.fixture
+def query_counter(test_engine) -> Generator[list[str], None, None]:
+    """Record the SQL statements executed on the test database during a test."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def db(isolated_db_session) -> Session:
     """Convenience fixture that provides the isolated database session.
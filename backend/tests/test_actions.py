@@ -1,5 +1,7 @@
 """Tests for the actions module."""
 
+from unittest.mock import patch
+
 import pytest
 
 from hamlet.actions import (
@@ -60,6 +62,15 @@ class TestMoveAction:
 
         assert not result.success
 
+    def test_move_without_commit_leaves_commit_to_caller(self, world, setup_agents):
+        """Batched callers can defer the commit to the end of the tick."""
+        with patch.object(world, "commit") as mock_commit:
+            result = execute_action(Move("agnes", "town_square"), world, commit=False)
+
+        assert result.success
+        mock_commit.assert_not_called()
+        assert world.get_agent("agnes").location_id == "town_square"
+
 
 class TestSocialActions:
     """Tests for social actions."""
@@ -169,6 +180,19 @@ class TestRelationshipUpdates:
         )
         assert rel_after.score < score_before
 
+    def test_history_keeps_reason_as_written(self, world, setup_agents):
+        """Relationship history is stored verbatim for the relationships API."""
+        from hamlet.actions.execution import update_relationship
+
+        update_relationship(world, "bob", "agnes", 1, "Agnes Helped with the Harvest")
+
+        rel = (
+            world.db.query(Relationship)
+            .filter(Relationship.agent_id == "bob", Relationship.target_id == "agnes")
+            .first()
+        )
+        assert rel.history_list[-1] == "Agnes Helped with the Harvest"
+
 
 class TestValidation:
     """Tests for action validation."""
@@ -158,6 +158,11 @@ class TestOptionTextAnalysis:
         assert "curiosity" in traits
         assert "empathy" in traits
 
+    def test_analyze_option_reports_each_keyword_once_in_table_order(self):
+        """Influences follow OPTION_KEYWORDS order, whatever order the text uses."""
+        influences = analyze_option_text("Hide, then hide again, then EXPLORE")
+        assert influences == [("curiosity", True), ("courage", False)]
+
     def test_analyze_option_no_keywords(self):
         """Returns empty list when no keywords found."""
         influences = analyze_option_text("Just a normal option")
@@ -226,6 +231,21 @@ class TestVoteProbabilities:
         probs = calculate_vote_probabilities(high_curiosity_agent, test_poll)
         assert abs(sum(probs) - 1.0) < 0.001
 
+    def test_probabilities_follow_option_scores(
+        self, db, high_curiosity_agent, test_poll, monkeypatch
+    ):
+        """Without noise, probabilities are the normalized option scores."""
+        monkeypatch.setattr("hamlet.simulation.polls.random.uniform", lambda a, b: 0.0)
+        weights = get_trait_weights(test_poll.category)
+        scores = [
+            max(0.01, calculate_option_score(high_curiosity_agent, option, weights))
+            for option in test_poll.options_list
+        ]
+
+        probs = calculate_vote_probabilities(high_curiosity_agent, test_poll)
+
+        assert probs == pytest.approx([s / sum(scores) for s in scores])
+
     def test_probabilities_are_positive(self, db, high_curiosity_agent, test_poll):
         """All probabilities are positive."""
         probs = calculate_vote_probabilities(high_curiosity_agent, test_poll)
@@ -308,6 +328,16 @@ class TestDecideVote:
         assert decision.option_text in test_poll.options_list
         assert 0 <= decision.confidence <= 1
 
+    def test_vote_decision_is_a_slotted_value(self, db, high_curiosity_agent, test_poll):
+        """Decisions carry no per-instance __dict__ and can't be altered after the vote."""
+        import dataclasses
+
+        decision = decide_vote(high_curiosity_agent, test_poll)
+
+        assert not hasattr(decision, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            decision.option_index = 0
+
     def test_decide_vote_fails_for_empty_poll(self, db, high_curiosity_agent):
         """decide_vote raises error for poll with no options."""
         empty_poll = Poll(
@@ -332,6 +362,20 @@ class TestDecideVote:
         # (though highly curious agent will strongly prefer investigate)
         assert len(unique_options) >= 1  # At minimum the same choice
 
+    def test_decide_vote_draw_maps_onto_cumulative_probabilities(
+        self, db, high_curiosity_agent, test_poll, monkeypatch
+    ):
+        """A draw picks the option whose probability band it falls in."""
+        monkeypatch.setattr(
+            "hamlet.simulation.polls._vote_probabilities", lambda traits, ballot: [0.2, 0.5, 0.3]
+        )
+        picks = {}
+        for draw in (0.0, 0.19, 0.2, 0.69, 0.7, 0.999999):
+            monkeypatch.setattr("hamlet.simulation.polls.random.random", lambda d=draw: d)
+            picks[draw] = decide_vote(high_curiosity_agent, test_poll).option_index
+
+        assert picks == {0.0: 0, 0.19: 0, 0.2: 1, 0.69: 1, 0.7: 2, 0.999999: 2}
+
 
 @pytest.mark.integration
 class TestProcessAgentVotes:
@@ -369,6 +413,40 @@ class TestProcessAgentVotes:
         # agent_votes should match
         assert set(agent_votes.keys()) == expected_agents
 
+    def test_process_agent_votes_reads_options_once(self, db, test_poll, monkeypatch):
+        """The poll's options are parsed once for the whole electorate."""
+        reads = []
+        options_list = Poll.options_list
+
+        def counting_options(poll):
+            reads.append(poll.id)
+            return options_list.fget(poll)
+
+        monkeypatch.setattr(Poll, "options_list", property(counting_options))
+
+        decisions, _ = process_agent_votes(db, test_poll, create_memories=False)
+
+        assert len(decisions) > 1
+        assert len(reads) == 1
+
+    def test_process_agent_votes_analyzes_each_option_once(self, db, test_poll, monkeypatch):
+        """Option keywords are looked up once per option, not once per voter."""
+        from hamlet.simulation import polls
+
+        lookups = []
+        influences = polls._option_influences
+
+        def counting_influences(text):
+            lookups.append(text)
+            return influences(text)
+
+        monkeypatch.setattr(polls, "_option_influences", counting_influences)
+
+        decisions, _ = process_agent_votes(db, test_poll, create_memories=False)
+
+        assert len(decisions) > 1
+        assert len(lookups) == len(test_poll.options_list)
+
     def test_process_agent_votes_specific_agents(
         self, db, test_poll, high_curiosity_agent, cautious_agent
     ):
@@ -26,7 +26,13 @@ from hamlet.db.models import (
     Relationship,
 )
 from hamlet.factions import FactionManager
-from hamlet.factions.types import FactionRelationType, FactionRole, FactionStatus, FactionType
+from hamlet.factions.types import (
+    MAX_MEMBERSHIPS,
+    FactionRelationType,
+    FactionRole,
+    FactionStatus,
+    FactionType,
+)
 from hamlet.goals import GoalPlanner
 from hamlet.goals.types import AmbitionType, PlanStatus
 from hamlet.life_events import LifeEventConsequences, LifeEventGenerator
@@ -614,3 +620,182 @@ class TestIntegrationWithSimulation:
 
         # Should include faction and life event info
         assert "faction" in context.lower() or "guild" in context.lower() or len(context) > 0
+
+    async def test_faction_dynamics_loads_memberships_once(self, db: Session, query_counter):
+        """Faction dynamics reads memberships and factions once, not once per agent."""
+        from hamlet.simulation.narratives import EmergentNarratives
+
+        narratives = EmergentNarratives(db)
+        manager = narratives.faction_manager
+        agents = db.query(Agent).all()
+
+        # Fill every agent's membership slots so nobody forms or joins a faction
+        factions = [
+            manager.create_faction(name=f"Full Guild {i}", founder_id=agents[0].id)
+            for i in range(MAX_MEMBERSHIPS)
+        ]
+        for agent in agents[1:]:
+            for faction in factions:
+                manager.add_member(faction.id, agent.id)
+        db.flush()
+        query_counter.clear()
+
+        await narratives._process_faction_dynamics(int(time.time()))
+
+        membership_selects = [
+            s for s in query_counter if s.startswith("SELECT") and "FROM faction_memberships" in s
+        ]
+        faction_selects = [
+            s for s in query_counter if s.startswith("SELECT") and "FROM factions" in s
+        ]
+        # One to find agents below the membership limit, one to load memberships
+        assert len(membership_selects) == 2
+        assert len(faction_selects) == 1
+
+    def test_story_digest_is_copied_and_refreshed_on_commit(self, db: Session):
+        """Callers can't corrupt the cached digest, and a commit refreshes it."""
+        from unittest.mock import patch
+
+        from hamlet.simulation.narratives import EmergentNarratives
+
+        narratives = EmergentNarratives(db)
+        analyzer = narratives.arc_analyzer
+        digest = narratives.generate_story_digest()
+        digest["title"] = "Mutated"
+
+        with patch.object(
+            analyzer, "generate_daily_digest", wraps=analyzer.generate_daily_digest
+        ) as generate:
+            assert narratives.generate_story_digest()["title"] != "Mutated"
+            assert generate.call_count == 0
+
+            db.commit()
+            narratives.generate_story_digest()
+            assert generate.call_count == 1
+
+    async def test_periodic_checks_are_scheduled_by_tick(self, db: Session):
+        """Periodic checks run on tick intervals counted from the first tick seen."""
+        from unittest.mock import AsyncMock
+
+        from hamlet.simulation.narratives import EmergentNarratives
+
+        narratives = EmergentNarratives(db)
+        narratives._check_life_events = AsyncMock()
+        narratives._detect_narrative_arcs = AsyncMock()
+        narratives._check_event_resolutions = AsyncMock()
+
+        start = 100
+        await narratives.process_tick(start, 1, 6.0)
+        await narratives.process_tick(start + narratives.life_event_interval - 1, 1, 6.0)
+        narratives._check_life_events.assert_not_called()
+
+        await narratives.process_tick(start + narratives.life_event_interval, 1, 6.0)
+        narratives._check_life_events.assert_called_once()
+        narratives._detect_narrative_arcs.assert_not_called()
+
+    async def test_heavy_checks_never_share_a_tick(self, db: Session):
+        """Life event, arc, faction and plan checks are staggered onto separate ticks."""
+        from unittest.mock import AsyncMock
+
+        from hamlet.simulation.narratives import EmergentNarratives
+
+        narratives = EmergentNarratives(db)
+        runs: dict[int, list[str]] = {}
+        for name in (
+            "_check_life_events",
+            "_detect_narrative_arcs",
+            "_process_faction_dynamics",
+            "_check_plan_progress",
+        ):
+            mock = AsyncMock(side_effect=lambda *_, name=name: runs[tick].append(name))
+            setattr(narratives, name, mock)
+        narratives._check_event_resolutions = AsyncMock()
+
+        for tick in range(1, 241):
+            runs[tick] = []
+            await narratives.process_tick(tick, 1, 6.0)
+
+        assert all(len(names) <= 1 for names in runs.values())
+        assert {name for names in runs.values() for name in names} == {
+            "_check_life_events",
+            "_detect_narrative_arcs",
+            "_process_faction_dynamics",
+            "_check_plan_progress",
+        }
+
+    async def test_narrative_context_is_cached_per_tick(self, db: Session):
+        """Context is built once per agent per tick and rebuilt after the next tick."""
+        from unittest.mock import MagicMock
+
+        from hamlet.simulation.narratives import EmergentNarratives
+
+        narratives = EmergentNarratives(db)
+        agent_id = db.query(Agent).first().id
+        narratives.faction_manager.get_faction_contexts = MagicMock(
+            side_effect=lambda ids: dict.fromkeys(ids, "Faction")
+        )
+
+        assert narratives.get_agent_narrative_context(agent_id) == "Faction"
+        narratives.get_agent_narrative_context(agent_id)
+        assert narratives.faction_manager.get_faction_contexts.call_count == 1
+
+        await narratives.process_tick(1, 1, 6.0)
+        narratives.get_agent_narrative_context(agent_id)
+        assert narratives.faction_manager.get_faction_contexts.call_count == 2
+
+    def test_batched_narrative_contexts_match_single_lookups(self, db: Session, query_counter):
+        """Contexts for many agents take a fixed number of queries and match per-agent ones."""
+        from hamlet.simulation.narratives import EmergentNarratives
+
+        agents = db.query(Agent).all()
+        first, second = agents[0], agents[1]
+        FactionManager(db).create_faction(name="Lantern Guild", founder_id=first.id)
+        LifeEventGenerator(db)._create_event(LifeEventType.RIVALRY, first.id, second.id)
+        NarrativeArcDetector(db)._create_arc(ArcType.RIVALRY, second.id, first.id)
+        GoalPlanner(db)._create_plan(second, AmbitionType.WEALTH)
+        db.flush()
+        agent_ids = [a.id for a in agents]
+
+        query_counter.clear()
+        batched = EmergentNarratives(db).get_agent_narrative_contexts(agent_ids)
+        assert len(query_counter) <= 6
+
+        single = EmergentNarratives(db)
+        assert batched == {a: single.get_agent_narrative_context(a) for a in agent_ids}
+        assert "Lantern Guild" in batched[first.id]
+        assert f"rivalry with {second.name}" in batched[first.id]
+        assert "co-protagonist" in batched[first.id]
+        assert "long-term ambition" in batched[second.id]
+
+    async def test_resolutions_are_checked_periodically(self, db: Session):
+        """Event resolutions run on their own interval rather than every tick."""
+        from unittest.mock import AsyncMock
+
+        from hamlet.simulation.narratives import EmergentNarratives
+
+        narratives = EmergentNarratives(db)
+        narratives._check_event_resolutions = AsyncMock()
+
+        for tick in range(1, 1 + narratives.resolution_interval * 3):
+            await narratives.process_tick(tick, 1, 6.0)
+
+        assert narratives._check_event_resolutions.await_count == 2
+
+    def test_candidate_queries_filter_in_sql(self, db: Session):
+        """Only agents with room for a faction or without a plan are candidates."""
+        faction_manager = FactionManager(db)
+        planner = GoalPlanner(db)
+        agents = db.query(Agent).all()
+        busy, planner_agent = agents[0], agents[1]
+
+        for i in range(MAX_MEMBERSHIPS):
+            faction_manager.create_faction(name=f"Busy Guild {i}", founder_id=busy.id)
+        planner._create_plan(planner_agent, AmbitionType.WEALTH)
+        db.flush()
+
+        open_ids = {a.id for a in faction_manager.get_agents_open_to_factions()}
+        assert busy.id not in open_ids
+        assert planner_agent.id in open_ids
+
+        assert planner_agent.id not in {a.id for a in planner.get_agents_without_plans()}
+        assert [a.id for a in planner.get_agents_with_active_plans()] == [planner_agent.id]
@@ -207,6 +207,71 @@ class TestIdleBehaviors:
 
         assert tavern_behavior_found, "Tavern location should trigger tavern-related behaviors"
 
+    def test_only_chosen_behavior_content_is_generated(self):
+        """Content is generated only for the behavior that is selected."""
+        agent = create_test_agent(traits={}, hunger=8, name="Hungry Hal")
+        perception = create_test_perception()
+
+        with (
+            patch("hamlet.simulation.idle.random.random", return_value=0.5),
+            patch(
+                "hamlet.simulation.idle.random.choices",
+                side_effect=lambda options, weights, k: [options[-1]],
+            ),
+            patch("hamlet.simulation.idle._hunger_thought") as hunger_thought,
+        ):
+            behavior = get_idle_behavior(agent, perception)
+
+        assert behavior == IdleBehavior("action", "Hungry Hal stretches", 1)
+        hunger_thought.assert_not_called()
+
+    def test_location_kind_resolves_from_name(self):
+        """Location names map to their kind's behaviors; unknown places have none."""
+        from hamlet.simulation.idle import _location_idle
+
+        forge = _location_idle(create_test_perception(location_name="The Old Blacksmith"))
+        assert ("observation", "{name} watches the sparks fly") in forge
+        assert _location_idle(create_test_perception(location_name="Village Well")) == ()
+
+    @pytest.mark.parametrize(
+        "location_name,kind",
+        [
+            ("Garden Church", "church"),
+            ("Church Garden", "church"),
+            ("The Forest Inn", "inn"),
+            ("Tavern on the Square", "tavern"),
+            ("Square Tavern", "tavern"),
+        ],
+    )
+    def test_location_kind_prefers_earlier_listed_keyword(self, location_name, kind):
+        """A name with several keywords maps by keyword priority, not position."""
+        from hamlet.simulation.idle import _location_kind
+
+        assert _location_kind(location_name) == kind
+
+    def test_stranger_greeting_prefers_earlier_listed_location_keyword(self):
+        """A square tavern gets the tavern greeting, as the tavern keyword comes first."""
+        from hamlet.simulation.greetings import _STRANGER_TAVERN, _stranger_greeting
+
+        agent = create_test_agent(traits={"charm": 9}, name="Charming Charlie")
+        stranger = create_test_agent(traits={}, name="Stranger Sam", id="sam")
+        perception = create_test_perception(location_name="Market Square Tavern")
+
+        greeting = _stranger_greeting(agent, stranger, 9, perception, random.Random(1))
+
+        assert greeting in {t.format(name=agent.name) for t in _STRANGER_TAVERN}
+
+    def test_seeded_rng_makes_behavior_reproducible(self):
+        """Passing a seeded generator reproduces the same sequence of behaviors."""
+        agent = create_test_agent(traits={"curiosity": 9, "charm": 8}, hunger=8)
+        perception = create_test_perception(nearby_objects=["old book"], nearby_agents=["Bob"])
+
+        def run(seed):
+            rng = random.Random(seed)
+            return [get_idle_behavior(agent, perception, rng) for _ in range(20)]
+
+        assert run(7) == run(7)
+
     def test_sometimes_returns_none(self):
         """The idle behavior system should sometimes return None (10% chance)."""
         agent = create_test_agent(traits={})
@@ -253,6 +318,27 @@ class TestSpontaneousGreetings:
 
         assert warm_greeting_found, "Greeting a friend should be warm"
 
+    def test_friend_is_greeted_before_others(self):
+        """A friend is greeted ahead of rivals and strangers, wherever they are listed."""
+        friend = create_test_agent(traits={}, name="Friend Bob", id="bob")
+        rival = create_test_agent(traits={}, name="Rival Rick", id="rick")
+        stranger = create_test_agent(traits={}, name="Stranger Sam", id="sam")
+        agent = create_test_agent(
+            traits={"charm": 5},
+            name="Test Agent",
+            relationships=[
+                create_mock_relationship("bob", "friend", 7),
+                create_mock_relationship("rick", "rival", -7),
+            ],
+        )
+        perception = create_test_perception()
+        rng = random.Random(3)
+
+        for _ in range(20):
+            with patch.object(rng, "random", return_value=0.5):
+                greeting = generate_arrival_comment(agent, [stranger, rival, friend], perception, rng)
+            assert "Friend Bob" in greeting
+
     def test_greeting_rival_is_cold(self):
         """Greeting a rival should produce a cold acknowledgment."""
         rival = create_test_agent(traits={}, name="Rival Rick", id="rick")
@@ -7,7 +7,7 @@ executes agent actions, and records events.
 
 import pytest
 
-from hamlet.simulation.engine import SimulationEngine
+from hamlet.simulation.engine import RandomAction, SimulationEngine
 from hamlet.simulation.events import EventType, event_bus
 
 
@@ -147,3 +147,524 @@ class TestSimulationFlow:
         assert len(locations) >= 3, "Should have at least 3 seeded locations"
 
         engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_recorded_events_flushed_in_batch(self, isolated_db_session):
+        """Events recorded during a tick are inserted together on flush."""
+        from hamlet.db import Event
+
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        before = engine.world.db.query(Event).count()
+
+        engine._emit(EventType.ACTION, "Agnes baked bread", ["agnes"], "bakery")
+        engine._emit(EventType.DIALOGUE, "Bob greeted Agnes", ["bob"], "bakery")
+        assert engine.world.db.query(Event).count() == before, "Events should be queued"
+
+        engine._flush_events()
+
+        assert engine.world.db.query(Event).count() == before + 2
+        assert engine._pending_events == []
+
+        engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_tick_events_share_tick_timestamp(self, isolated_db_session):
+        """Every event streamed during a tick carries the tick's timestamp."""
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        await engine.tick()
+
+        history = event_bus.get_history()
+        assert history
+        assert {e.timestamp for e in history} == {engine._tick_timestamp}
+
+        engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_time_advance_committed_before_narratives(self, isolated_db_session):
+        """A narrative failure rolling back the session can't undo the tick's clock."""
+        from unittest.mock import patch
+
+        from hamlet.db import WorldState
+
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        seen = []
+
+        def process_tick(tick, *args):
+            db = engine.world.db
+            seen.append((tick, bool(db.new or db.dirty)))
+
+        with patch.object(engine.narratives, "process_tick", side_effect=process_tick):
+            await engine.tick()
+
+        (tick, pending), = seen
+        assert not pending, "World changes should be committed before the narrative pass"
+        assert engine.world.db.query(WorldState).one().current_tick == tick
+
+        engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_tick_events_committed_with_world_changes(self, isolated_db_session):
+        """Event rows are saved in the same commit as the changes they describe."""
+        from unittest.mock import patch
+
+        from hamlet.db import Event
+
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        before = engine.world.db.query(Event).count()
+        seen = []
+
+        def process_tick(*args):
+            db = engine.world.db
+            seen.append((list(engine._pending_events), bool(db.new or db.dirty)))
+
+        with patch.object(engine.narratives, "process_tick", side_effect=process_tick):
+            await engine.tick()
+
+        assert seen == [([], False)], "Events should be flushed and committed before narratives"
+        assert engine.world.db.query(Event).count() > before
+
+        engine.world.close()
+
+    def test_batched_perceptions_take_fixed_queries(self, isolated_db_session, query_counter):
+        """Perceptions for every agent and a snapshot don't query per agent or location."""
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        agents = engine.world.get_agents()
+
+        query_counter.clear()
+        perceptions = engine.world.get_agent_perceptions(agents)
+        assert len(query_counter) == 2
+
+        for agent in agents:
+            single = engine.world.get_agent_perception(agent)
+            assert perceptions[agent.id].location_name == single.location_name
+            assert sorted(perceptions[agent.id].nearby_agents) == sorted(single.nearby_agents)
+
+        query_counter.clear()
+        snapshot = engine.world.get_snapshot()
+        assert len(query_counter) == 3
+        assert sum(loc["agent_count"] for loc in snapshot.locations.values()) == len(agents)
+
+        engine.world.close()
+
+    def test_world_state_is_queried_once_per_session(self, world, query_counter):
+        """Repeated world-state reads reuse the loaded row until the session changes."""
+        query_counter.clear()
+        state = world.get_world_state()
+        world.is_daytime()
+        tick, _, _ = world.advance_time(commit=False)
+        assert world.get_world_state() is state
+        assert state.current_tick == tick
+        assert sum("FROM world_state" in s for s in query_counter) == 1
+
+        world.db.expunge(state)
+        assert world.get_world_state() is not state
+        assert sum("FROM world_state" in s for s in query_counter) == 2
+
+    @pytest.mark.asyncio
+    async def test_occupancy_index_matches_world_perception(self, isolated_db_session):
+        """Perception from the tick's occupancy index matches a fresh query, across moves."""
+        from collections import defaultdict
+
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        agents = engine.world.get_agents()
+        engine._occupants = defaultdict(list)
+        for agent in agents:
+            engine._occupants[agent.location_id].append(agent)
+
+        mover = agents[0]
+        destination = engine.world.get_location(mover.location_id).connections_list[0]
+        await engine._do_move(mover, destination)
+        engine.world.db.flush()  # The session doesn't autoflush; let the query see the move
+
+        for agent in agents:
+            indexed = engine._perceive(agent)
+            queried = engine.world.get_agent_perception(agent)
+            assert indexed.location_name == queried.location_name
+            assert sorted(indexed.nearby_agents) == sorted(queried.nearby_agents)
+            assert indexed.nearby_objects == queried.nearby_objects
+
+        engine.world.close()
+
+    def test_location_connections_parsed_once(self, isolated_db_session):
+        """Connections are parsed on first use and reused on later ticks."""
+        from unittest.mock import patch
+
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        location = engine.world.get_location("town_square")
+
+        assert engine._get_connections("town_square") == tuple(location.connections_list)
+
+        engine._location_cache.clear()  # As at the start of a new tick
+        with patch.object(engine.world, "get_location", side_effect=AssertionError):
+            assert engine._get_connections("town_square") == tuple(location.connections_list)
+
+        engine.world.close()
+
+    def test_unchanged_agents_decide_on_their_phase(self, isolated_db_session):
+        """Agents with unchanged needs skip decisions until their phase comes round."""
+        import zlib
+
+        from hamlet.config import settings
+
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        agent = engine.world.get_agents()[0]
+        interval = settings.agent_decision_interval
+        phase = zlib.crc32(agent.id.encode()) % interval
+        off_phase_tick = phase + 1
+
+        assert engine._agents_due([agent], off_phase_tick) == [agent]
+        assert engine._agents_due([agent], off_phase_tick) == []
+        assert engine._agents_due([agent], phase + interval) == [agent]
+
+        agent.hunger = int(agent.hunger) + 1.0
+        assert engine._agents_due([agent], off_phase_tick) == [agent]
+
+        engine.world.close()
+
+    def test_decision_phase_is_stable_across_processes(self):
+        """Schedules come from a fixed checksum, not the per-process string hash."""
+        from hamlet.simulation.engine import _decision_phase
+
+        assert [_decision_phase(a, 5) for a in ("agnes", "bob", "martha")] == [3, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_llm_tick_processes_agents_concurrently(self, isolated_db_session):
+        """LLM-driven ticks decide for every active agent without errors."""
+        from hamlet.llm.client import MockLLMClient, get_llm_client, set_llm_client
+
+        previous_client = get_llm_client()
+        mock_client = MockLLMClient(responses=["ACTION: wait"])
+        set_llm_client(mock_client)
+        try:
+            engine = SimulationEngine(tick_interval=1, use_llm=True)
+            errors_before = engine.health.error_count
+
+            await engine.tick()
+
+            assert mock_client.call_count > 0, "Active agents should consult the LLM"
+            assert engine.health.error_count == errors_before
+            assert engine.health.queue_depth == 0
+        finally:
+            set_llm_client(previous_client)
+            engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_llm_actions_committed_before_narratives(self, isolated_db_session):
+        """Actions executed without a per-action commit are saved before the narrative pass."""
+        from unittest.mock import patch
+
+        from hamlet.llm.client import MockLLMClient, get_llm_client, set_llm_client
+
+        previous_client = get_llm_client()
+        set_llm_client(MockLLMClient(responses=["ACTION: move town_square"]))
+        try:
+            engine = SimulationEngine(tick_interval=1, use_llm=True)
+            before = {a.id: a.location_id for a in engine.world.get_agents()}
+            seen = []
+
+            def process_tick(*args):
+                db = engine.world.db
+                seen.append(bool(db.new or db.dirty))
+
+            with patch.object(engine.narratives, "process_tick", side_effect=process_tick):
+                await engine.tick()
+
+            moved = [
+                a for a in engine.world.get_agents() if a.location_id != before[a.id]
+            ]
+            assert moved, "Some agent should have moved to the town square"
+            assert seen == [False], "Actions should be committed before the narrative pass"
+        finally:
+            set_llm_client(previous_client)
+            engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_llm_decisions_respect_concurrency_limit(self, isolated_db_session):
+        """No more LLM decisions run at once than the configured limit."""
+        import asyncio
+
+        engine = SimulationEngine(tick_interval=1, use_llm=True)
+        engine._llm_semaphore = asyncio.Semaphore(2)
+        in_flight = peak = 0
+
+        async def fake_decide(agent, world):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        engine._decide_action = fake_decide
+        agents = engine.world.get_agents()
+        await asyncio.gather(*(engine._decide(agent) for agent in agents))
+
+        assert len(agents) > 2
+        assert peak == 2
+
+        engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_decision_cache_keys_on_agent_situation(self, isolated_db_session):
+        """Cached LLM decisions are reused only for an identical situation."""
+        from hamlet.actions import Wait
+        from hamlet.llm.agent import DecisionCache
+
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        agent = engine.world.get_agents()[0]
+        perception = engine.world.get_agent_perception(agent)
+        cache = DecisionCache()
+
+        key = cache.make_key(agent, perception, 9.0)
+        action = Wait(agent.id)
+        cache.set(key, action)
+
+        assert cache.get(cache.make_key(agent, perception, 10.5)) is action
+        agent.hunger = (agent.hunger + 3) % 10
+        assert cache.get(cache.make_key(agent, perception, 9.0)) is None
+
+        engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_llm_decisions_are_not_cached(self, isolated_db_session):
+        """An API failure falls back to a random turn instead of caching a Wait."""
+        from hamlet.llm.client import LLMResponse, MockLLMClient, get_llm_client, set_llm_client
+
+        class FailingClient(MockLLMClient):
+            def complete(self, prompt, **kwargs):
+                self.call_count += 1
+                return LLMResponse(content="I'll wait and observe.", model="mock", error=True)
+
+        previous_client = get_llm_client()
+        failing = FailingClient()
+        set_llm_client(failing)
+        try:
+            engine = SimulationEngine(tick_interval=1, use_llm=True)
+            agent = next(a for a in engine.world.get_agents() if a.state != "sleeping")
+            errors_before = engine.health.error_count
+
+            await engine._process_agent_llm(agent)
+            await engine._prefetch_decisions()
+
+            assert failing.call_count > 1
+            assert len(engine.decision_cache) == 0
+            assert engine.health.error_count == errors_before + 1
+        finally:
+            set_llm_client(previous_client)
+            engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_execute_action_dispatches_by_type(self, isolated_db_session):
+        """Random actions dispatch to their handler; unknown types are ignored."""
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        agent = engine.world.get_agents()[0]
+
+        await engine._execute_action(agent, RandomAction("work", job="baking"))
+        assert engine._pending_events[-1]["summary"] == f"{agent.name} is busy baking"
+
+        pending = len(engine._pending_events)
+        await engine._execute_action(agent, RandomAction("juggle"))
+        assert len(engine._pending_events) == pending
+
+        engine.world.close()
+
+    def test_random_no_op_skips_candidate_building(self, isolated_db_session):
+        """The do-nothing roll happens before any candidate actions are built."""
+        from unittest.mock import patch
+
+        engine = SimulationEngine(tick_interval=1, use_llm=False)
+        agent = engine.world.get_agents()[0]
+        perception = engine.world.get_agent_perception(agent)
+
+        with (
+            patch.object(engine._rng, "random", return_value=0.1),
+            patch.object(engine._rng, "choice") as mock_choice,
+        ):
+            assert engine._choose_random_action(agent, perception) is None
+        mock_choice.assert_not_called()
+
+        engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_warms_decision_cache(self, isolated_db_session):
+        """Prefetching stores a decision for each awake agent in the cache."""
+        from hamlet.llm.client import MockLLMClient, get_llm_client, set_llm_client
+
+        previous_client = get_llm_client()
+        mock_client = MockLLMClient(responses=["ACTION: wait"])
+        set_llm_client(mock_client)
+        try:
+            engine = SimulationEngine(tick_interval=1, use_llm=True)
+            await engine._prefetch_decisions()
+            prefetched = mock_client.call_count
+
+            assert prefetched > 0, "Awake agents should be prefetched"
+            assert len(engine.decision_cache._cache) == prefetched
+        finally:
+            set_llm_client(previous_client)
+            engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skips_agents_not_due_next_tick(self, isolated_db_session):
+        """Only agents whose decision falls due next tick are prefetched."""
+        from hamlet.actions import Wait
+
+        engine = SimulationEngine(tick_interval=1, use_llm=True)
+        decided = []
+
+        async def fake_decide(agent, world):
+            decided.append(agent.id)
+            return Wait(agent.id)
+
+        engine._decide_action = fake_decide
+        awake = [a for a in engine.world.get_agents() if a.state != "sleeping"]
+        next_tick = engine.world.get_world_state().current_tick + 1
+        engine._agents_due(awake, next_tick - 1)  # Everyone decides now
+
+        await engine._prefetch_decisions()
+
+        expected = engine._agents_due(awake, next_tick, record=False)
+        assert sorted(decided) == sorted(a.id for a in expected)
+        assert len(decided) < len(awake)
+
+        engine.world.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_prefetch_does_not_delay_next_tick(self, isolated_db_session):
+        """The wait ends on the tick interval; unfinished prefetches are cancelled."""
+        import asyncio
+        import time
+
+        from hamlet.actions import Wait
+
+        engine = SimulationEngine(tick_interval=0.05, use_llm=True)
+
+        async def slow_decide(agent, world):
+            await asyncio.sleep(5)
+            return Wait(agent.id)
+
+        engine._decide_action = slow_decide
+
+        start = time.monotonic()
+        await engine._wait_for_next_tick()
+
+        assert time.monotonic() - start < 1
+        assert len(engine.decision_cache) == 0
+
+        engine.world.close()
+
+
+@pytest.mark.integration
+class TestWorldNeeds:
+    """Test per-tick agent needs and sleep updates."""
+
+    def test_tick_needs_follow_location_occupancy(self, world):
+        """Counting occupancy once gives the same result as querying per agent."""
+        agents = world.get_agents()
+        for agent in agents:
+            agent.location_id = "bakery" if agent.id == "agnes" else "town_square"
+            agent.state = "idle"
+            agent.social = 5.0
+        world.commit()
+
+        world.tick_agents(12.0, hours_passed=1.0)
+
+        socials = {a.id: a.social for a in agents}
+        assert socials["agnes"] == pytest.approx(4.8), "Alone at the bakery"
+        assert all(
+            social == pytest.approx(5.5) for agent_id, social in socials.items() if agent_id != "agnes"
+        ), "Together in the town square"
+
+    def test_tick_needs_match_single_agent_rules(self, world):
+        """Tick and single-agent updates agree for sleeping and awake agents."""
+        agents = world.get_agents()
+        for i, agent in enumerate(agents):
+            agent.state = "sleeping" if i % 2 else "idle"
+            agent.hunger, agent.energy, agent.social = 9.9, 0.1, 5.0
+        world.commit()
+
+        occupancy = {a.id: len(world.get_agents_at_location(a.location_id)) for a in agents}
+        expected = {}
+        for agent in agents:
+            before = (agent.hunger, agent.energy, agent.social)
+            world.update_agent_needs(agent, 0.5, occupancy[agent.id])
+            expected[agent.id] = (agent.hunger, agent.energy, agent.social)
+            agent.hunger, agent.energy, agent.social = before
+
+        world.tick_agents(12.0, hours_passed=0.5)
+
+        assert {a.id: (a.hunger, a.energy, a.social) for a in agents} == expected
+
+    def test_tick_agents_puts_agents_to_sleep_at_night(self, world):
+        """At night every agent goes to sleep and starts recovering energy."""
+        for agent in world.get_agents():
+            agent.state = "idle"
+            agent.energy = 5.0
+        world.commit()
+
+        woken, slept, active, agents = world.tick_agents(23.0, hours_passed=0.5)
+
+        assert woken == [] and active == []
+        assert slept == agents
+        assert all(a.state == "sleeping" and a.energy == pytest.approx(6.0) for a in agents)
+
+    def test_tick_agents_wakes_agents_in_the_morning(self, world):
+        """At 6am sleeping agents wake up and are active for the tick."""
+        for agent in world.get_agents():
+            agent.state = "sleeping"
+            agent.energy = 5.0
+        world.commit()
+
+        woken, slept, active, agents = world.tick_agents(6.0, hours_passed=0.5)
+
+        assert slept == []
+        assert woken == active == agents
+        assert all(a.state == "idle" and a.energy == pytest.approx(4.85) for a in agents)
+
+
+@pytest.mark.unit
+class TestAgentJsonFields:
+    """Test parsed JSON fields on the Agent model."""
+
+    def test_mood_dict_reparses_only_when_raw_value_changes(self):
+        """Repeated reads reuse one parse; writes through the setter are seen."""
+        import json
+        from unittest.mock import patch
+
+        from hamlet.db import Agent
+
+        agent = Agent(id="test", name="Test", mood='{"happiness": 5}')
+
+        with patch("hamlet.db.models.json.loads", wraps=json.loads) as loads:
+            assert agent.mood_dict == {"happiness": 5}
+            agent.mood_dict["happiness"] = 9  # Mutating a read doesn't touch the cache
+            assert agent.mood_dict == {"happiness": 5}
+            assert loads.call_count == 1
+
+            agent.mood_dict = {"happiness": 2}
+            assert agent.mood_dict == {"happiness": 2}
+            assert loads.call_count == 2
+
+    def test_poll_options_and_votes_reparse_only_when_raw_value_changes(self):
+        """Poll JSON fields share the parse cache, including raw column writes."""
+        import json
+        from unittest.mock import patch
+
+        from hamlet.db import Poll
+
+        poll = Poll(question="Q?", options='["Yes", "No"]', votes='{"0": 1}')
+
+        with patch("hamlet.db.models.json.loads", wraps=json.loads) as loads:
+            for _ in range(3):
+                assert poll.options_list == ["Yes", "No"]
+                assert poll.votes_dict == {"0": 1}
+            poll.options_list.append("Maybe")
+            assert poll.options_list == ["Yes", "No"]
+            assert loads.call_count == 2
+
+            votes = poll.votes_dict
+            votes["1"] = 4
+            poll.votes_dict = votes
+            poll.options = json.dumps(["A", "B"])
+            assert poll.votes_dict == {"0": 1, "1": 4}
+            assert poll.options_list == ["A", "B"]
+            assert loads.call_count == 4
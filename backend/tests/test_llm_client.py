@@ -0,0 +1,66 @@
+"""Tests for the LLM client and its response cache."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from hamlet.llm.client import LLMClient, LLMResponse, TTLCache
+
+
+@pytest.mark.unit
+class TestLLMClientCache:
+    """Unit tests for TTLCache and LLMClient response caching."""
+
+    def test_ttl_cache_evicts_least_recently_stored(self):
+        """A full cache drops its oldest entries; storing a key again renews it."""
+        cache = TTLCache(max_size=4, ttl_seconds=60)
+        for key in "abcd":
+            cache.set(key, key.upper())
+        cache.set("a", "A2")
+        cache.set("e", "E")
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in "acde"] == ["A2", "C", "D", "E"]
+
+    def test_llm_client_reuses_cached_response(self):
+        """A repeated prompt is answered from the response cache, even the first time."""
+        client = LLMClient(api_key="stub")
+        with patch.object(client, "_client") as api:
+            api.messages.create.return_value.content[0].text = "ACTION: wait"
+            api.messages.create.return_value.usage.input_tokens = 10
+            api.messages.create.return_value.usage.output_tokens = 2
+            first = client.complete("same prompt")
+            second = client.complete("same prompt")
+
+        assert api.messages.create.call_count == 1
+        assert second is first and second.cached
+
+    @pytest.mark.asyncio
+    async def test_async_completions_keep_cache_on_event_loop_thread(self):
+        """Concurrent requests only send the API call to worker threads."""
+        loop_thread = threading.get_ident()
+        request_threads, store_threads = set(), set()
+
+        class StubClient(LLMClient):
+            def _request(self, prompt, system, max_tokens, temperature):
+                request_threads.add(threading.get_ident())
+                return LLMResponse(content=f"echo {prompt}", model=self.model)
+
+        client = StubClient(api_key="stub")
+        original_set = client.cache.set
+
+        def recording_set(key, value):
+            store_threads.add(threading.get_ident())
+            original_set(key, value)
+
+        prompts = [f"prompt {i}" for i in range(8)]
+        with patch.object(client.cache, "set", side_effect=recording_set):
+            responses = await asyncio.gather(*(client.complete_async(p) for p in prompts))
+        again = await client.complete_async(prompts[0])
+
+        assert [r.content for r in responses] == [f"echo {p}" for p in prompts]
+        assert again.cached and len(client.cache) == len(prompts)
+        assert loop_thread not in request_threads
+        assert store_threads == {loop_thread}
@@ -7,7 +7,9 @@ import pytest
 from hamlet.db import Agent, Memory
 from hamlet.memory import (
     MemoryManager,
+    MemoryRecord,
     MemoryType,
+    add_memories,
     add_memory,
     build_memory_context,
     calculate_significance,
@@ -120,6 +122,25 @@ class TestMemoryManager:
         assert memories[1].content == "Second event"
         assert memories[2].content == "First event"
 
+    def test_add_memories_in_batch(self, agent, db):
+        """Can add several memories at once, in order, with defaults applied."""
+        MemoryManager(db).clear_working_memories(agent)
+
+        memories = add_memories(
+            [
+                MemoryRecord(agent.id, "Heard the bell", significance=3),
+                MemoryRecord(agent.id, "Met the mayor", event_type="dialogue"),
+                MemoryRecord(agent.id, "Bob is a baker", memory_type=MemoryType.LONGTERM),
+            ],
+            db,
+        )
+
+        assert [m.content for m in memories] == ["Heard the bell", "Met the mayor", "Bob is a baker"]
+        assert memories[0].significance == 3
+        assert memories[1].significance == calculate_significance("dialogue")
+        assert memories[2].compressed is True
+        assert len(get_working_memories(agent.id, db)) == 2
+
     def test_clear_working_memories(self, agent, db):
         """Can clear working memories."""
         manager = MemoryManager(db)
@@ -162,6 +162,25 @@ class TestPollResult:
         # First option with max votes wins
         assert result.winning_index == 0
 
+    def test_get_poll_result_ignores_unknown_options(self, db: Session, sample_poll: Poll):
+        """Votes for indices past the options are counted but not labelled."""
+        sample_poll.votes_dict = {"1": 0, "2": 4, "7": 1}
+        db.commit()
+
+        result = get_poll_result(sample_poll)
+
+        assert result.winning_index == 2
+        assert result.total_votes == 5
+        assert result.vote_counts == {sample_poll.options_list[1]: 0, sample_poll.options_list[2]: 4}
+
+    def test_get_poll_result_without_votes(self, db: Session, sample_poll: Poll):
+        """A poll nobody voted in reports the first option."""
+        result = get_poll_result(sample_poll)
+
+        assert result.winning_index == 0
+        assert result.total_votes == 0
+        assert result.vote_counts == {}
+
 
 class TestVoteMemoryCreation:
     """Tests for POLL-10: Memory creation when agents vote."""
@@ -219,6 +238,35 @@ class TestVoteMemoryCreation:
         assert "hesitantly" in memory.content
         assert memory.significance == 4  # Low confidence = less significant
 
+    @pytest.mark.parametrize(
+        ("confidence", "phrase", "significance"),
+        [
+            (0.3, "I voted for", 4),
+            (0.4, "I voted for", 5),
+            (0.5, "I confidently voted", 5),
+            (0.7, "I confidently voted", 6),
+            (0.8, "I strongly voted", 6),
+        ],
+    )
+    def test_create_vote_memory_confidence_bands(
+        self, db: Session, sample_agent: Agent, sample_poll: Poll,
+        confidence, phrase, significance,
+    ):
+        """A confidence on a band boundary belongs to the band above it."""
+        decision = VoteDecision(
+            agent_id=sample_agent.id,
+            poll_id=sample_poll.id,
+            option_index=0,
+            option_text="Yes, explore the cave",
+            confidence=confidence,
+        )
+
+        create_vote_memory(sample_agent, decision, sample_poll, db)
+
+        memory = db.query(Memory).filter(Memory.agent_id == sample_agent.id).one()
+        assert memory.content.startswith(phrase)
+        assert memory.significance == significance
+
     def test_on_agent_vote_sync_creates_memory(
         self, db: Session, sample_agent: Agent, sample_poll: Poll
     ):
@@ -276,7 +324,7 @@ class TestPollResultMemories:
             .all()
         )
         assert len(loser_memories) == 1
-        assert "I had voted for" in loser_memories[0].content
+        assert "I had voted for 'No, it's too dangerous'." in loser_memories[0].content
         assert loser_memories[0].significance == 6  # Still notable
 
 
@@ -398,6 +446,21 @@ class TestReactiveGoalCreation:
 class TestProcessAgentVotesWithMemories:
     """Tests for process_agent_votes with memory creation."""
 
+    def test_process_agent_votes_commits_votes_and_memories_once(
+        self, db: Session, sample_agents: list[Agent], sample_poll: Poll, monkeypatch
+    ):
+        """Votes are tallied and saved with every vote memory in a single commit."""
+        commits = []
+        commit = db.commit
+        monkeypatch.setattr(db, "commit", lambda: (commits.append(1), commit()))
+        memories_before = db.query(Memory).count()
+
+        decisions, _ = process_agent_votes(db, sample_poll, sample_agents, create_memories=True)
+
+        assert len(commits) == 1
+        assert sum(sample_poll.votes_dict.values()) == len(decisions) == len(sample_agents)
+        assert db.query(Memory).count() == memories_before + len(sample_agents)
+
     def test_process_agent_votes_creates_memories(
         self, db: Session, sample_agents: list[Agent], sample_poll: Poll
     ):
@@ -493,6 +556,27 @@ class TestOnPollClosed:
         ]
         assert any(gt in poll_goal_types for gt in goal_types)
 
+    @pytest.mark.asyncio
+    async def test_on_poll_closed_keeps_nothing_when_goals_fail(
+        self, db: Session, sample_agents: list[Agent], sample_poll: Poll, monkeypatch
+    ):
+        """Result memories are rolled back if creating the goals fails."""
+        from hamlet.simulation import poll_integration
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("goal creation failed")
+
+        monkeypatch.setattr(poll_integration, "create_poll_reactive_goals", fail)
+        sample_poll.votes_dict = {"0": 1}
+        sample_poll.status = "closed"
+        db.commit()
+        memories_before = db.query(Memory).count()
+
+        with pytest.raises(RuntimeError):
+            await on_poll_closed(sample_poll, db, {sample_agents[0].id: 0})
+
+        assert db.query(Memory).count() == memories_before
+
 
 class TestGoalTypeIntegration:
     """Tests for the new poll-related goal types."""
@@ -5,7 +5,7 @@ visible reactions when agents witness significant events.
 """
 
 import random
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -544,6 +544,23 @@ class TestReactionEdgeCases:
             if reaction:
                 assert "UniqueWitnessName" in reaction
 
+    @pytest.mark.parametrize("event_type", ["confront", "gossip", "help", "give", "dance"])
+    def test_every_option_is_reachable_and_named(self, event_type):
+        """Draws across the whole range pick each option, each naming the witness."""
+        from hamlet.simulation.reactions import _reaction_options
+
+        witness = create_witness(empathy=8, curiosity=8, discretion=2, name="Wren")
+        templates, cum_weights = _reaction_options(event_type, True, True, True, False)
+
+        seen = set()
+        for start in (0, *cum_weights[:-1]):
+            draw = start / cum_weights[-1]
+            with patch("hamlet.simulation.reactions.random.random", return_value=draw):
+                seen.add(generate_witness_reaction(witness, event_type, ["A", "B"], significance=7))
+
+        assert seen == {template.format(name="Wren") for template in templates}
+        assert all("Wren" in reaction and "{" not in reaction for reaction in seen)
+
     def test_missing_traits_use_defaults(self):
         """Missing traits in traits_dict should use default value of 5."""
         agent = MagicMock()
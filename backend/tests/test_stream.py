@@ -99,6 +99,84 @@ class TestEventBusIntegration:
         history = event_bus.get_history()
         assert len(history) >= initial_count + 5
 
+    @pytest.mark.asyncio
+    async def test_event_bus_history_is_bounded(self):
+        """History keeps only the most recent events up to its capacity."""
+        from hamlet.simulation.events import EventBus
+
+        bus = EventBus()
+        for i in range(bus._max_history + 5):
+            await bus.publish(
+                SimulationEvent(type=EventType.TICK, summary=f"Tick {i}", timestamp=i)
+            )
+
+        assert len(bus._history) == bus._max_history
+        assert [e.timestamp for e in bus.get_history(limit=2)] == [
+            bus._max_history + 3,
+            bus._max_history + 4,
+        ]
+        assert bus.get_history(limit=5000)[0].timestamp == 5
+
+    @pytest.mark.asyncio
+    async def test_event_bus_drops_unusable_subscribers(self):
+        """A subscriber whose queue raises is removed; others still receive events."""
+        from unittest.mock import MagicMock
+
+        from hamlet.simulation.events import EventBus
+
+        bus = EventBus()
+        broken = MagicMock()
+        broken.put_nowait.side_effect = RuntimeError("Event loop is closed")
+        bus._subscribers.append(broken)
+        healthy = bus.subscribe()
+
+        event = SimulationEvent(type=EventType.ACTION, summary="Still delivered", timestamp=1)
+        await bus.publish(event)
+
+        assert bus._subscribers == [healthy]
+        assert healthy.get_nowait() is event
+
+    @pytest.mark.asyncio
+    async def test_full_subscriber_queue_drops_oldest(self):
+        """A slow subscriber keeps the newest events once its queue fills."""
+        from hamlet.simulation.events import SUBSCRIBER_QUEUE_SIZE, EventBus
+
+        bus = EventBus()
+        queue = bus.subscribe()
+        events = [
+            SimulationEvent(type=EventType.ACTION, summary=f"Event {i}", timestamp=i)
+            for i in range(SUBSCRIBER_QUEUE_SIZE + 5)
+        ]
+
+        await bus.publish_many(events[:-1])
+        await bus.publish(events[-1])
+
+        assert queue.qsize() == SUBSCRIBER_QUEUE_SIZE
+        assert queue.get_nowait() is events[5]
+        assert bus._subscribers == [queue]
+
+    @pytest.mark.asyncio
+    async def test_event_bus_publish_many(self):
+        """Batched events reach subscribers and history in order."""
+        queue = event_bus.subscribe()
+
+        try:
+            events = [
+                SimulationEvent(
+                    type=EventType.ACTION,
+                    summary=f"Batched action {i}",
+                    timestamp=int(time.time()),
+                )
+                for i in range(3)
+            ]
+            await event_bus.publish_many(events)
+
+            received = [queue.get_nowait() for _ in range(3)]
+            assert [e.summary for e in received] == [e.summary for e in events]
+            assert event_bus.get_history(limit=3) == events
+        finally:
+            event_bus.unsubscribe(queue)
+
 
 @pytest.mark.unit
 class TestSSEFormat:
@@ -130,6 +208,17 @@ class TestSSEFormat:
         assert result["significance"] == 2
         assert result["data"]["action"] == "examine"
 
+    def test_event_without_actors_or_data_serializes_empty(self):
+        """Unset actors and data serialize as empty containers."""
+        from hamlet.api.stream import event_to_dict
+
+        event = SimulationEvent(type=EventType.TICK, summary="Tick", timestamp=1)
+
+        assert not hasattr(event, "__dict__")
+        result = event_to_dict(event)
+        assert result["actors"] == []
+        assert result["data"] == {}
+
     def test_event_serializes_to_json(self):
         """Event dict can be serialized to JSON."""
         from hamlet.api.stream import event_to_dict